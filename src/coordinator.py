@@ -0,0 +1,332 @@
+"""
+Distributed Tournament Coordinator
+
+総当たり戦の全試合を (青, 赤, シード) のジョブにして、TCP で接続してきたワーカーに配ります。
+ワーカーは tournament.run_match で試合を実行し、結果を返します。
+
+- ワーカーの接続が切れたり、リース時間内に結果が返らなかったジョブは別のワーカーに配り直します
+- 結果はジャーナル（JSON Lines）に追記するので、中断しても同じコマンドで続きから再開できます
+- 同じシード・同じプレイヤーなら結果は同じなので、配り直しや再開で結果は変わりません
+
+実行方法:
+    cd src
+    # コーディネーター（このマシンでワーカーを4つ起動する場合）
+    uv run python coordinator.py serve --port 5555 --local-workers 4 --journal league.jsonl
+    # 別のマシンからワーカーとして参加する場合
+    uv run python coordinator.py work --host 192.168.0.10 --port 5555
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import socket
+import socketserver
+import threading
+import time
+from collections import deque
+from itertools import combinations
+
+import tournament
+from tcg.players import PlayerSpec, discover_players
+from tcg.standings import Standings
+
+LEASE_SECONDS = 600  # ジョブを配ってから結果が返るまでの上限（秒）。超えたら配り直す
+WAIT_SECONDS = 1.0  # 配れるジョブがないとき、ワーカーに次の問い合わせまで待たせる時間
+
+
+def build_jobs(players, games_per_pair: int, seed: int) -> list[dict]:
+    """
+    総当たり戦のジョブ一覧を作る（同じ引数なら常に同じ一覧）
+
+    各カードは陣営を入れ替えながら games_per_pair 試合。ジョブの id は青・赤・シードから決まる。
+    """
+    names = [PlayerSpec.of(player).name for player in players]
+    jobs = []
+    for i, j in combinations(range(len(players)), 2):
+        for game in range(1, games_per_pair + 1):
+            blue, red = (i, j) if game % 2 else (j, i)
+            match_seed = tournament.match_seed(names[blue], names[red], (game + 1) // 2, seed)
+            jobs.append(
+                {
+                    "id": f"{names[blue]}|{names[red]}|{match_seed}",
+                    "blue": tournament.player_ref(players[blue]),
+                    "red": tournament.player_ref(players[red]),
+                    "blue_name": names[blue],
+                    "red_name": names[red],
+                    "seed": match_seed,
+                }
+            )
+    return jobs
+
+
+class Coordinator:
+    """
+    ジョブの貸し出し（リース）と結果の回収を管理する
+
+    journal を指定すると、結果を1件ずつ追記し、起動時に読み込んで完了済みのジョブを飛ばす。
+    """
+
+    def __init__(self, jobs: list[dict], journal: str | None = None, lease: float = LEASE_SECONDS):
+        self.jobs = {job["id"]: job for job in jobs}
+        self.lease_seconds = lease
+        self.results = {}  # job id -> result
+        self.leases = {}  # job id -> (期限, ワーカー名)
+        self.lock = threading.Lock()
+        self.finished = threading.Event()
+        self.journal = None
+        if journal is not None:
+            self._load_journal(journal)
+            self.journal = open(journal, "a", encoding="utf-8")
+        self.queue = deque(job_id for job_id in self.jobs if job_id not in self.results)
+        if not self.queue:
+            self.finished.set()
+
+    def _load_journal(self, path: str):
+        if not os.path.exists(path):
+            return
+        end = 0  # 最後に読めた行の終わり
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # 書き込み途中で止まった最後の行
+                if not line.endswith(b"\n"):
+                    break
+                end += len(line)
+                if record["id"] in self.jobs:
+                    self.results[record["id"]] = record["result"]
+        if end < os.path.getsize(path):
+            # 書きかけの行を消しておかないと、次の結果がその後ろに続いて読めなくなる
+            os.truncate(path, end)
+        print(f"ジャーナルから {len(self.results)}/{len(self.jobs)} 試合の結果を読み込みました")
+
+    def _expire(self, now: float):
+        for job_id, (deadline, worker) in list(self.leases.items()):
+            if deadline < now:
+                print(f"  リース切れ: {job_id}（{worker}）→ 配り直し")
+                del self.leases[job_id]
+                self.queue.appendleft(job_id)
+
+    def lease(self, worker: str) -> dict | None:
+        """次のジョブを貸し出す（今は配れるものがなければ None）"""
+        with self.lock:
+            self._expire(time.monotonic())
+            while self.queue:
+                job_id = self.queue.popleft()
+                if job_id in self.results:
+                    continue
+                self.leases[job_id] = (time.monotonic() + self.lease_seconds, worker)
+                return self.jobs[job_id]
+            return None
+
+    def complete(self, job_id: str, result: dict):
+        """結果を受け取る（配り直したジョブの2つ目以降の結果は捨てる）"""
+        with self.lock:
+            self.leases.pop(job_id, None)
+            if job_id in self.results or job_id not in self.jobs:
+                return
+            self.results[job_id] = result
+            if self.journal is not None:
+                self.journal.write(json.dumps({"id": job_id, "result": result}) + "\n")
+                self.journal.flush()
+                os.fsync(self.journal.fileno())
+            job = self.jobs[job_id]
+            print(
+                f"  [{len(self.results)}/{len(self.jobs)}] {job['blue_name']} vs "
+                f"{job['red_name']}: {result['winner']} Win (Steps: {result['steps']})"
+            )
+            if len(self.results) == len(self.jobs):
+                self.finished.set()
+
+    def release(self, worker: str):
+        """接続が切れたワーカーが借りていたジョブをすぐに配り直す"""
+        with self.lock:
+            for job_id, (_, holder) in list(self.leases.items()):
+                if holder == worker:
+                    print(f"  ワーカー切断: {job_id}（{worker}）→ 配り直し")
+                    del self.leases[job_id]
+                    self.queue.appendleft(job_id)
+
+    def close(self):
+        if self.journal is not None:
+            self.journal.close()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """1本の接続 = 1ワーカー。1行1メッセージの JSON でやり取りする"""
+
+    def handle(self):
+        coordinator = self.server.coordinator
+        worker = f"{self.client_address[0]}:{self.client_address[1]}"
+        try:
+            for line in self.rfile:
+                message = json.loads(line)
+                if message["type"] == "result":
+                    coordinator.complete(message["id"], message["result"])
+                    reply = {"type": "ok"}
+                elif coordinator.finished.is_set():
+                    reply = {"type": "done"}
+                else:
+                    job = coordinator.lease(worker)
+                    if job is None:
+                        reply = {"type": "wait", "seconds": WAIT_SECONDS}
+                    else:
+                        reply = {"type": "job", "job": job}
+                self.wfile.write((json.dumps(reply) + "\n").encode())
+        except (ConnectionError, json.JSONDecodeError):
+            pass
+        finally:
+            coordinator.release(worker)
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def run_worker(host: str, port: int, retries: int = 30):
+    """コーディネーターからジョブを受け取って試合を実行し続ける"""
+    for attempt in range(retries):
+        try:
+            sock = socket.create_connection((host, port))
+            break
+        except OSError:
+            if attempt == retries - 1:
+                raise
+            time.sleep(1)
+
+    players = {}
+    warm = tournament.WarmPlayers()  # reset() を持つプレイヤーとエンジンは試合をまたいで使い回す
+    with sock, sock.makefile("rw", encoding="utf-8") as stream:
+
+        def request(message: dict) -> dict:
+            stream.write(json.dumps(message) + "\n")
+            stream.flush()
+            line = stream.readline()
+            if not line:
+                raise ConnectionError("コーディネーターとの接続が切れました")
+            return json.loads(line)
+
+        match_id = 0
+        try:
+            while True:
+                reply = request({"type": "get"})
+                if reply["type"] == "done":
+                    return
+                if reply["type"] == "wait":
+                    time.sleep(reply["seconds"])
+                    continue
+                job = reply["job"]
+                for ref in (job["blue"], job["red"]):
+                    if ref not in players:
+                        players[ref] = tournament.load_player(ref)
+                match_id += 1
+                blue, red = warm.pair(players[job["blue"]], players[job["red"]])
+                result = tournament.run_match(
+                    blue, red, match_id, window=False, seed=job["seed"], warm=warm
+                )
+                request({"type": "result", "id": job["id"], "result": result})
+        finally:
+            warm.close()
+
+
+def print_standings(coordinator: Coordinator):
+    """総当たり戦の順位表を表示する"""
+    standings = Standings()
+    for job_id, result in coordinator.results.items():
+        job = coordinator.jobs[job_id]
+        standings.record(job["blue_name"], job["red_name"], result)
+
+    rankings = sorted(standings.rows(), key=lambda x: (x["score"], x["wins"]), reverse=True)
+    print("\n" + "=" * 70)
+    print("トーナメント結果")
+    print("=" * 70)
+    print(f"\n{'順位':<4} {'プレイヤー名':<20} {'スコア':<6} {'勝':<4} {'分':<4} {'敗':<4}")
+    print("-" * 70)
+    for rank, player in enumerate(rankings, 1):
+        print(
+            f"{rank:<4} {player['name']:<20} {player['score']:<6} "
+            f"{player['wins']:<4} {player['draws']:<4} {player['losses']:<4}"
+        )
+    print(f"\n総試合数: {standings.matches}試合")
+
+
+def serve(
+    port: int,
+    local_workers: int,
+    journal: str | None,
+    games_per_pair: int,
+    seed: int,
+    host: str = "127.0.0.1",
+):
+    """コーディネーターを起動し、全試合の結果が揃うまで待つ"""
+    players = discover_players()
+    jobs = build_jobs(players, games_per_pair, seed)
+    coordinator = Coordinator(jobs, journal)
+    print(f"プレイヤー: {len(players)}人  ジョブ: {len(jobs)}試合（残り {len(coordinator.queue)}）")
+
+    server = _Server((host, port), _Handler)
+    server.coordinator = coordinator
+    port = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"ワーカーの接続を待っています: {host}:{port}")
+
+    workers = [
+        multiprocessing.Process(target=run_worker, args=("127.0.0.1", port))
+        for _ in range(local_workers)
+    ]
+    for process in workers:
+        process.start()
+    try:
+        coordinator.finished.wait()
+    except KeyboardInterrupt:
+        print(f"\n中断しました（{len(coordinator.results)}/{len(jobs)} 試合完了）")
+        if journal is not None:
+            print("同じコマンドで再実行すると続きから再開します")
+        raise SystemExit(1) from None
+    finally:
+        for process in workers:
+            process.join(timeout=WAIT_SECONDS * 5)
+            if process.is_alive():
+                process.terminate()
+        server.shutdown()
+        server.server_close()
+        coordinator.close()
+    print_standings(coordinator)
+    return coordinator
+
+
+def main():
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description="分散トーナメントのコーディネーター / ワーカー")
+    sub = parser.add_subparsers(dest="mode", required=True)
+
+    p = sub.add_parser("serve", help="ジョブを配るコーディネーターを起動")
+    p.add_argument(
+        "--host", default="127.0.0.1", help="待ち受けるアドレス（他ホストからは 0.0.0.0）"
+    )
+    p.add_argument(
+        "--port", type=int, default=5555, help="待ち受けるポート（0 なら空いているもの）"
+    )
+    p.add_argument("--local-workers", type=int, default=0, help="このマシンで起動するワーカー数")
+    p.add_argument("--journal", default=None, help="結果を追記するジャーナル（再開用）")
+    p.add_argument(
+        "--games", type=int, default=tournament.MATCHES_PER_PAIR, help="各カードの試合数"
+    )
+    p.add_argument("--seed", type=int, default=0, help="トーナメントのシード")
+
+    p = sub.add_parser("work", help="ワーカーとして試合を実行")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=5555)
+
+    args = parser.parse_args()
+    if args.mode == "serve":
+        serve(args.port, args.local_workers, args.journal, args.games, args.seed, args.host)
+    else:
+        run_worker(args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
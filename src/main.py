@@ -11,7 +11,11 @@ if __name__ == "__main__":
     # デフォルト: ウィンドウ表示あり
     Game(ClaudePlayer(), RandomPlayer()).run()
 
-    # ウィンドウ表示なし（高速実行）の場合:
-    #Game(ClaudePlayer(), RandomPlayer(), window=False).run()
+    # 描画はそのままで対戦を最速で進める場合:
+    # Game(ClaudePlayer(), RandomPlayer(), steps_per_second=None).run()
+
+    # ウィンドウ表示なし（高速実行）の場合は pygame を使わない Engine を使う:
+    # from tcg.engine import Engine
+    # Engine(ClaudePlayer(), RandomPlayer()).run_headless()
 
     pygame.quit()
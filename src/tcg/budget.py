@@ -0,0 +1,172 @@
+"""Per-move time budgets for controllers.
+
+:class:`TimedController` wraps any controller and runs its ``update`` in a
+worker thread or a separate process. A call that does not answer within the
+deadline counts as the no-op command ``(0, 0, 0)``, so one slow bot cannot
+stall the match, and the latency of every call is recorded, including the full
+time of calls that overran.
+"""
+
+import math
+import multiprocessing
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+
+from .controller import Controller
+
+NOOP = (0, 0, 0)
+
+
+def _detach(info):
+    """Copy the views in ``info`` into plain tuples the engine will not change."""
+    team, state, moving_pawns, spawning_pawns, done = info
+    return [team, tuple(map(tuple, state)), tuple(moving_pawns), tuple(spawning_pawns), done]
+
+
+def _serve(controller, conn):
+    """Worker process loop: answer ``(seq, info)`` requests until ``None`` arrives."""
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        seq, info = message
+        if seq in ("seed", "reset"):
+            getattr(controller, seq)(*info)
+            continue
+        start = time.perf_counter()
+        try:
+            command = controller.update(info)
+        except Exception as exc:  # exceptions may not pickle; send a description
+            command = RuntimeError(f"{type(exc).__name__}: {exc}")
+        conn.send((seq, command, time.perf_counter() - start))
+    controller.close()
+
+
+class TimedController(Controller):
+    """Run ``controller.update`` with a deadline of ``deadline`` seconds per call.
+
+    ``isolation`` is ``"thread"`` (cheap, shares the interpreter) or
+    ``"process"`` (the bot runs in its own process and receives a pickled copy
+    of ``info``). A bot that overruns keeps thinking in the background; until
+    it finishes, further steps are answered with the no-op without asking it.
+    ``seed`` and ``reset`` run after it, so the bot never runs two calls at once.
+    """
+
+    def __init__(self, controller: Controller, deadline: float, isolation: str = "thread"):
+        if isolation not in ("thread", "process"):
+            raise ValueError(f"unknown isolation: {isolation}")
+        self.controller = controller
+        self.deadline = deadline
+        self.isolation = isolation
+        self.update_interval = controller.update_interval
+        self.update_events = controller.update_events
+        self.update_threshold = controller.update_threshold
+        self.name = controller.team_name()
+
+        self.latencies = []  # seconds per call; overruns are added once they finish
+        self.missed = 0  # steps answered with the no-op because of the deadline
+        self._late = None  # thread: running future; process: sequence number awaited
+
+        if isolation == "thread":
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.name)
+        else:
+            context = multiprocessing.get_context()
+            self._conn, child = context.Pipe()
+            self._process = context.Process(target=_serve, args=(controller, child), daemon=True)
+            self._process.start()
+            child.close()
+            self._seq = 0
+
+    def team_name(self) -> str:
+        return self.name
+
+    def seed(self, seed):
+        self._call("seed", seed)
+
+    def reset(self, side: int, seed):
+        self._call("reset", side, seed)
+
+    def _call(self, method: str, *args):
+        """Call ``method`` on the bot after any overrunning ``update`` has finished."""
+        if self.isolation == "thread":
+            # The single worker thread runs calls in order, so this queues behind a late
+            # update instead of racing it, and the next update queues behind this.
+            self._executor.submit(getattr(self.controller, method), *args)
+        else:
+            self._conn.send((method, args))
+
+    def update(self, info) -> tuple[int, int, int]:
+        if self.isolation == "thread":
+            return self._update_thread(_detach(info))
+        return self._update_process(_detach(info))
+
+    def _update_thread(self, info):
+        if self._late is not None:
+            if not self._late.done():
+                self.missed += 1
+                return NOOP
+            self._late = None
+
+        start = time.perf_counter()
+        future = self._executor.submit(self.controller.update, info)
+        try:
+            command = future.result(timeout=self.deadline)
+        except FutureTimeout:
+            self._late = future
+            future.add_done_callback(lambda _: self.latencies.append(time.perf_counter() - start))
+            self.missed += 1
+            return NOOP
+        self.latencies.append(time.perf_counter() - start)
+        return command
+
+    def _update_process(self, info):
+        conn = self._conn
+        if self._late is not None:
+            while self._late is not None and conn.poll():
+                seq, _, seconds = conn.recv()
+                if seq == self._late:
+                    self.latencies.append(seconds)
+                    self._late = None
+            if self._late is not None:
+                self.missed += 1
+                return NOOP
+
+        self._seq += 1
+        start = time.perf_counter()
+        conn.send((self._seq, info))
+        if not conn.poll(self.deadline):
+            self._late = self._seq
+            self.missed += 1
+            return NOOP
+        _, command, _ = conn.recv()
+        if isinstance(command, BaseException):
+            raise command
+        self.latencies.append(time.perf_counter() - start)
+        return command
+
+    def latency_percentiles(self, percentiles=(50, 90, 99)) -> dict:
+        """Nearest-rank latency percentiles in seconds (``None`` before the first call)."""
+        data = sorted(self.latencies)
+        if not data:
+            return {p: None for p in percentiles}
+        return {p: data[max(0, math.ceil(p / 100 * len(data)) - 1)] for p in percentiles}
+
+    def close(self):
+        """Stop the worker thread or process.
+
+        The wrapped controller belongs to the caller and stays open, except in
+        process isolation, where the copy in the worker process is closed.
+        """
+        if self.isolation == "thread":
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            return
+        if self._process.is_alive():
+            try:
+                self._conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self._process.join(timeout=self.deadline + 1)
+            if self._process.is_alive():
+                self._process.terminate()
+        self._conn.close()
@@ -1,5 +1,7 @@
 """Game configuration and constants."""
 
+import math
+
 # Window settings
 HEIGHT, WIDTH = 780, 1000
 
@@ -97,10 +99,88 @@ A_fortress_set = [
     (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),  # 11
 ]
 
+# Initial fortress layout: team, kind, level, pawn_number, upgrade_time, to_set
+initial_state = [
+    [0, 0, 1, 10, -1, [1, 3, 4]],
+    [2, 0, 2, 20, -1, [0, 2, 4]],
+    [0, 0, 1, 10, -1, [1, 4, 5]],
+    [0, 0, 2, 20, -1, [0, 4, 6, 7]],
+    [0, 1, 3, 30, -1, [0, 1, 2, 3, 5, 6, 7, 8]],
+    [0, 0, 2, 20, -1, [2, 4, 7, 8]],
+    [0, 0, 2, 20, -1, [3, 4, 7, 9]],
+    [0, 1, 3, 30, -1, [3, 4, 5, 6, 8, 9, 10, 11]],
+    [0, 0, 2, 20, -1, [4, 5, 7, 11]],
+    [0, 0, 1, 10, -1, [6, 7, 10]],
+    [1, 0, 2, 20, -1, [7, 9, 11]],
+    [0, 0, 1, 10, -1, [7, 8, 10]],
+]
+
 # Fortress limits and cooldowns
 fortress_limit = [10, 10, 20, 30, 40, 50]
 fortress_cool = [[60, 60, 54, 48, 42, 35], [90, 90, 81, 72, 63, 54]]
 
+# Pawn speed in pixels per step, by kind (0: fast, 1: strong)
+pawn_speed = [1.5, 1]
+
+
+# A pawn arrives once it is within this distance of the target's centre
+arrival_radius = 45
+
+
+def arrival_steps(kind, from_, to, x, y) -> int:
+    """Moves a pawn starting at ``(x, y)`` on ``from_ -> to`` makes until it is within reach.
+
+    The pawn moves ``pawn_speed[kind]`` along ``A_coordinate[from_][to]`` each
+    step and lands on the first move that ends within ``arrival_radius`` of
+    ``to``; that is the smallest ``n >= 1`` with ``|p + n*v|**2 <= R**2``,
+    found from the roots of the quadratic and checked against its neighbours.
+    """
+    dx, dy = A_coordinate[from_][to]
+    vx, vy = dx * pawn_speed[kind], dy * pawn_speed[kind]
+    px, py = x - pos_fortress[to][0], y - pos_fortress[to][1]
+    r2 = arrival_radius**2
+
+    def inside(n):
+        return (px + n * vx) ** 2 + (py + n * vy) ** 2 <= r2
+
+    a = vx * vx + vy * vy
+    b = 2 * (px * vx + py * vy)
+    c = px * px + py * py - r2
+    n = max(1, math.ceil((-b - math.sqrt(max(0.0, b * b - 4 * a * c))) / (2 * a)))
+    while n > 1 and inside(n - 1):
+        n -= 1
+    while not inside(n):
+        n += 1
+    return n
+
+
+def _travel_steps(kind, from_, to):
+    dx, dy = A_coordinate[from_][to]
+    x = pos_fortress[from_][0] + dx * 42
+    y = pos_fortress[from_][1] + dy * 42
+    return arrival_steps(kind, from_, to, x, y)
+
+
+# Distance between the centres of connected fortresses (0 if not connected)
+edge_distance = [
+    [
+        math.dist(pos_fortress[i], pos_fortress[j]) if A_coordinate[i][j] != 0 else 0
+        for j in range(n_fortress)
+    ]
+    for i in range(n_fortress)
+]
+
+# travel_steps[kind][from_][to]: steps from departure to arrival for a pawn leaving from the
+# middle of the spawn point (0 if not connected). Pawns spread up to 5px sideways, which can
+# change this by a step; the engine uses arrival_steps() with each pawn's own start.
+travel_steps = [
+    [
+        [_travel_steps(kind, i, j) if A_coordinate[i][j] != 0 else 0 for j in range(n_fortress)]
+        for i in range(n_fortress)
+    ]
+    for kind in range(2)
+]
+
 # Swap numbers for perspective
 swap_number_l = [11, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1, 0]
 swap_number_d = {i: swap_number_l[i] for i in range(len(swap_number_l))}
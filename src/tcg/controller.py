@@ -1,8 +1,55 @@
+import random
+
+
+def derive_seed(seed: int, team: int) -> str:
+    """Seed of the stream a match with ``seed`` hands to the controller of ``team``.
+
+    String seeds are hashed by ``random.Random``, so the derived streams never
+    coincide with the engine's own ``Random(seed)``.
+    """
+    return f"{seed}/{team}"
+
+
 class Controller:
+    # The engine asks for a command every update_interval steps, and also on
+    # the first step after any of update_events (see tcg.engine.EVENTS) has
+    # happened. Steps in between count as the no-op command (0, 0, 0).
+    update_interval = 1
+    update_events = ()
+    # Pawn count that fires the "threshold" event when one of our fortresses reaches it
+    update_threshold = 10
+    # Random stream for the controller's own choices. Engines replace it through seed()
+    # with a stream derived from the match seed; until then it is the global generator.
+    rng = random
+
+    def seed(self, seed):
+        """Use a fresh ``random.Random(seed)`` as ``self.rng``."""
+        self.rng = random.Random(seed)
+
+    def reset(self, side: int, seed):
+        """Get ready for a new match as ``side`` (1: Blue, bottom; 2: Red, top).
+
+        The engine calls this before every match. Players that override it
+        (and call ``super().reset(side, seed)``) clear their per-match state
+        here, keeping expensive set-up such as tables or models; tournament
+        workers then reuse one instance for many matches instead of building
+        a new one each time.
+        """
+        self.seed(seed)
+
+    def close(self):
+        """Release resources held by the player; called once it will not play again."""
+
     def team_name(self) -> str:
         raise NotImplementedError
 
     def update(self, info) -> tuple[int, int, int]:
+        """Return ``(command, subject, to)`` for the board in ``info``.
+
+        ``info`` is ``[team, state, moving_pawns, spawning_pawns, done]`` as
+        read-only views over the engine's data. They are only valid during
+        this call; copy anything (e.g. ``list(info[2])``) that must outlive it.
+        """
         raise NotImplementedError
 
 
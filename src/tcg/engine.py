@@ -0,0 +1,456 @@
+"""Rendering-free simulation core for Fortress Conquest.
+
+This module never imports pygame, so headless matches (tournaments, search,
+training) only pay for the rules themselves.
+"""
+
+import math
+import random
+import struct
+import time
+
+from .config import (
+    STEPLIMIT,
+    A_coordinate,
+    arrival_steps,
+    fortress_cool,
+    fortress_limit,
+    initial_state,
+    n_fortress,
+    pos_fortress,
+    swap_number_l,
+)
+from .controller import Controller, derive_seed
+from .pawns import PawnArray, PawnList
+from .utils import flip_board_view, read_only_view
+
+# Flat snapshot encoding: header, 12 fortresses, then moving and spawning pawns.
+_HEADER = struct.Struct("<IIIB")  # step, n_moving, n_spawning, flags
+_FORTRESS = "BBBdh"  # team, kind, level, pawn_number, upgrade_time
+_MOVING = "BBBBddI"  # team, kind, from_, to, x, y, arrival step
+_SPAWNING = "BBdBBdd"  # team, kind, pawn_number, from_, to, x, y
+_FORTRESSES = struct.Struct("<" + _FORTRESS * n_fortress)
+
+# Events a controller can ask to be woken up for through Controller.update_events:
+# a fortress changed owner, an upgrade finished, the enemy dispatched pawns, or
+# one of its fortresses reached Controller.update_threshold pawns.
+EVENTS = ("capture", "upgrade", "dispatch", "threshold")
+
+
+class Engine:
+    def __init__(
+        self,
+        controller1: Controller,
+        controller2: Controller,
+        vectorized_pawns: bool = False,
+        decision_interval: int = 1,
+        seed: int | None = None,
+        seed_controllers: bool = True,
+    ):
+        # Controllers are asked for a command every decision_interval steps;
+        # the steps in between are no-ops (0, 0, 0). Each controller can thin
+        # this further with its update_interval and update_events.
+        self.decision_interval = decision_interval
+        self.vectorized_pawns = vectorized_pawns
+        self.reset(seed, controller1, controller2, seed_controllers)
+
+    def reset(
+        self,
+        seed: int | None = None,
+        controller1: Controller | None = None,
+        controller2: Controller | None = None,
+        seed_controllers: bool = True,
+    ):
+        """Start a new match on this engine.
+
+        The previous match is discarded; the controllers are kept unless new
+        ones are given. Each controller hears about the new match through
+        ``Controller.reset(side, seed)`` (skipped with ``seed_controllers=False``),
+        so one engine and one set of warm controllers can play many matches.
+        """
+        if controller1 is not None:
+            self.controller1 = controller1  # bottom
+        if controller2 is not None:
+            self.controller2 = controller2  # up
+        controller1, controller2 = self.controller1, self.controller2
+
+        # All of the match's randomness (pawn spread) comes from this stream. Without a
+        # seed one is drawn from the global generator, so random.seed() still applies.
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        if seed_controllers:
+            # Each side gets its own stream, so (players, seed, side) fixes the match.
+            controller1.reset(1, derive_seed(self.seed, 1))
+            controller2.reset(2, derive_seed(self.seed, 2))
+        self.recorder = None  # a tcg.replay.Replay being recorded, if any
+
+        self.team1 = controller1.team_name()
+        self.team2 = controller2.team_name()
+
+        self.listens = {}
+        for team, controller in ((1, controller1), (2, controller2)):
+            unknown = set(controller.update_events) - set(EVENTS)
+            if unknown:
+                raise ValueError(f"unknown update events: {sorted(unknown)}")
+            self.listens[team] = frozenset(controller.update_events)
+        # pending[team]: an event the controller listens for has fired since its last update
+        self.pending = {1: False, 2: False}
+        self.above = {1: 0, 2: 0}  # bitmask of fortresses at or above the threshold
+
+        self.seconds = 0
+
+        # team, kind, level, pawn_number, upgrade_time, to_set
+        self.state = [row[:5] + [list(row[5])] for row in initial_state]
+
+        self.step = 0
+
+        self.spawning_pawns = []  # team, kind, pawn_number, from_, to, [pos]
+        # team, kind, from_, to, pos; each pawn's arrival step is kept alongside
+        self.moving_pawns = PawnArray() if self.vectorized_pawns else PawnList()
+
+        self.score = 0
+
+        self.win_team = "Both"
+        self.Red_fortress = 1
+        self.Blue_fortress = 1
+
+        self.isGameOver = False
+        self.isGameOver_loop = False
+        self.Overed = False
+        self.done = False
+
+    def pawn_born(self):
+        """Pawns regenerate over time."""
+        for i in range(12):
+            team, kind, level, pawn_number, _, to_set = self.state[i]
+            if self.step % fortress_cool[kind][level] == 0:
+                if pawn_number < fortress_limit[level]:
+                    self.state[i][3] += 1
+                    if self.state[i][3] > fortress_limit[level]:
+                        self.state[i][3] = fortress_limit[level]
+
+    def pawn_over(self):
+        """Remove pawns exceeding fortress limit."""
+        for i in range(12):
+            team, kind, level, pawn_number, _, to_set = self.state[i]
+            if self.step % 40 == 0:
+                if pawn_number > fortress_limit[level]:
+                    self.state[i][3] -= 1
+
+    def deliver(self, team, from_, to):
+        """Create spawn point for pawns."""
+        if team == self.state[from_][0] and self.state[from_][3] >= 2:
+            if A_coordinate[from_][to] == 0:
+                print(f"team: {team}")
+                return 0
+            pos = [
+                pos_fortress[from_][0] + A_coordinate[from_][to][0] * 42,
+                pos_fortress[from_][1] + A_coordinate[from_][to][1] * 42,
+            ]
+            self.spawning_pawns.append(
+                [team, self.state[from_][1], self.state[from_][3] // 2, from_, to, pos]
+            )
+            self.state[from_][3] -= self.state[from_][3] // 2
+            self.notify("dispatch", 3 - team)
+            return True
+        return False
+
+    def upgrade(self, team, subject):
+        """Start fortress upgrade."""
+        if (
+            team == self.state[subject][0]
+            and self.state[subject][3] >= fortress_limit[self.state[subject][2]] // 2
+            and self.state[subject][4] == -1
+            and 1 <= self.state[subject][2] <= 4
+        ):
+            self.state[subject][4] = 200
+            self.state[subject][3] -= fortress_limit[self.state[subject][2]] // 2
+            return True
+        return False
+
+    def check_upgrade(self):
+        """Check if fortress upgrade is complete."""
+        for i in range(n_fortress):
+            if self.state[i][4] > 0:
+                self.state[i][4] -= 1
+            elif self.state[i][4] == 0:
+                self.state[i][4] = -1
+                self.state[i][2] += 1
+                self.notify("upgrade", 1, 2)
+
+    def pawn_departure(self):
+        """Pawns depart from spawn points."""
+        rand = self.rng.random  # a local is cheaper per pawn than the global random.random
+        for i in range(len(self.spawning_pawns)):
+            team, kind, pawn_number, from_, to, pos = self.spawning_pawns[i]
+            if self.step % 7 == 0 and kind == 0 and pawn_number > 0:
+                r = rand() - 0.5
+                pos = [
+                    pos[0] + A_coordinate[from_][to][1] * r * 10,
+                    pos[1] + A_coordinate[from_][to][0] * -1 * r * 10,
+                ]
+                self.moving_pawns.append(
+                    [team, kind, from_, to, pos], self.step + arrival_steps(kind, from_, to, *pos)
+                )
+                self.spawning_pawns[i][2] -= 1
+
+            elif self.step % 10 == 0 and kind == 1 and pawn_number > 0:
+                r = rand() - 0.5
+                pos = [
+                    pos[0] + A_coordinate[from_][to][1] * r * 10,
+                    pos[1] + A_coordinate[from_][to][0] * -1 * r * 10,
+                ]
+                self.moving_pawns.append(
+                    [team, kind, from_, to, pos], self.step + arrival_steps(kind, from_, to, *pos)
+                )
+                self.spawning_pawns[i][2] -= 1
+
+        for i in range(len(self.spawning_pawns)):
+            if self.spawning_pawns[i][2] <= 0:
+                self.spawning_pawns.remove(self.spawning_pawns[i])
+                break
+
+    def pawn_move(self):
+        """Move pawns towards target fortress."""
+        self.moving_pawns.move()
+        for team, kind, to in self.moving_pawns.pop_arrived(self.step):
+            self.pawn_hit(team, kind, to)
+
+    def pawn_hit(self, team, kind, to):
+        """Apply one arriving pawn to the target fortress."""
+        if team == self.state[to][0]:
+            self.state[to][3] += 1
+        elif team != self.state[to][0]:
+            if kind == 0:
+                self.state[to][3] -= 0.65
+            elif kind == 1:
+                self.state[to][3] -= 0.95
+
+            if self.state[to][3] < 0:
+                self.state[to] = [team, self.state[to][1], 1, 0, -1, self.state[to][5]]
+                self.notify("capture", 1, 2)
+
+    def order(self, team, command, subject, to) -> bool:
+        """Process player command; return whether it changed the board."""
+        if command == 1:
+            acted = self.deliver(team, subject, to)
+        elif command == 2:
+            acted = self.upgrade(team, subject)
+        else:
+            return False
+        if acted and self.recorder is not None:
+            # Replays pack subject and to into 4 bits each. Upgrades ignore ``to``, so any
+            # value a bot returned there is recorded as 0; negative indexes wrap as they did.
+            to = to % n_fortress if command == 1 else 0
+            self.recorder.record(self.step, team, command, subject % n_fortress, to)
+        return acted
+
+    def notify(self, event, *teams):
+        """Wake the controllers of ``teams`` that listen for ``event``."""
+        for team in teams:
+            if event in self.listens[team]:
+                self.pending[team] = True
+
+    def threshold_mask(self, team) -> int:
+        """Fortresses of ``team`` holding at least its controller's threshold."""
+        controller = self.controller1 if team == 1 else self.controller2
+        mask = 0
+        for i in range(n_fortress):
+            if self.state[i][0] == team and self.state[i][3] >= controller.update_threshold:
+                mask |= 1 << i
+        return mask
+
+    def check_thresholds(self):
+        """Fire "threshold" for fortresses that reached the threshold since the last check."""
+        for team in (1, 2):
+            if "threshold" in self.listens[team]:
+                mask = self.threshold_mask(team)
+                if mask & ~self.above[team]:
+                    self.pending[team] = True
+                self.above[team] = mask
+
+    def wants_update(self, team) -> bool:
+        """Whether the controller of ``team`` is asked for a command on this step."""
+        controller = self.controller1 if team == 1 else self.controller2
+        return self.pending[team] or self.step % controller.update_interval == 0
+
+    def next_decision(self) -> int:
+        """First step, not before the current one, on which a controller is asked."""
+        step = self.step
+        first = step + (-step) % self.decision_interval
+        if self.pending[1] or self.pending[2]:
+            return first
+        nearest = STEPLIMIT
+        for controller in (self.controller1, self.controller2):
+            period = math.lcm(self.decision_interval, controller.update_interval)
+            nearest = min(nearest, step + (-step) % period)
+        return nearest
+
+    def CheckGameOver(self):
+        """Check if game is over."""
+        self.Red_fortress = 0
+        self.Blue_fortress = 0
+        for i in range(n_fortress):
+            if self.state[i][0] == 1:
+                self.Blue_fortress += 1
+            elif self.state[i][0] == 2:
+                self.Red_fortress += 1
+
+        if self.Red_fortress == self.Blue_fortress:
+            self.win_team = "Both"
+        elif self.Red_fortress > self.Blue_fortress:
+            self.win_team = "Red"
+        else:
+            self.win_team = "Blue"
+
+        if self.Red_fortress == 0:
+            return True
+        if self.Blue_fortress == 0:
+            return True
+
+        return False
+
+    def snapshot(self) -> tuple[bytes, tuple]:
+        """Capture the simulation state as ``(flat bytes, RNG state)``.
+
+        The bytes hold the fortress table, the moving and spawning pawns, the
+        step counter and the end-of-game flags; controllers are not included.
+        """
+        values = []
+        for team, kind, level, pawn_number, upgrade_time, _ in self.state:
+            values += (team, kind, level, pawn_number, upgrade_time)
+        moving = zip(self.moving_pawns, self.moving_pawns.arrivals)
+        for (team, kind, from_, to, pos), arrive in moving:
+            values += (team, kind, from_, to, pos[0], pos[1], arrive)
+        for team, kind, pawn_number, from_, to, pos in self.spawning_pawns:
+            values += (team, kind, pawn_number, from_, to, pos[0], pos[1])
+
+        n_moving = len(self.moving_pawns)
+        n_spawning = len(self.spawning_pawns)
+        flags = (
+            self.done
+            | self.isGameOver_loop << 1
+            | self.isGameOver << 2
+            | self.pending[1] << 3
+            | self.pending[2] << 4
+        )
+        body = struct.pack(
+            "<" + _FORTRESS * n_fortress + _MOVING * n_moving + _SPAWNING * n_spawning, *values
+        )
+        header = _HEADER.pack(self.step, n_moving, n_spawning, flags)
+        return header + body, self.rng.getstate()
+
+    def restore(self, snapshot: tuple[bytes, tuple]):
+        """Return to a state captured by :meth:`snapshot`."""
+        data, rng_state = snapshot
+        self.step, n_moving, n_spawning, flags = _HEADER.unpack_from(data)
+        offset = _HEADER.size
+        fortresses = _FORTRESSES.unpack_from(data, offset)
+        offset += _FORTRESSES.size
+        self.state = [
+            list(fortresses[5 * i : 5 * i + 5]) + [list(initial_state[i][5])]
+            for i in range(n_fortress)
+        ]
+
+        moving = struct.unpack_from("<" + _MOVING * n_moving, data, offset)
+        offset += struct.calcsize("<" + _MOVING * n_moving)
+        self.moving_pawns.clear()
+        for i in range(0, len(moving), 7):
+            team, kind, from_, to, x, y, arrive = moving[i : i + 7]
+            self.moving_pawns.append([team, kind, from_, to, [x, y]], arrive)
+
+        spawning = struct.unpack_from("<" + _SPAWNING * n_spawning, data, offset)
+        self.spawning_pawns.clear()
+        for i in range(0, len(spawning), 7):
+            team, kind, pawn_number, from_, to, x, y = spawning[i : i + 7]
+            self.spawning_pawns.append([team, kind, pawn_number, from_, to, [x, y]])
+
+        self.done = bool(flags & 1)
+        self.isGameOver_loop = bool(flags & 2)
+        self.isGameOver = bool(flags & 4)
+        self.pending = {1: bool(flags & 8), 2: bool(flags & 16)}
+        self.above = {team: self.threshold_mask(team) for team in (1, 2)}
+        self.Overed = False
+        self.CheckGameOver()
+        self.rng.setstate(rng_state)
+
+    def clone(self) -> "Engine":
+        """Headless copy of the current state that shares this engine's controllers."""
+        other = Engine(
+            self.controller1,
+            self.controller2,
+            vectorized_pawns=isinstance(self.moving_pawns, PawnArray),
+            decision_interval=self.decision_interval,
+            seed=self.seed,
+            seed_controllers=False,
+        )
+        other.restore(self.snapshot())
+        return other
+
+    def finished(self) -> bool:
+        """Whether the match has reached its end condition."""
+        return self.isGameOver or self.step >= STEPLIMIT or self.isGameOver_loop or self.done
+
+    def advance(self):
+        """Simulate one step, querying both controllers."""
+        if self.recorder is not None and self.step >= self.recorder.next_keyframe:
+            self.recorder.keyframe(self.step, self.snapshot())
+        self.pawn_move()
+        self.done = self.CheckGameOver() or self.step == STEPLIMIT - 1
+
+        if self.step % self.decision_interval == 0:
+            # Both controllers get read-only views over the same engine data.
+            command_1 = subject_1 = to_1 = command_2 = subject_2 = to_2 = 0
+            if self.wants_update(1):
+                # Controller1 gets team 1 perspective (bottom player)
+                info_1 = read_only_view(
+                    [1, self.state, self.moving_pawns, self.spawning_pawns, self.done]
+                )
+                command_1, subject_1, to_1 = self.controller1.update(info_1)
+                self.pending[1] = False
+            if self.wants_update(2):
+                # Controller2 gets flipped perspective (always sees themselves as team 1)
+                info_2 = flip_board_view(
+                    [2, self.state, self.moving_pawns, self.spawning_pawns, self.done]
+                )
+                command_2, subject_2, to_2 = self.controller2.update(info_2)
+                self.pending[2] = False
+
+                # Convert controller2's commands back to original perspective
+                subject_2 = swap_number_l[subject_2]
+                to_2 = swap_number_l[to_2]
+
+            self.order(1, command_1, subject_1, to_1)
+            self.order(2, command_2, subject_2, to_2)
+
+        self.pawn_departure()
+        self.pawn_born()
+        if self.step % 40 == 0:
+            self.pawn_over()
+
+        self.check_upgrade()
+        if self.listens[1] or self.listens[2]:
+            self.check_thresholds()
+
+        self.step += 1
+
+        if self.CheckGameOver():
+            self.isGameOver_loop = True
+
+    def finish(self):
+        """Mark the match as over and report the result."""
+        self.Overed = True
+        self.isGameOver = True
+        print(
+            f"step: {self.step}  time: {int(self.seconds)}  //  "
+            f"{self.win_team} Win!!   B: {self.Blue_fortress}   "
+            f"R: {self.Red_fortress}   loop"
+        )
+
+    def run_headless(self):
+        """Run the match to the end as fast as possible."""
+        start = time.perf_counter()
+        while not self.finished():
+            self.advance()
+        self.seconds = int(time.perf_counter() - start)
+        self.finish()
@@ -0,0 +1,186 @@
+"""Event-driven engine that jumps over steps in which nothing can happen.
+
+Between controller decisions most steps are predictable: births follow the
+``fortress_cool`` periods, upgrades count down 200 steps and pawns fly in a
+straight line at a constant speed. :class:`EventEngine` computes when each of
+these next does something and only simulates those steps, giving the same
+results as :class:`tcg.engine.Engine` step for step.
+"""
+
+import heapq
+import time
+
+import numpy as np
+
+from .config import STEPLIMIT, A_coordinate, fortress_cool, fortress_limit, pawn_speed
+from .engine import Engine
+from .pawns import PawnList
+
+
+class Flights:
+    """Pawns in flight, indexed and iterated like the engine's ``moving_pawns``.
+
+    Each pawn's whole trajectory up to its arrival step is computed when it
+    departs, by the same repeated float additions ``Engine.pawn_move``
+    performs, so positions are bit-identical to the step engine. Positions are
+    only looked up when a controller or caller reads a pawn.
+    """
+
+    def __init__(self, engine: "EventEngine"):
+        self.engine = engine
+        self.active = {}  # seq -> (team, kind, from_, to, depart_step, xs, ys)
+        self.schedule = []  # heap of (arrive_step, seq)
+        self.seq = 0
+        self._ordered = None
+
+    def __len__(self) -> int:
+        return len(self.active)
+
+    def _flights(self) -> list:
+        if self._ordered is None:
+            self._ordered = list(self.active.values())
+        return self._ordered
+
+    def _row(self, flight) -> tuple:
+        team, kind, from_, to, depart, xs, ys = flight
+        k = min(self.engine.moved_through - depart, len(xs) - 1)
+        return (team, kind, from_, to, (float(xs[k]), float(ys[k])))
+
+    def __getitem__(self, i: int) -> tuple:
+        return self._row(self._flights()[i])
+
+    @property
+    def arrivals(self) -> list:
+        return [depart + len(xs) - 1 for _, _, _, _, depart, xs, _ in self._flights()]
+
+    def __iter__(self):
+        for flight in self._flights():
+            yield self._row(flight)
+
+    def append(self, pawn, arrive: int):
+        """Launch a ``[team, kind, from_, to, [x, y]]`` pawn that lands on step ``arrive``."""
+        team, kind, from_, to, pos = pawn
+        vx = A_coordinate[from_][to][0] * pawn_speed[kind]
+        vy = A_coordinate[from_][to][1] * pawn_speed[kind]
+        depart = self.engine.moved_through
+        n = arrive - depart
+        xs = np.add.accumulate(np.r_[pos[0], np.full(n, vx)])
+        ys = np.add.accumulate(np.r_[pos[1], np.full(n, vy)])
+
+        seq = self.seq
+        self.seq += 1
+        self.active[seq] = (team, kind, from_, to, depart, xs, ys)
+        self._ordered = None
+        heapq.heappush(self.schedule, (arrive, seq))
+
+    def next_arrival(self) -> int:
+        return self.schedule[0][0] if self.schedule else STEPLIMIT
+
+    def pop_arrived(self, step: int):
+        """Yield ``(team, kind, to)`` for pawns arriving on ``step`` in departure order."""
+        while self.schedule and self.schedule[0][0] == step:
+            _, seq = heapq.heappop(self.schedule)
+            team, kind, from_, to, *_ = self.active.pop(seq)
+            self._ordered = None
+            yield team, kind, to
+
+
+class EventEngine(Engine):
+    """Engine that only simulates steps where an event or a decision is due.
+
+    Controllers are consulted every ``decision_interval`` steps and on their
+    own ``update_interval`` and ``update_events``, as in ``Engine``; the
+    sparser the decisions, the more steps are skipped.
+    """
+
+    def __init__(
+        self,
+        controller1,
+        controller2,
+        decision_interval: int = 1,
+        seed: int | None = None,
+        seed_controllers: bool = True,
+    ):
+        super().__init__(
+            controller1,
+            controller2,
+            decision_interval=decision_interval,
+            seed=seed,
+            seed_controllers=seed_controllers,
+        )
+
+    def reset(self, seed=None, controller1=None, controller2=None, seed_controllers=True):
+        super().reset(seed, controller1, controller2, seed_controllers)
+        self.moving_pawns = Flights(self)
+        self.moved_through = 0  # last step whose pawn_move has been applied
+
+    def restore(self, snapshot):
+        # Pawns restart their flights from the saved positions; the remaining
+        # float additions are the same ones the original flight would do.
+        self.moving_pawns = PawnList()
+        super().restore(snapshot)
+        pawns = self.moving_pawns
+        self.moving_pawns = Flights(self)
+        self.moved_through = self.step - 1
+        for pawn, arrive in zip(pawns, pawns.arrivals):
+            self.moving_pawns.append(pawn, arrive)
+
+    def clone(self) -> "EventEngine":
+        other = EventEngine(
+            self.controller1, self.controller2, self.decision_interval, self.seed, False
+        )
+        other.restore(self.snapshot())
+        return other
+
+    def pawn_move(self):
+        """Resolve the arrivals scheduled for this step."""
+        self.moved_through = self.step
+        for team, kind, to in self.moving_pawns.pop_arrived(self.step):
+            self.pawn_hit(team, kind, to)
+
+    def next_event(self) -> int:
+        """First step, not before the current one, on which anything can change."""
+        step = self.step
+        candidates = [
+            STEPLIMIT - 1,
+            self.moving_pawns.next_arrival(),
+            self.next_decision(),
+        ]
+        for team, kind, pawn_number, *_ in self.spawning_pawns:
+            if pawn_number > 0:
+                candidates.append(step + (-step) % (7 if kind == 0 else 10))
+            else:
+                # Finished spawn points are dropped one per step.
+                candidates.append(step)
+        over = False
+        for team, kind, level, pawn_number, upgrade_time, _ in self.state:
+            if pawn_number < fortress_limit[level]:
+                candidates.append(step + (-step) % fortress_cool[kind][level])
+            elif pawn_number > fortress_limit[level]:
+                over = True
+            if upgrade_time >= 0:
+                candidates.append(step + upgrade_time)
+        if over:
+            candidates.append(step + (-step) % 40)
+        return min(candidates)
+
+    def skip_idle(self):
+        """Jump to the next step on which something happens."""
+        target = self.next_event()
+        idle = target - self.step
+        if idle <= 0:
+            return
+        for fortress in self.state:
+            if fortress[4] > 0:
+                fortress[4] -= idle
+        self.step = target
+        self.moved_through = target - 1  # pawns are where the skipped moves would put them
+
+    def run_headless(self):
+        """Run the match to the end, simulating only eventful steps."""
+        start = time.perf_counter()
+        while not self.finished():
+            self.skip_idle()
+            self.advance()
+        self.seconds = int(time.perf_counter() - start)
+        self.finish()
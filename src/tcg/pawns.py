@@ -0,0 +1,224 @@
+"""Storage for moving pawns: a plain list and a NumPy-backed array.
+
+Both stores keep each pawn's arrival step (from ``config.arrival_steps``) next
+to its row, so arrivals are found by comparing integers rather than by
+measuring distances to the target fortress.
+"""
+
+import numpy as np
+
+from . import config
+from .config import A_coordinate, n_fortress, pos_fortress
+
+# Per-edge unit direction, zero where two fortresses are not connected.
+edge_direction = np.zeros((n_fortress, n_fortress, 2))
+for _i in range(n_fortress):
+    for _j in range(n_fortress):
+        if A_coordinate[_i][_j] != 0:
+            edge_direction[_i, _j] = A_coordinate[_i][_j]
+
+pawn_speed = np.array(config.pawn_speed, dtype=float)  # kind 0 pawns are fast, kind 1 strong
+fortress_xy = np.array(pos_fortress, dtype=float)
+
+
+def arrival_steps(kind, from_, to, x, y) -> np.ndarray:
+    """:func:`tcg.config.arrival_steps` for arrays of pawns."""
+    velocity = edge_direction[from_, to] * pawn_speed[kind][:, None]
+    vx, vy = velocity[:, 0], velocity[:, 1]
+    px, py = x - fortress_xy[to, 0], y - fortress_xy[to, 1]
+    r2 = config.arrival_radius**2
+
+    def inside(n):
+        return (px + n * vx) ** 2 + (py + n * vy) ** 2 <= r2
+
+    a = vx * vx + vy * vy
+    b = 2 * (px * vx + py * vy)
+    c = px * px + py * py - r2
+    root = (-b - np.sqrt(np.maximum(0.0, b * b - 4 * a * c))) / (2 * a)
+    n = np.maximum(1, np.ceil(root)).astype(np.int64)
+    n -= (n > 1) & inside(n - 1)
+    n += ~inside(n)
+    return n
+
+
+_COLUMNS = ("team", "kind", "from_", "to", "x", "y", "vx", "vy", "arrive")
+
+
+class PawnList(list):
+    """The engine's default ``moving_pawns``: a list of ``(team, kind, from_, to, (x, y))``.
+
+    Rows are immutable tuples, replaced as pawns move, so they can be handed
+    to controllers as they are. ``arrivals`` holds the arrival step of each
+    row, in the same order.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.arrivals = []
+
+    def append(self, pawn, arrive: int):
+        """Add a pawn that reaches its target on step ``arrive``."""
+        team, kind, from_, to, pos = pawn
+        super().append((team, kind, from_, to, tuple(pos)))
+        self.arrivals.append(arrive)
+
+    def clear(self):
+        super().clear()
+        self.arrivals.clear()
+
+    def move(self):
+        """Advance every pawn one step along its edge."""
+        speed = config.pawn_speed
+        self[:] = [
+            (
+                team,
+                kind,
+                from_,
+                to,
+                (
+                    pos[0] + A_coordinate[from_][to][0] * speed[kind],
+                    pos[1] + A_coordinate[from_][to][1] * speed[kind],
+                ),
+            )
+            for team, kind, from_, to, pos in self
+        ]
+
+    def pop_arrived(self, step: int) -> list:
+        """Remove the pawns due on ``step`` and return their ``(team, kind, to)``."""
+        arrivals = self.arrivals
+        if not arrivals or min(arrivals) > step:
+            return []
+        hits = [(p[0], p[1], p[3]) for p, a in zip(self, arrivals) if a <= step]
+        kept = [(p, a) for p, a in zip(self, arrivals) if a > step]
+        self[:] = [p for p, _ in kept]
+        arrivals[:] = [a for _, a in kept]
+        return hits
+
+
+class PawnArray:
+    """Moving pawns as a struct of arrays (team, kind, from_, to, x, y, arrive).
+
+    Behaves like the ``moving_pawns`` list of the engine: ``len``, indexing and
+    iteration yield ``(team, kind, from_, to, (x, y))`` rows built on demand,
+    so controllers and renderers keep working unchanged.
+    """
+
+    def __init__(self, capacity: int = 256):
+        self.n = 0
+        self.team = np.zeros(capacity, dtype=np.int8)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.from_ = np.zeros(capacity, dtype=np.int8)
+        self.to = np.zeros(capacity, dtype=np.int8)
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.arrive = np.zeros(capacity, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, i: int) -> tuple:
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("pawn index out of range")
+        return (
+            int(self.team[i]),
+            int(self.kind[i]),
+            int(self.from_[i]),
+            int(self.to[i]),
+            (float(self.x[i]), float(self.y[i])),
+        )
+
+    def __iter__(self):
+        n = self.n
+        columns = zip(
+            self.team[:n].tolist(),
+            self.kind[:n].tolist(),
+            self.from_[:n].tolist(),
+            self.to[:n].tolist(),
+            self.x[:n].tolist(),
+            self.y[:n].tolist(),
+        )
+        for team, kind, from_, to, x, y in columns:
+            yield (team, kind, from_, to, (x, y))
+
+    @property
+    def arrivals(self) -> list:
+        return self.arrive[: self.n].tolist()
+
+    def columns(self) -> dict:
+        """Read-only array views of the live pawns, keyed by column name.
+
+        The views share memory with the store, so they are free to take and
+        follow later moves, but writing to them raises ``ValueError``.
+        """
+        views = {}
+        for name in ("team", "kind", "from_", "to", "x", "y", "arrive"):
+            view = getattr(self, name)[: self.n]
+            view.flags.writeable = False
+            views[name] = view
+        return views
+
+    def _grow(self):
+        capacity = 2 * len(self.x)
+        for name in _COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: self.n] = old[: self.n]
+            setattr(self, name, new)
+
+    def append(self, pawn, arrive: int):
+        """Add a ``[team, kind, from_, to, [x, y]]`` pawn that arrives on step ``arrive``."""
+        team, kind, from_, to, pos = pawn
+        if self.n == len(self.x):
+            self._grow()
+        i = self.n
+        self.team[i] = team
+        self.kind[i] = kind
+        self.from_[i] = from_
+        self.to[i] = to
+        self.x[i], self.y[i] = pos
+        self.vx[i], self.vy[i] = edge_direction[from_, to] * pawn_speed[kind]
+        self.arrive[i] = arrive
+        self.n += 1
+
+    def clear(self):
+        self.n = 0
+
+    def move(self):
+        """Advance every pawn one step along its edge."""
+        n = self.n
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+
+    def pop_arrived(self, step: int) -> list:
+        """Remove the pawns due on ``step`` and return their ``(team, kind, to)``."""
+        n = self.n
+        if n == 0:
+            return []
+        arrived = np.flatnonzero(self.arrive[:n] <= step)
+        if len(arrived) == 0:
+            return []
+        hits = list(
+            zip(
+                self.team[arrived].tolist(),
+                self.kind[arrived].tolist(),
+                self.to[arrived].tolist(),
+            )
+        )
+        self.discard(arrived)
+        return hits
+
+    def discard(self, indices: np.ndarray):
+        """Remove the given pawns in one compaction, keeping the order of the rest."""
+        if len(indices) == 0:
+            return
+        keep = np.ones(self.n, dtype=bool)
+        keep[indices] = False
+        m = int(keep.sum())
+        for name in _COLUMNS:
+            arr = getattr(self, name)
+            arr[:m] = arr[: self.n][keep]
+        self.n = m
@@ -1,8 +1,10 @@
 """
 AI Players Module
 
-This module automatically discovers and imports all player classes
-from Python files in this directory.
+This module discovers all player classes from Python files in this directory.
+Discovery reads the sources instead of importing them, so listing players is
+cheap even when some of them load large models at import time; each player is
+imported the first time it is actually used.
 
 To add a new player:
 1. Create a new file (e.g., player_yourname.py)
@@ -11,44 +13,259 @@ To add a new player:
 4. Your player will be automatically discovered
 """
 
+import ast
 import importlib
+import importlib.util
 import inspect
+import time
 from pathlib import Path
 
 from ..controller import Controller
 
+_PLAYERS_DIR = Path(__file__).parent
+_CONTROLLER = ("tcg.controller", "Controller")
 
-def discover_players() -> list[type[Controller]]:
+
+class PlayerSpec:
+    """A discovered player class, imported on first use.
+
+    Calling the spec builds a new controller, like calling the class itself.
+    ``name`` is the team name: read from the source when ``team_name()`` just
+    returns a string literal, otherwise taken from one instance built on first
+    access. Import and construction times are accumulated for reporting.
     """
-    Automatically discover all Controller subclasses in this directory.
 
-    Supports both single-file players (player_*.py) and directory-based players (player_*/).
+    def __init__(self, module: str, qualname: str, name: str | None = None, player_class=None):
+        self.module = module
+        self.qualname = qualname
+        self._name = name
+        self._class = player_class
+        self.import_seconds = 0.0
+        self.construct_seconds = 0.0
+        self.constructed = 0
+
+    @classmethod
+    def of(cls, player) -> "PlayerSpec":
+        """``player`` itself if it is a spec, else a spec for an already imported class."""
+        if isinstance(player, PlayerSpec):
+            return player
+        return cls(player.__module__, player.__qualname__, player_class=player)
+
+    @classmethod
+    def from_ref(cls, ref: str) -> "PlayerSpec":
+        """Spec for a ``"module:qualname"`` string as returned by :attr:`ref`."""
+        module, qualname = ref.split(":")
+        return cls(module, qualname)
+
+    @property
+    def ref(self) -> str:
+        return f"{self.module}:{self.qualname}"
+
+    @property
+    def loaded(self) -> bool:
+        return self._class is not None
+
+    def load(self) -> type[Controller]:
+        """Import the player class (once)."""
+        if self._class is None:
+            start = time.perf_counter()
+            obj = importlib.import_module(self.module)
+            for part in self.qualname.split("."):
+                obj = getattr(obj, part)
+            self.import_seconds += time.perf_counter() - start
+            self._class = obj
+        return self._class
+
+    def __call__(self) -> Controller:
+        player_class = self.load()
+        start = time.perf_counter()
+        player = player_class()
+        self.construct_seconds += time.perf_counter() - start
+        self.constructed += 1
+        return player
+
+    @property
+    def reusable(self) -> bool:
+        """Whether the class overrides ``Controller.reset``, so instances can be reused."""
+        return self.load().reset is not Controller.reset
+
+    @property
+    def name(self) -> str:
+        if self._name is None:
+            self._name = self().team_name()
+        return self._name
+
+    def times(self) -> tuple[float, float, int]:
+        """``(import_seconds, construct_seconds, constructed)``."""
+        return self.import_seconds, self.construct_seconds, self.constructed
+
+    def add_times(self, import_seconds: float, construct_seconds: float, constructed: int):
+        """Add times measured elsewhere, e.g. in a worker process."""
+        self.import_seconds += import_seconds
+        self.construct_seconds += construct_seconds
+        self.constructed += constructed
+
+    def __eq__(self, other):
+        return isinstance(other, PlayerSpec) and other.ref == self.ref
+
+    def __hash__(self):
+        return hash(self.ref)
+
+    def __repr__(self):
+        return f"PlayerSpec({self.ref!r})"
+
+
+class _Source:
+    """Top-level classes and imported names of one module, read with ``ast``."""
+
+    def __init__(self, module: str, path: Path):
+        tree = ast.parse(path.read_text(encoding="utf-8"), str(path))
+        package = module if path.name == "__init__.py" else module.rpartition(".")[0]
+        self.module = module
+        self.classes = {}  # name -> ast.ClassDef
+        self.names = {}  # local name -> (module, attribute)
+        self.modules = {}  # local name -> module (``import x.y as z``)
+        self.star = False
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                self.classes[node.name] = node
+            elif isinstance(node, ast.ImportFrom):
+                source = "." * node.level + (node.module or "")
+                source = importlib.util.resolve_name(source, package) if node.level else source
+                for alias in node.names:
+                    if alias.name == "*":
+                        self.star = True
+                    else:
+                        self.names[alias.asname or alias.name] = (source, alias.name)
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.asname:
+                        self.modules[alias.asname] = alias.name
+                    else:
+                        top = alias.name.partition(".")[0]
+                        self.modules[top] = top
+
+
+def _source_path(module: str) -> Path | None:
+    parts = module.split(".")
+    if parts[:2] != ["tcg", "players"] or len(parts) < 3:
+        return None
+    path = _PLAYERS_DIR.joinpath(*parts[2:])
+    if (path / "__init__.py").is_file():
+        return path / "__init__.py"
+    if path.with_suffix(".py").is_file():
+        return path.with_suffix(".py")
+    return None
+
+
+class _Scanner:
+    """Finds Controller subclasses by following class bases through the sources."""
+
+    def __init__(self):
+        self._sources = {}
+
+    def source(self, module: str) -> _Source | None:
+        if module not in self._sources:
+            path = _source_path(module)
+            self._sources[module] = None if path is None else _Source(module, path)
+        return self._sources[module]
+
+    def resolve(self, module: str, name: str, depth: int = 0):
+        """Follow ``name`` in ``module`` to ``(module, ClassDef)``, ``_CONTROLLER`` or None."""
+        if (module, name) == _CONTROLLER:
+            return _CONTROLLER
+        source = self.source(module)
+        if source is None or depth > 20:
+            return None
+        if name in source.classes:
+            return module, source.classes[name]
+        if name in source.names:
+            return self.resolve(*source.names[name], depth + 1)
+        return None
+
+    def base(self, module: str, node: ast.expr):
+        source = self.source(module)
+        if isinstance(node, ast.Name):
+            return self.resolve(module, node.id)
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            if node.value.id in source.modules:
+                return self.resolve(source.modules[node.value.id], node.attr)
+        return None
+
+    def is_player(self, module: str, node: ast.ClassDef, depth: int = 0) -> bool:
+        for base in node.bases:
+            found = self.base(module, base)
+            if found == _CONTROLLER:
+                return True
+            if found is not None and depth < 20 and self.is_player(*found, depth + 1):
+                return True
+        return False
+
+    def team_name(self, module: str, node: ast.ClassDef, depth: int = 0) -> str | None:
+        """The string literal returned by ``team_name()``, if it is that simple."""
+        for item in node.body:
+            if isinstance(item, ast.FunctionDef) and item.name == "team_name":
+                body = item.body[1:] if ast.get_docstring(item) is not None else item.body
+                if (
+                    len(body) == 1
+                    and isinstance(body[0], ast.Return)
+                    and isinstance(body[0].value, ast.Constant)
+                    and isinstance(body[0].value.value, str)
+                ):
+                    return body[0].value.value
+                return None
+        for base in node.bases:
+            found = self.base(module, base)
+            if found not in (None, _CONTROLLER) and depth < 20:
+                return self.team_name(*found, depth + 1)
+        return None
+
+    def players(self, module: str) -> list[PlayerSpec]:
+        """Player classes visible in ``module``, defined there or imported, sorted by name."""
+        source = self.source(module)
+        if source.star:
+            return _import_players(module)
+        specs = []
+        for name in sorted(set(source.classes) | set(source.names)):
+            found = self.resolve(module, name)
+            if found in (None, _CONTROLLER):
+                continue
+            defined_in, node = found
+            if self.is_player(defined_in, node):
+                specs.append(PlayerSpec(defined_in, node.name, self.team_name(defined_in, node)))
+        return specs
+
+
+def _import_players(module_name: str) -> list[PlayerSpec]:
+    """Import ``module_name`` and collect its players (for sources too dynamic to read)."""
+    module = importlib.import_module(module_name)
+    return [
+        PlayerSpec.of(obj)
+        for _, obj in inspect.getmembers(module, inspect.isclass)
+        if issubclass(obj, Controller) and obj is not Controller
+    ]
+
+
+def discover_players() -> list[PlayerSpec]:
+    """
+    Discover all Controller subclasses in this directory without importing them.
+
+    Supports both single-file players (*.py) and directory-based players (player_*/).
 
     Returns:
-        List of Controller subclass types found in player files
+        One PlayerSpec per player class, in the order the files are found
     """
-    players = []
-    current_dir = Path(__file__).parent
+    scanner = _Scanner()
+    modules = []
 
     # 1. Find all Python files except __init__.py and template
-    for file_path in current_dir.glob("*.py"):
+    for file_path in _PLAYERS_DIR.glob("*.py"):
         if file_path.name in ["__init__.py", "template_player.py"]:
             continue
-
-        # Import the module
-        module_name = f"tcg.players.{file_path.stem}"
-        try:
-            module = importlib.import_module(module_name)
-
-            # Find all Controller subclasses in the module
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if issubclass(obj, Controller) and obj is not Controller:
-                    players.append(obj)
-        except Exception as e:
-            print(f"Warning: Failed to load {file_path.name}: {e}")
+        modules.append((f"tcg.players.{file_path.stem}", file_path.name))
 
     # 2. Find all directories starting with "player_"
-    for dir_path in current_dir.iterdir():
+    for dir_path in _PLAYERS_DIR.iterdir():
         if not dir_path.is_dir():
             continue
         if not dir_path.name.startswith("player_"):
@@ -57,25 +274,26 @@ def discover_players() -> list[type[Controller]]:
             continue
 
         # Check if __init__.py exists
-        init_file = dir_path / "__init__.py"
-        if not init_file.exists():
+        if not (dir_path / "__init__.py").exists():
             print(f"Warning: {dir_path.name}/ has no __init__.py, skipping")
             continue
+        modules.append((f"tcg.players.{dir_path.name}", f"{dir_path.name}/"))
 
-        # Import the package
-        module_name = f"tcg.players.{dir_path.name}"
+    players = []
+    seen = set()
+    for module_name, label in modules:
         try:
-            module = importlib.import_module(module_name)
-
-            # Find all Controller subclasses in the module
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if issubclass(obj, Controller) and obj is not Controller:
-                    players.append(obj)
+            specs = scanner.players(module_name)
         except Exception as e:
-            print(f"Warning: Failed to load {dir_path.name}/: {e}")
+            print(f"Warning: Failed to load {label}: {e}")
+            continue
+        for spec in specs:
+            if spec.ref not in seen:
+                seen.add(spec.ref)
+                players.append(spec)
 
     return players
 
 
 # Export the discovery function
-__all__ = ["discover_players"]
+__all__ = ["PlayerSpec", "discover_players"]
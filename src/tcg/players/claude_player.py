@@ -5,7 +5,7 @@ AI Player
 Claudeが作りました
 """
 
-from tcg.config import fortress_cool, fortress_limit
+from tcg.config import fortress_cool, fortress_limit, swap_number_l, travel_steps
 from tcg.controller import Controller
 
 
@@ -31,6 +31,24 @@ class ClaudePlayer(Controller):
     def __init__(self) -> None:
         super().__init__()
         self.step = 0
+        self.travel = travel_steps
+
+    def reset(self, side, seed):
+        """
+        試合ごとの初期化
+
+        赤（side 2）には盤面が反転して渡されるので、到着ステップ数の表も
+        反転した要塞番号で引けるように並べ替えておく
+        """
+        super().reset(side, seed)
+        self.step = 0
+        if side == 1:
+            self.travel = travel_steps
+        else:
+            self.travel = [
+                [[table[swap_number_l[i]][swap_number_l[j]] for j in range(12)] for i in range(12)]
+                for table in travel_steps
+            ]
 
     def team_name(self) -> str:
         return "Strategic"
@@ -124,7 +142,8 @@ class ClaudePlayer(Controller):
                             state[neighbor][3],
                             state[neighbor][2],
                             state[neighbor][1],
-                            100  # 推定到着時間
+                            # 到着までのステップ数
+                            self.travel[state[my_fort][1]][my_fort][neighbor],
                         ):
                             importance = self.FORTRESS_IMPORTANCE[neighbor]
                             priority = 120 + importance * 3
@@ -142,7 +161,7 @@ class ClaudePlayer(Controller):
                             state[neighbor][3],
                             state[neighbor][2],
                             state[neighbor][1],
-                            150
+                            self.travel[state[my_fort][1]][my_fort][neighbor],
                         ):
                             # 敵の重要拠点を優先
                             importance = self.FORTRESS_IMPORTANCE[neighbor]
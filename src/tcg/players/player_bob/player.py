@@ -18,6 +18,16 @@ class BobPlayer(Controller):
         self.strategy = Strategy()
         self.step = 0
 
+    def reset(self, side, seed):
+        """
+        試合ごとの初期化.
+
+        戦略（学習済みモデルなど）は作り直さず、試合ごとの状態だけ戻す。
+        reset を定義しておくと、トーナメントでは同じインスタンスが何試合も使い回される。
+        """
+        super().reset(side, seed)
+        self.step = 0
+
     def team_name(self) -> str:
         return "Bob"
 
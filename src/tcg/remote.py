@@ -0,0 +1,211 @@
+"""Controllers that run in their own process and read the board from shared memory.
+
+Each step the engine side writes ``info`` into a
+:class:`multiprocessing.shared_memory.SharedMemory` block with a fixed struct
+layout (header, fortress table, moving pawns, spawning pawns) and sends a
+4-byte step number through a pipe. The player process decodes the block into
+the usual ``info`` list, calls ``update`` and answers with 13 bytes, so
+nothing is pickled per step.
+"""
+
+import multiprocessing
+import pickle
+import struct
+import sys
+from multiprocessing.shared_memory import SharedMemory
+
+from .config import initial_state, n_fortress
+from .controller import Controller
+
+_HEADER = struct.Struct("<BBII")  # team, done, n_moving, n_spawning
+_FORTRESSES = struct.Struct("<" + "BBBdh" * n_fortress)  # team, kind, level, pawns, upgrade
+_MOVING = struct.Struct("<BBBBdd")  # team, kind, from_, to, x, y
+_SPAWNING = struct.Struct("<BBdBBdd")  # team, kind, pawn_number, from_, to, x, y
+_STEP = struct.Struct("<I")
+# In place of a step number: a pickled (method, args) call on the controller follows.
+_CALL = _STEP.pack(0xFFFFFFFF)
+_COMMAND = struct.Struct("<iii")
+
+_neighbours = tuple(tuple(row[5]) for row in initial_state)
+
+
+def _number(value: float):
+    return int(value) if value.is_integer() else value
+
+
+def _block_size(capacity: int) -> int:
+    return _HEADER.size + _FORTRESSES.size + capacity * (_MOVING.size + _SPAWNING.size)
+
+
+def _attach(name: str) -> SharedMemory:
+    # The engine side owns the block; keep the player process's tracker out of it.
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, track=False)
+    return SharedMemory(name)
+
+
+def write_info(buf, info, capacity: int):
+    """Encode ``info`` into ``buf``; pawn lists may hold up to ``capacity`` rows."""
+    team, state, moving_pawns, spawning_pawns, done = info
+    _HEADER.pack_into(buf, 0, team, done, len(moving_pawns), len(spawning_pawns))
+    values = []
+    for row in state:
+        values += row[:5]
+    offset = _HEADER.size
+    _FORTRESSES.pack_into(buf, offset, *values)
+
+    offset += _FORTRESSES.size
+    moving = b"".join(
+        [_MOVING.pack(t, k, f, to, pos[0], pos[1]) for t, k, f, to, pos in moving_pawns]
+    )
+    buf[offset : offset + len(moving)] = moving
+
+    offset += capacity * _MOVING.size
+    spawning = b"".join(
+        [_SPAWNING.pack(t, k, n, f, to, pos[0], pos[1]) for t, k, n, f, to, pos in spawning_pawns]
+    )
+    buf[offset : offset + len(spawning)] = spawning
+
+
+def read_info(buf, capacity: int) -> list:
+    """Decode a block written by :func:`write_info` into an ``info`` list of tuples."""
+    team, done, n_moving, n_spawning = _HEADER.unpack_from(buf, 0)
+    offset = _HEADER.size
+    f = _FORTRESSES.unpack_from(buf, offset)
+    state = tuple(
+        (f[5 * i], f[5 * i + 1], f[5 * i + 2], _number(f[5 * i + 3]), f[5 * i + 4], _neighbours[i])
+        for i in range(n_fortress)
+    )
+
+    offset += _FORTRESSES.size
+    end = offset + n_moving * _MOVING.size
+    moving = tuple(
+        (t, k, fr, to, (x, y)) for t, k, fr, to, x, y in _MOVING.iter_unpack(buf[offset:end])
+    )
+
+    offset += capacity * _MOVING.size
+    end = offset + n_spawning * _SPAWNING.size
+    spawning = tuple(
+        (t, k, _number(n), fr, to, (x, y))
+        for t, k, n, fr, to, x, y in _SPAWNING.iter_unpack(buf[offset:end])
+    )
+    return [team, state, moving, spawning, bool(done)]
+
+
+def _serve(factory, conn):
+    """Player process: build the controller, then answer one command per step."""
+    controller = factory()
+    conn.send(
+        (
+            controller.team_name(),
+            controller.update_interval,
+            tuple(controller.update_events),
+            controller.update_threshold,
+        )
+    )
+    shm = None
+    capacity = 0
+    while True:
+        message = conn.recv_bytes()
+        if not message:
+            break
+        if message[: _STEP.size] == _CALL:
+            method, args = pickle.loads(message[_STEP.size :])
+            getattr(controller, method)(*args)
+            continue
+        if len(message) > _STEP.size:
+            # The block was replaced by a larger one.
+            if shm is not None:
+                shm.close()
+            capacity, name = message[_STEP.size :].decode().split(":", 1)
+            capacity = int(capacity)
+            shm = _attach(name)
+        info = read_info(shm.buf, capacity)
+        try:
+            # Packing also rejects malformed commands (None, floats, wrong length).
+            reply = b"\x00" + _COMMAND.pack(*controller.update(info))
+        except Exception as exc:
+            reply = b"\x01" + f"{type(exc).__name__}: {exc}".encode()
+        conn.send_bytes(reply)
+    controller.close()
+    if shm is not None:
+        shm.close()
+
+
+class RemoteController(Controller):
+    """Controller whose player runs in a separate process.
+
+    ``factory`` (usually a player class) is called inside the child process,
+    so the player's code and state never live in the engine's process. The
+    board is shared through one shared-memory block that grows when the pawn
+    lists outgrow ``capacity``.
+    """
+
+    def __init__(self, factory, capacity: int = 1024):
+        context = multiprocessing.get_context()
+        self._conn, child = context.Pipe()
+        self._process = context.Process(target=_serve, args=(factory, child), daemon=True)
+        self._process.start()
+        child.close()
+        name, interval, events, threshold = self._conn.recv()
+        self.name = name
+        self.update_interval = interval
+        self.update_events = events
+        self.update_threshold = threshold
+        self._shm = None
+        self._capacity = 0
+        self._resize(capacity)
+        self._step = 0
+
+    def _resize(self, capacity: int):
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+        self._shm = SharedMemory(create=True, size=_block_size(capacity))
+        self._capacity = capacity
+        self._announce = f"{capacity}:{self._shm.name}".encode()
+
+    def team_name(self) -> str:
+        return self.name
+
+    def seed(self, seed):
+        self._call("seed", seed)
+
+    def reset(self, side: int, seed):
+        self._call("reset", side, seed)
+
+    def _call(self, method: str, *args):
+        self._conn.send_bytes(_CALL + pickle.dumps((method, args)))
+
+    def update(self, info) -> tuple[int, int, int]:
+        n = max(len(info[2]), len(info[3]))
+        if n > self._capacity:
+            self._resize(max(n, 2 * self._capacity))
+        write_info(self._shm.buf, info, self._capacity)
+
+        self._step = self._step % 0xFFFFFFFE + 1  # never the _CALL marker
+        message = _STEP.pack(self._step)
+        if self._announce:
+            message += self._announce
+            self._announce = b""
+        self._conn.send_bytes(message)
+        reply = self._conn.recv_bytes()
+        if reply[0]:
+            raise RuntimeError(f"{self.name}: {reply[1:].decode()}")
+        return _COMMAND.unpack_from(reply, 1)
+
+    def close(self):
+        """Stop the player process and release the shared block."""
+        if self._process.is_alive():
+            try:
+                self._conn.send_bytes(b"")
+            except (BrokenPipeError, OSError):
+                pass
+            self._process.join(timeout=1)
+            if self._process.is_alive():
+                self._process.terminate()
+        self._conn.close()
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
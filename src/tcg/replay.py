@@ -0,0 +1,251 @@
+"""Compact match replays: seed, effective commands and sparse keyframes.
+
+Everything random in a match comes from the engine's seeded ``rng``, so the
+seed plus the commands that actually changed the board are enough to play it
+again. Commands are stored as run-length gaps of no-op steps followed by a
+two-byte command; every ``keyframe_interval`` steps a snapshot is kept so that
+:meth:`Replay.seek` only re-simulates from the nearest keyframe. A 50,000-step
+match takes a few tens of kilobytes.
+
+Recording::
+
+    engine.recorder = Replay(engine.seed, engine.team1, engine.team2)
+    engine.run_headless()
+    engine.recorder.finish(engine)
+    engine.recorder.save("match.tcgr")
+
+Playing back::
+
+    replay = Replay.load("match.tcgr")
+    engine = replay.seek(12000)  # Engine positioned at step 12000
+    replay.play(window=True)  # or window=False for full speed
+"""
+
+import bisect
+import struct
+import zlib
+
+from .config import swap_number_l
+from .controller import Controller
+from .engine import Engine
+
+_MAGIC = b"TCGR"
+_VERSION = 1
+_HEAD = struct.Struct("<QIB")  # seed, steps, number of names (2) follow as strings
+_COUNT = struct.Struct("<I")
+_KEYFRAME = struct.Struct("<II")  # step, length of the snapshot bytes
+_RNG = struct.Struct("<625I")  # Mersenne Twister state of random.Random
+_GAUSS = struct.Struct("<?d")
+
+NOOP = (0, 0, 0)
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _string(text: str) -> bytes:
+    raw = text.encode()
+    return _COUNT.pack(len(raw)) + raw
+
+
+def _read_string(data: bytes, offset: int) -> tuple[str, int]:
+    (n,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    return data[offset : offset + n].decode(), offset + n
+
+
+def _pack_rng(state) -> bytes:
+    version, internal, gauss = state
+    return _RNG.pack(*internal) + _GAUSS.pack(gauss is not None, gauss or 0.0)
+
+
+def _unpack_rng(data: bytes, offset: int) -> tuple[tuple, int]:
+    internal = _RNG.unpack_from(data, offset)
+    offset += _RNG.size
+    has_gauss, gauss = _GAUSS.unpack_from(data, offset)
+    offset += _GAUSS.size
+    return (3, internal, gauss if has_gauss else None), offset
+
+
+class _Script(Controller):
+    """Controller that replays one team's recorded commands."""
+
+    def __init__(self, replay: "Replay", team: int):
+        self.replay = replay
+        self.team = team
+        self.engine = None  # set once the engine exists; commands are looked up by its step
+
+    def team_name(self) -> str:
+        return self.replay.team1 if self.team == 1 else self.replay.team2
+
+    def update(self, info) -> tuple[int, int, int]:
+        for team, command, subject, to in self.replay.commands.get(self.engine.step, ()):
+            if team == self.team:
+                if team == 2:
+                    # The engine flips team 2's answer back to the board's orientation.
+                    return command, swap_number_l[subject], swap_number_l[to]
+                return command, subject, to
+        return NOOP
+
+
+class Replay:
+    """Record of one match that can be saved, loaded, sought and played back.
+
+    ``commands`` maps a step to the ``(team, command, subject, to)`` orders
+    that took effect on it, in board orientation; ``keyframes`` holds
+    ``(step, snapshot)`` pairs in step order.
+    """
+
+    def __init__(self, seed: int, team1: str, team2: str, keyframe_interval: int = 5000):
+        if not 0 <= seed < 1 << 64:
+            raise ValueError("replays need a seed in [0, 2**64)")
+        self.seed = seed
+        self.team1 = team1
+        self.team2 = team2
+        self.keyframe_interval = keyframe_interval
+        self.commands = {}
+        self.keyframes = []
+        self.next_keyframe = keyframe_interval
+        self.steps = 0
+        self.winner = "Both"
+
+    # Recording (called by the engine)
+
+    def record(self, step: int, team: int, command: int, subject: int, to: int):
+        self.commands.setdefault(step, []).append((team, command, subject, to))
+
+    def keyframe(self, step: int, snapshot):
+        self.keyframes.append((step, snapshot))
+        self.next_keyframe = step + self.keyframe_interval
+
+    def finish(self, engine: Engine):
+        """Note the final step and winner of the recorded match."""
+        self.steps = engine.step
+        self.winner = engine.win_team
+
+    # Serialisation
+
+    def to_bytes(self) -> bytes:
+        body = [_HEAD.pack(self.seed, self.steps, 3)]
+        body += [_string(self.team1), _string(self.team2), _string(self.winner)]
+
+        stream = bytearray()
+        last = 0
+        for step in sorted(self.commands):
+            for team, command, subject, to in self.commands[step]:
+                stream += _varint(step - last)  # no-op steps since the previous command
+                stream.append(team << 2 | command)
+                stream.append(subject << 4 | to)
+                last = step
+        body += [_COUNT.pack(len(stream)), bytes(stream)]
+
+        body.append(_COUNT.pack(len(self.keyframes)))
+        for step, (data, rng_state) in self.keyframes:
+            body += [_KEYFRAME.pack(step, len(data)), data, _pack_rng(rng_state)]
+        return _MAGIC + bytes([_VERSION]) + zlib.compress(b"".join(body), 9)
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> "Replay":
+        if blob[:4] != _MAGIC or blob[4] != _VERSION:
+            raise ValueError("not a version 1 replay")
+        data = zlib.decompress(blob[5:])
+        seed, steps, _ = _HEAD.unpack_from(data)
+        offset = _HEAD.size
+        team1, offset = _read_string(data, offset)
+        team2, offset = _read_string(data, offset)
+        winner, offset = _read_string(data, offset)
+        replay = cls(seed, team1, team2)
+        replay.steps = steps
+        replay.winner = winner
+
+        (n,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        end = offset + n
+        step = 0
+        while offset < end:
+            gap, offset = _read_varint(data, offset)
+            step += gap
+            head, packed = data[offset], data[offset + 1]
+            offset += 2
+            replay.record(step, head >> 2, head & 3, packed >> 4, packed & 15)
+
+        (n,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        for _ in range(n):
+            step, size = _KEYFRAME.unpack_from(data, offset)
+            offset += _KEYFRAME.size
+            snapshot = data[offset : offset + size]
+            rng_state, offset = _unpack_rng(data, offset + size)
+            replay.keyframes.append((step, (snapshot, rng_state)))
+        return replay
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path) -> "Replay":
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    # Playback
+
+    def engine(self, window: bool = False, **kwargs) -> Engine:
+        """Fresh engine at step 0 whose controllers replay this match.
+
+        With ``window`` it is a :class:`tcg.game.Game`; ``kwargs`` go to its
+        constructor (``steps_per_second`` for example).
+        """
+        script1, script2 = _Script(self, 1), _Script(self, 2)
+        if window:
+            from .game import Game
+
+            engine = Game(script1, script2, window=True, seed=self.seed, **kwargs)
+        else:
+            engine = Engine(script1, script2, seed=self.seed, **kwargs)
+        script1.engine = script2.engine = engine
+        return engine
+
+    def seek(self, step: int, engine: Engine | None = None) -> Engine:
+        """Bring ``engine`` (a new headless one by default) to ``step``.
+
+        The nearest keyframe at or before ``step`` is restored, unless the
+        engine is already between it and ``step``, and the rest is simulated.
+        """
+        if engine is None:
+            engine = self.engine()
+        i = bisect.bisect_right(self.keyframes, step, key=lambda k: k[0])
+        if i and engine.step < self.keyframes[i - 1][0] or engine.step > step:
+            if i:
+                engine.restore(self.keyframes[i - 1][1])
+            else:
+                engine.restore(self.engine().snapshot())
+        while engine.step < step and not engine.finished():
+            engine.advance()
+        return engine
+
+    def play(self, window: bool = False, **kwargs) -> Engine:
+        """Play the whole match again, in a window or headless at full speed."""
+        engine = self.engine(window=window, **kwargs)
+        if window:
+            engine.run()
+        else:
+            engine.run_headless()
+        return engine
@@ -0,0 +1,162 @@
+"""On-disk store of match results, keyed so that unchanged matches are never replayed.
+
+A seeded match without a move deadline is fully determined by the two
+players' code, the engine code, the seed and which player is Blue.
+:class:`ResultStore` keeps results in a SQLite file under exactly that key.
+Player code is hashed per module, or per ``player_*/`` package for directory
+players, plus every other module under ``tcg/players`` that it imports, together
+with the class's qualified name; the engine version is a hash of the ``tcg``
+sources outside ``tcg/players``. Matches played under a
+deadline depend on machine load, so callers must not store them.
+"""
+
+import ast
+import hashlib
+import importlib.util
+import json
+import sqlite3
+from pathlib import Path
+
+from .players import PlayerSpec
+
+_TCG_DIR = Path(__file__).parent
+_PLAYERS_DIR = _TCG_DIR / "players"
+
+
+def _hash_files(paths, root: Path) -> str:
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(str(path.relative_to(root)).encode() + b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _sources(directory: Path) -> list[Path]:
+    return [p for p in directory.rglob("*") if p.is_file() and "__pycache__" not in p.parts]
+
+
+def _player_unit(module: str) -> Path | None:
+    """The ``player_x.py`` file or ``player_x/`` directory holding a ``tcg.players`` module."""
+    parts = module.split(".")
+    if parts[:2] != ["tcg", "players"] or len(parts) < 3:
+        return None
+    path = _PLAYERS_DIR / parts[2]
+    if path.is_dir():
+        return path
+    if path.with_suffix(".py").is_file():
+        return path.with_suffix(".py")
+    return None
+
+
+def _imported_modules(path: Path) -> set[str]:
+    """Absolute names of the modules ``path`` imports anywhere, and of names it imports from."""
+    module = ".".join(("tcg",) + path.relative_to(_TCG_DIR).with_suffix("").parts)
+    if path.name == "__init__.py":
+        package = module.removesuffix(".__init__")
+    else:
+        package = module.rpartition(".")[0]
+    modules = set()
+    for node in ast.walk(ast.parse(path.read_bytes(), str(path))):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            source = "." * node.level + (node.module or "")
+            source = importlib.util.resolve_name(source, package) if node.level else source
+            modules.add(source)
+            # ``from package import name`` may import a submodule
+            modules.update(f"{source}.{alias.name}" for alias in node.names)
+    return modules
+
+
+def _player_files(unit: Path) -> set[Path]:
+    """Source files of ``unit`` and of every ``tcg.players`` unit it imports, transitively."""
+    units = {unit}
+    files = set()
+    pending = [unit]
+    while pending:
+        unit = pending.pop()
+        sources = _sources(unit) if unit.is_dir() else [unit]
+        files.update(sources)
+        for path in sources:
+            if path.suffix != ".py":
+                continue
+            for module in _imported_modules(path):
+                found = _player_unit(module)
+                if found is not None and found not in units:
+                    units.add(found)
+                    pending.append(found)
+    return files
+
+
+def source_hash(player_class) -> str:
+    """Hash of the source that defines ``player_class`` (a class or a PlayerSpec).
+
+    Classes from ``tcg.players.player_x`` (a module or a package) hash the
+    whole ``player_x.py`` file or ``player_x/`` directory, plus the files of
+    any other ``tcg.players`` module it imports (shared helpers), followed
+    transitively; other classes hash the file of their module. Neither needs
+    the player to be imported.
+    """
+    module = PlayerSpec.of(player_class).module
+    unit = _player_unit(module)
+    if unit is not None:
+        return _hash_files(_player_files(unit), _PLAYERS_DIR)
+    path = Path(importlib.util.find_spec(module).origin)
+    return _hash_files([path], path.parent)
+
+
+def engine_version() -> str:
+    """Hash of the simulation sources (everything in ``tcg`` but the players)."""
+    return _hash_files([p for p in _TCG_DIR.glob("*.py")], _TCG_DIR)
+
+
+class ResultStore:
+    """SQLite table of ``result`` dicts keyed by (blue code, red code, engine, seed).
+
+    Only seeded matches are stored; with ``seed=None`` a match is not
+    reproducible, so :meth:`get` misses and :meth:`put` does nothing.
+    """
+
+    def __init__(self, path):
+        self.engine = engine_version()
+        self._hashes = {}
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " blue TEXT, red TEXT, engine TEXT, seed INTEGER, result TEXT,"
+            " PRIMARY KEY (blue, red, engine, seed))"
+        )
+
+    def player_hash(self, player_class) -> str:
+        """Hash of the player's source and qualified name, so classes sharing a file differ."""
+        digest = self._hashes.get(player_class)
+        if digest is None:
+            qualname = PlayerSpec.of(player_class).qualname
+            digest = hashlib.sha256(f"{source_hash(player_class)}:{qualname}".encode()).hexdigest()
+            self._hashes[player_class] = digest
+        return digest
+
+    def _key(self, blue_class, red_class, seed) -> tuple:
+        return (self.player_hash(blue_class), self.player_hash(red_class), self.engine, seed)
+
+    def get(self, blue_class, red_class, seed: int | None) -> dict | None:
+        """Stored result of ``blue_class`` (Blue) against ``red_class`` with ``seed``."""
+        if seed is None:
+            return None
+        row = self._db.execute(
+            "SELECT result FROM results WHERE blue = ? AND red = ? AND engine = ? AND seed = ?",
+            self._key(blue_class, red_class, seed),
+        ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def put(self, blue_class, red_class, seed: int | None, result: dict):
+        if seed is None:
+            return
+        self._db.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+            self._key(blue_class, red_class, seed) + (json.dumps(result),),
+        )
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,243 @@
+"""Squad-level pawn model: one record per dispatch order instead of per pawn.
+
+A ``deliver`` order becomes a :class:`Squad` that releases one pawn every
+7 (kind 0) or 10 (kind 1) steps. A pawn's position follows in closed form
+from its release step and lateral offset, and its arrival step is computed by
+``config.arrival_steps`` at release, so per-step work and memory scale with the
+number of orders.
+"""
+
+from .config import A_coordinate, arrival_steps, pawn_speed
+from .engine import Engine
+
+
+class Squad:
+    """Pawns sent by one order: ``count`` pawns released every ``cadence`` steps."""
+
+    __slots__ = (
+        "team",
+        "kind",
+        "from_",
+        "to",
+        "start",
+        "count",
+        "cadence",
+        "origin",
+        "velocity",
+        "offsets",
+        "arrivals",
+        "arrived",
+    )
+
+    def __init__(self, team, kind, count, from_, to, origin, start):
+        self.team = team
+        self.kind = kind
+        self.from_ = from_
+        self.to = to
+        self.count = count
+        self.cadence = 7 if kind == 0 else 10
+        self.start = start + (-start) % self.cadence  # step of the first release
+        self.origin = origin
+        speed = pawn_speed[kind]
+        self.velocity = (A_coordinate[from_][to][0] * speed, A_coordinate[from_][to][1] * speed)
+        self.offsets = []  # lateral offset of each released pawn
+        self.arrivals = []  # arrival step of each released pawn
+        self.arrived = 0
+
+    @property
+    def released(self) -> int:
+        return len(self.offsets)
+
+    def point(self, j: int) -> tuple[float, float]:
+        """Release point of pawn ``j``."""
+        r = self.offsets[j]
+        direction = A_coordinate[self.from_][self.to]
+        return (
+            self.origin[0] + direction[1] * r * 10,
+            self.origin[1] + direction[0] * -1 * r * 10,
+        )
+
+    def release(self, r: float):
+        """Send the next pawn with lateral offset ``r``."""
+        step = self.start + self.released * self.cadence
+        self.offsets.append(r)
+        x, y = self.point(len(self.offsets) - 1)
+        self.arrivals.append(step + arrival_steps(self.kind, self.from_, self.to, x, y))
+
+    def position(self, j: int, moved_through: int) -> tuple[float, float]:
+        x, y = self.point(j)
+        m = moved_through - (self.start + j * self.cadence)
+        return (x + m * self.velocity[0], y + m * self.velocity[1])
+
+
+class SquadPawns:
+    """``moving_pawns`` view over the squads: in-flight pawns, built on read."""
+
+    def __init__(self, engine: "SquadEngine"):
+        self.engine = engine
+        self._cache = None
+
+    def _flying(self) -> list:
+        """``(squad, j)`` for every pawn in flight, in departure order."""
+        flying = [
+            (s.start + j * s.cadence, index, j)
+            for index, s in enumerate(self.engine.squads)
+            for j in range(s.arrived, s.released)
+        ]
+        flying.sort()
+        squads = self.engine.squads
+        return [(squads[index], j) for _, index, j in flying]
+
+    def _rows(self) -> list:
+        # Rows are reused until the engine moves or releases pawns again.
+        if self._cache is None:
+            now = self.engine.moved_through
+            self._cache = [
+                (s.team, s.kind, s.from_, s.to, s.position(j, now)) for s, j in self._flying()
+            ]
+        return self._cache
+
+    def invalidate(self):
+        self._cache = None
+
+    def __len__(self) -> int:
+        return sum(s.released - s.arrived for s in self.engine.squads)
+
+    def __getitem__(self, i: int) -> tuple:
+        return self._rows()[i]
+
+    def __iter__(self):
+        return iter(self._rows())
+
+    @property
+    def arrivals(self) -> list:
+        return [s.arrivals[j] for s, j in self._flying()]
+
+    def append(self, pawn, arrive: int):
+        """Add a pawn already in flight at ``pos`` as a squad of one."""
+        team, kind, from_, to, pos = pawn
+        squad = Squad(team, kind, 1, from_, to, pos, 0)
+        squad.start = self.engine.step - 1  # moved for the last time on the previous step
+        squad.offsets.append(0.0)
+        squad.arrivals.append(arrive)
+        self.engine.squads.append(squad)
+        self._cache = None
+
+    def clear(self):
+        self.engine.squads[:] = [s for s in self.engine.squads if s.released < s.count]
+        for s in self.engine.squads:
+            s.arrived = s.released
+        self._cache = None
+
+
+class SquadSpawns:
+    """``spawning_pawns`` view: squads that still have pawns to release."""
+
+    def __init__(self, engine: "SquadEngine"):
+        self.engine = engine
+        self._cache = None
+
+    def _rows(self) -> list:
+        if self._cache is None:
+            self._cache = [
+                [s.team, s.kind, s.count - s.released, s.from_, s.to, s.origin]
+                for s in self.engine.squads
+                if s.released < s.count
+            ]
+        return self._cache
+
+    def invalidate(self):
+        self._cache = None
+
+    def __len__(self) -> int:
+        return sum(1 for s in self.engine.squads if s.released < s.count)
+
+    def __getitem__(self, i: int) -> list:
+        return self._rows()[i]
+
+    def __iter__(self):
+        return iter(self._rows())
+
+    def append(self, spawn):
+        """Register a ``deliver`` order as a new squad."""
+        team, kind, pawn_number, from_, to, pos = spawn
+        self.engine.squads.append(Squad(team, kind, pawn_number, from_, to, pos, self.engine.step))
+        self._cache = None
+
+    def clear(self):
+        self.engine.squads[:] = [s for s in self.engine.squads if s.released == s.count]
+        for s in self.engine.squads:
+            s.count = s.released
+        self._cache = None
+
+
+class SquadEngine(Engine):
+    """Engine whose spawning and moving pawns are stored as squads.
+
+    Controllers still receive ``spawning_pawns`` and ``moving_pawns`` in the
+    usual row format; the rows are built only when read. Arrivals that land
+    on the same step are applied in the order the pawns departed.
+    """
+
+    def __init__(
+        self,
+        controller1,
+        controller2,
+        decision_interval: int = 1,
+        seed: int | None = None,
+        seed_controllers: bool = True,
+    ):
+        super().__init__(
+            controller1,
+            controller2,
+            decision_interval=decision_interval,
+            seed=seed,
+            seed_controllers=seed_controllers,
+        )
+
+    def reset(self, seed=None, controller1=None, controller2=None, seed_controllers=True):
+        super().reset(seed, controller1, controller2, seed_controllers)
+        self.squads = []
+        self.moving_pawns = SquadPawns(self)
+        self.spawning_pawns = SquadSpawns(self)
+        self.moved_through = 0  # last step whose pawn_move has been applied
+
+    def restore(self, snapshot):
+        super().restore(snapshot)
+        self.moved_through = self.step - 1
+
+    def clone(self) -> "SquadEngine":
+        other = SquadEngine(
+            self.controller1, self.controller2, self.decision_interval, self.seed, False
+        )
+        other.restore(self.snapshot())
+        return other
+
+    def pawn_departure(self):
+        """Release the next pawn of every squad whose cadence hits this step."""
+        rand = self.rng.random
+        for squad in self.squads:
+            if squad.released < squad.count and self.step % squad.cadence == 0:
+                squad.release(rand() - 0.5)
+                self.moving_pawns.invalidate()
+                self.spawning_pawns.invalidate()
+
+    def pawn_move(self):
+        """Apply the pawns that arrive on this step and drop finished squads."""
+        self.moved_through = self.step
+        self.moving_pawns.invalidate()
+        finished = False
+        hits = []
+        for index, squad in enumerate(self.squads):
+            arrivals = squad.arrivals
+            while squad.arrived < len(arrivals) and arrivals[squad.arrived] <= self.step:
+                released = squad.start + squad.arrived * squad.cadence
+                hits.append((released, index, squad.team, squad.kind, squad.to))
+                squad.arrived += 1
+            if squad.arrived == squad.count:
+                finished = True
+        # Apply same-step arrivals in departure order, like the list engine.
+        for _, _, team, kind, to in sorted(hits):
+            self.pawn_hit(team, kind, to)
+        if finished:
+            self.squads[:] = [s for s in self.squads if s.arrived < s.count]
@@ -0,0 +1,117 @@
+"""Running tournament standings and a streaming log of results.
+
+:class:`Standings` folds each result into a few counters per player as it
+arrives, so its memory grows with the number of players, not the number of
+matches. :class:`ResultLog` writes one JSON record per line and flushes it
+straight away, so a long run can be followed with ``tail -f`` and read by any
+JSON Lines tool (``jq``, ``pandas.read_json(lines=True)``, ...).
+"""
+
+import json
+
+from .stats import EloRatings
+
+WIN_POINTS = 3
+DRAW_POINTS = 1
+
+
+class Standings:
+    """Per-player totals, points (3/1/0) and Elo, updated one result at a time."""
+
+    def __init__(self, names=()):
+        self.totals = {}
+        self.points = {}  # name -> points; usable directly as Swiss pairing scores
+        self.elo = EloRatings()
+        self.matches = 0
+        for name in names:
+            self.add(name)
+
+    def add(self, name):
+        if name not in self.totals:
+            self.totals[name] = {
+                "wins": 0,
+                "draws": 0,
+                "losses": 0,
+                "matches": 0,
+                "total_fortresses": 0,
+            }
+            self.points[name] = 0
+
+    def record(self, blue, red, result: dict) -> float:
+        """Add one match result; return Blue's score (1, 0.5 or 0)."""
+        self.add(blue)
+        self.add(red)
+        self.matches += 1
+        b, r = self.totals[blue], self.totals[red]
+        b["matches"] += 1
+        r["matches"] += 1
+        b["total_fortresses"] += result["blue_fortresses"]
+        r["total_fortresses"] += result["red_fortresses"]
+        if result["winner"] == "Blue":
+            b["wins"] += 1
+            r["losses"] += 1
+            self.points[blue] += WIN_POINTS
+            score = 1.0
+        elif result["winner"] == "Red":
+            r["wins"] += 1
+            b["losses"] += 1
+            self.points[red] += WIN_POINTS
+            score = 0.0
+        else:
+            b["draws"] += 1
+            r["draws"] += 1
+            self.points[blue] += DRAW_POINTS
+            self.points[red] += DRAW_POINTS
+            score = 0.5
+        self.elo.update(blue, red, score)
+        return score
+
+    def rows(self) -> list[dict]:
+        """One dict per player, in the order players were added."""
+        rows = []
+        for name, totals in self.totals.items():
+            matches = totals["matches"]
+            score = totals["wins"] + totals["draws"] / 2
+            rows.append(
+                {
+                    "name": name,
+                    "score": self.points[name],
+                    **totals,
+                    "win_rate": totals["wins"] / matches if matches else 0.0,
+                    "score_rate": score / matches if matches else 0.0,
+                    "avg_fortresses": totals["total_fortresses"] / matches if matches else 0.0,
+                    "elo": self.elo.rating(name),
+                }
+            )
+        return rows
+
+
+class ResultLog:
+    """JSON Lines writer; with ``path=None`` every call is a no-op.
+
+    Records are appended, so rerunning or resuming with the same path keeps
+    the earlier runs; each run begins with its own ``start`` record.
+    """
+
+    def __init__(self, path=None):
+        self._file = None if path is None else open(path, "a", encoding="utf-8")
+
+    def write(self, record_type: str, **fields):
+        if self._file is None:
+            return
+        self._file.write(json.dumps({"type": record_type, **fields}, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def match(self, match_id: int, blue, red, result: dict, **fields):
+        self.write("match", match_id=match_id, blue=blue, red=red, **fields, **result)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,124 @@
+"""Statistics for tournaments: sequential tests for head-to-head pairings and ratings.
+
+Game results are scored from one player's point of view: 1 for a win, 0.5
+for a draw and 0 for a loss.
+"""
+
+import math
+
+
+def wilson_interval(score: float, games: int, z: float = 1.96) -> tuple[float, float]:
+    """Wilson score interval for a win rate of ``score / games`` (draws count half)."""
+    if games == 0:
+        return 0.0, 1.0
+    p = score / games
+    denominator = 1 + z * z / games
+    centre = (p + z * z / (2 * games)) / denominator
+    half = z * math.sqrt(p * (1 - p) / games + z * z / (4 * games * games)) / denominator
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+class PairTest:
+    """Sequential test of whether player A scores above or below ``threshold`` against B.
+
+    ``method="sprt"`` runs Wald's sequential probability ratio test of
+    ``p = threshold + delta`` (A is stronger) against ``p = threshold - delta``
+    (B is stronger) with error rates ``alpha`` and ``beta``; at the default
+    threshold of 0.5 draws carry no evidence. ``method="wilson"`` stops once
+    the Wilson interval of A's score excludes ``threshold``. Either way the
+    pair is undecided after ``max_games``.
+    """
+
+    def __init__(
+        self,
+        method: str = "sprt",
+        delta: float = 0.15,
+        alpha: float = 0.05,
+        beta: float = 0.05,
+        z: float = 1.96,
+        min_games: int = 2,
+        max_games: int = 20,
+        threshold: float = 0.5,
+    ):
+        if method not in ("sprt", "wilson"):
+            raise ValueError(f"unknown method: {method}")
+        if not 0 < threshold - delta < threshold + delta < 1:
+            raise ValueError(f"threshold {threshold} +/- delta {delta} must lie inside (0, 1)")
+        self.method = method
+        self.z = z
+        self.min_games = min_games
+        self.max_games = max_games
+        self.threshold = threshold
+        p1, p0 = threshold + delta, threshold - delta
+        self._win = math.log(p1 / p0)  # LLR per point scored by A
+        self._loss = math.log((1 - p1) / (1 - p0))  # LLR per point scored by B
+        self.upper = math.log((1 - beta) / alpha)
+        self.lower = math.log(beta / (1 - alpha))
+        self.games = 0
+        self.score = 0.0  # A's points
+        self.llr = 0.0
+
+    def update(self, score: float):
+        """Add one game scored from A's side."""
+        self.games += 1
+        self.score += score
+        self.llr += score * self._win + (1 - score) * self._loss
+
+    @property
+    def decision(self) -> str | None:
+        """``"A"`` or ``"B"`` once the stronger player is established, else None."""
+        if self.games < self.min_games:
+            return None
+        if self.method == "sprt":
+            if self.llr >= self.upper:
+                return "A"
+            if self.llr <= self.lower:
+                return "B"
+            return None
+        low, high = self.interval()
+        if low > self.threshold:
+            return "A"
+        if high < self.threshold:
+            return "B"
+        return None
+
+    @property
+    def finished(self) -> bool:
+        return self.decision is not None or self.games >= self.max_games
+
+    def interval(self) -> tuple[float, float]:
+        """Wilson interval of A's score rate."""
+        return wilson_interval(self.score, self.games, self.z)
+
+
+class EloRatings:
+    """Elo ratings updated incrementally: one result touches two entries in O(1).
+
+    Players are added on first sight with ``initial``; :meth:`ranking` sorts
+    only when asked.
+    """
+
+    def __init__(self, k: float = 16.0, initial: float = 1500.0):
+        self.k = k
+        self.initial = initial
+        self.ratings = {}
+        self.games = {}
+
+    def rating(self, player) -> float:
+        return self.ratings.get(player, self.initial)
+
+    def expected(self, a, b) -> float:
+        """Expected score of ``a`` against ``b``."""
+        return 1 / (1 + 10 ** ((self.rating(b) - self.rating(a)) / 400))
+
+    def update(self, a, b, score_a: float):
+        """Record one game in which ``a`` scored ``score_a`` (1, 0.5 or 0) against ``b``."""
+        change = self.k * (score_a - self.expected(a, b))
+        self.ratings[a] = self.rating(a) + change
+        self.ratings[b] = self.rating(b) - change
+        self.games[a] = self.games.get(a, 0) + 1
+        self.games[b] = self.games.get(b, 0) + 1
+
+    def ranking(self) -> list[tuple]:
+        """``(player, rating)`` pairs, highest rating first."""
+        return sorted(self.ratings.items(), key=lambda item: item[1], reverse=True)
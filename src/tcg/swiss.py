@@ -0,0 +1,211 @@
+"""Swiss-system pairing for large fields.
+
+Players are bucketed into score groups. Inside a group the top half meets
+the bottom half (the usual Dutch system), skipping opponents already met;
+whoever cannot be paired floats down into the next group. The few players
+left at the bottom are fitted in by swapping partners with earlier pairs.
+If that still leaves two or more players out, a maximum-cardinality matching
+(Edmonds' blossom algorithm, started from the pairs found so far) re-pairs
+the field so that as many players as possible get an opponent.
+Nobody meets the same opponent twice: players that still cannot be paired
+(one of them whenever the field is odd) sit out the round. Apart from the
+caller's sort, the work grows with the square of each score group's size
+(list pops and scans for an unmet opponent) plus a scan of the pairs for
+each leftover player, instead of with the square of the whole field; only
+the rare matching fallback costs up to the square of the field per player
+left out.
+"""
+
+from collections import deque
+from itertools import chain, groupby
+
+
+def _met(played: set, a, b) -> bool:
+    return frozenset((a, b)) in played
+
+
+def _pair_group(members: list, played: set) -> tuple[list, list]:
+    """Pair one score group; return ``(pairs, floaters)``."""
+    pairs = []
+    floaters = []
+    free = list(members)
+    while len(free) >= 2:
+        p = free.pop(0)
+        half = len(free) // 2
+        for k in chain(range(half, len(free)), range(half)):
+            if not _met(played, p, free[k]):
+                pairs.append((p, free.pop(k)))
+                break
+        else:
+            floaters.append(p)
+    return pairs, floaters + free
+
+
+def _repair(pairs: list, leftovers: list, played: set) -> list:
+    """Pair the players nobody could take, swapping partners with recent pairs if needed.
+
+    Returns the players that still have no opponent.
+    """
+    unpaired = []
+    while len(leftovers) >= 2:
+        p = leftovers.pop(0)
+        for i, q in enumerate(leftovers):
+            if not _met(played, p, q):
+                pairs.append((p, leftovers.pop(i)))
+                break
+        else:
+            for i, q in enumerate(leftovers):
+                if _swap(pairs, p, q, played):
+                    leftovers.pop(i)
+                    break
+            else:
+                unpaired.append(p)
+    return unpaired + leftovers
+
+
+def _swap(pairs: list, p, q, played: set) -> bool:
+    """Split one earlier pair so that ``p`` and ``q`` each get one of its players."""
+    for i in range(len(pairs) - 1, -1, -1):
+        x, y = pairs[i]
+        if not _met(played, x, p) and not _met(played, y, q):
+            pairs[i] = (x, p)
+            pairs.append((y, q))
+            return True
+        if not _met(played, x, q) and not _met(played, y, p):
+            pairs[i] = (x, q)
+            pairs.append((y, p))
+            return True
+    return False
+
+
+class _Matching:
+    """Maximum-cardinality matching on the "not met yet" graph of one round.
+
+    Vertices are indices into ``players``; the graph is dense, so neighbours
+    are every other player minus the ones already met. ``augment`` is one
+    search of Edmonds' blossom algorithm from an exposed vertex.
+    """
+
+    def __init__(self, players: list, pairs: list, played: set):
+        index = {p: i for i, p in enumerate(players)}
+        self.players = players
+        self.n = len(players)
+        self.met = [set() for _ in players]
+        for key in played:
+            a, b = tuple(key)
+            if a in index and b in index:
+                self.met[index[a]].add(index[b])
+                self.met[index[b]].add(index[a])
+        self.mate = [-1] * self.n
+        for a, b in pairs:
+            self.mate[index[a]] = index[b]
+            self.mate[index[b]] = index[a]
+
+    def _lca(self, a: int, b: int) -> int:
+        seen = [False] * self.n
+        while True:
+            a = self.base[a]
+            seen[a] = True
+            if self.mate[a] == -1:
+                break
+            a = self.parent[self.mate[a]]
+        while True:
+            b = self.base[b]
+            if seen[b]:
+                return b
+            b = self.parent[self.mate[b]]
+
+    def _mark_path(self, v: int, b: int, child: int, blossom: list):
+        while self.base[v] != b:
+            blossom[self.base[v]] = blossom[self.base[self.mate[v]]] = True
+            self.parent[v] = child
+            child = self.mate[v]
+            v = self.parent[self.mate[v]]
+
+    def augment(self, root: int) -> bool:
+        """Grow the matching by one pair along a path from ``root``, if there is one."""
+        n = self.n
+        self.base = list(range(n))
+        self.parent = [-1] * n
+        used = [False] * n
+        used[root] = True
+        queue = deque([root])
+        while queue:
+            v = queue.popleft()
+            for to in range(n):
+                if to == v or to in self.met[v]:
+                    continue
+                if self.base[v] == self.base[to] or self.mate[v] == to:
+                    continue
+                if to == root or (self.mate[to] != -1 and self.parent[self.mate[to]] != -1):
+                    cur = self._lca(v, to)
+                    blossom = [False] * n
+                    self._mark_path(v, cur, to, blossom)
+                    self._mark_path(to, cur, v, blossom)
+                    for i in range(n):
+                        if blossom[self.base[i]]:
+                            self.base[i] = cur
+                            if not used[i]:
+                                used[i] = True
+                                queue.append(i)
+                elif self.parent[to] == -1:
+                    self.parent[to] = v
+                    if self.mate[to] == -1:
+                        while to != -1:
+                            v = self.parent[to]
+                            after = self.mate[v]
+                            self.mate[to] = v
+                            self.mate[v] = to
+                            to = after
+                        return True
+                    used[self.mate[to]] = True
+                    queue.append(self.mate[to])
+        return False
+
+
+def _match(pairs: list, unpaired: list, played: set, rank: dict) -> tuple[list, list]:
+    """Re-pair ``pairs`` plus ``unpaired`` with a maximum matching.
+
+    Pairs the matching keeps stay where they were; new pairs follow in rank
+    order, each with the better ranked player first.
+    """
+    players = sorted(chain(chain.from_iterable(pairs), unpaired), key=rank.__getitem__)
+    matching = _Matching(players, pairs, played)
+    index = {p: i for i, p in enumerate(players)}
+    # A vertex with no augmenting path never gets one later, so one search each suffices
+    for p in sorted(unpaired, key=rank.__getitem__):
+        if matching.mate[index[p]] == -1:
+            matching.augment(index[p])
+    mate = matching.mate
+    kept = [(a, b) for a, b in pairs if mate[index[a]] == index[b]]
+    taken = set(chain.from_iterable(kept))
+    new = []
+    for i, p in enumerate(players):
+        if p not in taken and mate[i] > i:
+            new.append((p, players[mate[i]]))
+    left = [p for i, p in enumerate(players) if mate[i] == -1]
+    return kept + new, left
+
+
+def pair_round(ranked: list, scores: dict, played: set) -> tuple[list, list]:
+    """Pair one Swiss round.
+
+    Args:
+        ranked: player ids, best first; players with equal scores must be adjacent
+        scores: id -> current score, used to form the score groups
+        played: ``frozenset({a, b})`` for every pair that has already met
+
+    Returns:
+        ``(pairs, unpaired)``: ``(a, b)`` tuples with ``a`` ranked above ``b`` in
+        its group, and the players left without an opponent, who sit out.
+    """
+    pairs = []
+    carry = []
+    for _, group in groupby(ranked, key=scores.__getitem__):
+        group_pairs, carry = _pair_group(carry + list(group), played)
+        pairs += group_pairs
+    unpaired = _repair(pairs, carry, played)
+    if len(unpaired) >= 2:
+        rank = {p: i for i, p in enumerate(ranked)}
+        pairs, unpaired = _match(pairs, unpaired, played, rank)
+    return pairs, unpaired
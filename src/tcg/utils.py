@@ -1,6 +1,11 @@
 """Utility functions for the game."""
 
-from .config import swap_number_d, swap_number_l
+from collections.abc import Sequence
+
+from .config import initial_state, swap_number_d, swap_number_l
+
+# Neighbour lists never change during a match (and are symmetric under the swap).
+_neighbours = tuple(tuple(row[5]) for row in initial_state)
 
 
 def Swap_team(team):
@@ -8,45 +13,120 @@ def Swap_team(team):
     return 0 if team == 0 else 1 if team == 2 else 2
 
 
+class RowView(Sequence):
+    """Read-only, read-through sequence over the engine's rows.
+
+    Nothing is copied up front: row ``i`` is read from ``rows[i]`` and
+    converted to a tuple by ``convert`` the first time it is accessed, then
+    reused for the lifetime of the view. Rows that are already tuples are
+    passed through when ``convert`` is None.
+    Controllers can index and iterate it like a list but cannot change the
+    engine through it. A view is only valid for the step it was made for:
+    the engine keeps changing the rows underneath, so converted rows would go
+    stale and indexes shift. Callers that keep rows must copy them.
+    """
+
+    __slots__ = ("_rows", "_convert", "_cache")
+
+    def __init__(self, rows, convert=None):
+        self._rows = rows
+        self._convert = convert
+        self._cache = {}
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return tuple(self[j] for j in range(*i.indices(len(self))))
+        if self._convert is None:
+            return self._rows[i]
+        if i < 0:
+            i += len(self._rows)
+        row = self._cache.get(i)
+        if row is None:
+            row = self._cache[i] = self._convert(self._rows[i])
+        return row
+
+    def __iter__(self):
+        if self._convert is None:
+            yield from self._rows
+            return
+        cache = self._cache
+        for i, source in enumerate(self._rows):
+            row = cache.get(i)
+            if row is None:
+                row = cache[i] = self._convert(source)
+            yield row
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+def _spawning(spawn):
+    return (spawn[0], spawn[1], spawn[2], spawn[3], spawn[4], tuple(spawn[5]))
+
+
+def _flip_moving(pawn):
+    return (
+        Swap_team(pawn[0]),
+        pawn[1],
+        swap_number_d[pawn[2]],
+        swap_number_d[pawn[3]],
+        pawn[4],
+    )
+
+
+def _flip_spawning(spawn):
+    return (
+        Swap_team(spawn[0]),
+        spawn[1],
+        spawn[2],
+        swap_number_d[spawn[3]],
+        swap_number_d[spawn[4]],
+        tuple(spawn[5]),
+    )
+
+
+def read_only_view(info):
+    """Give the board of ``info`` to a controller without exposing engine internals.
+
+    The 12 fortress rows become a tuple of tuples, which bots can index as
+    fast as the original lists. Pawn lists are wrapped in :class:`RowView`;
+    moving pawns are stored as tuples by every engine, so their view adds no
+    per-row work.
+    """
+    team, state, moving_pawns, spawning_pawns, done = info
+    return [
+        team,
+        tuple([(r[0], r[1], r[2], r[3], r[4], n) for r, n in zip(state, _neighbours)]),
+        RowView(moving_pawns),
+        RowView(spawning_pawns, _spawning),
+        done,
+    ]
+
+
 def flip_board_view(info):
-    """Flip board view so the player always sees themselves as team 1."""
+    """Flip board view so the player always sees themselves as team 1.
+
+    As with :func:`read_only_view` the state becomes a tuple of tuples; the
+    pawn lists are :class:`RowView` objects over the original data whose rows
+    are only flipped when read.
+    """
     team, state, moving_pawns, spawning_pawns, done = info
 
     if team == 1:
         return info
 
-    # Update state
-    new_state = [
-        [Swap_team(state[swap_number_l[i]][0])] + state[swap_number_l[i]][1:]
-        for i in range(len(state))
-    ]
-
-    for i in range(len(state)):
-        new_state[i][5] = state[i][5]
-
-    # Update moving_pawns
-    new_moving_pawns = [
-        [
-            Swap_team(moving_pawns[i][0]),
-            moving_pawns[i][1],
-            swap_number_d[moving_pawns[i][2]],
-            swap_number_d[moving_pawns[i][3]],
-        ]
-        + moving_pawns[i][4:]
-        for i in range(len(moving_pawns))
+    return [
+        Swap_team(team),
+        tuple(
+            [
+                (Swap_team(r[0]), r[1], r[2], r[3], r[4], n)
+                for r, n in zip(map(state.__getitem__, swap_number_l), _neighbours)
+            ]
+        ),
+        RowView(moving_pawns, _flip_moving),
+        RowView(spawning_pawns, _flip_spawning),
+        done,
     ]
-
-    # Update spawning_pawns
-    new_spawning_pawns = [
-        [
-            Swap_team(spawning_pawns[i][0]),
-            spawning_pawns[i][1],
-            spawning_pawns[i][2],
-            swap_number_d[spawning_pawns[i][3]],
-            swap_number_d[spawning_pawns[i][4]],
-        ]
-        + spawning_pawns[i][5:]
-        for i in range(len(spawning_pawns))
-    ]
-
-    return [Swap_team(team), new_state, new_moving_pawns, new_spawning_pawns, done]
@@ -0,0 +1,332 @@
+"""Batched engine that advances many independent matches in lockstep.
+
+The rules mirror :class:`tcg.engine.Engine` (``pawn_move``, ``order``,
+``pawn_departure``, ``pawn_born``, ``pawn_over``, ``check_upgrade``), but every
+rule is applied to all games at once with NumPy instead of once per game.
+"""
+
+import time
+
+import numpy as np
+
+from .config import (
+    STEPLIMIT,
+    fortress_cool,
+    fortress_limit,
+    initial_state,
+    n_fortress,
+    swap_number_l,
+)
+from .pawns import arrival_steps, edge_direction, fortress_xy, pawn_speed
+
+# Columns of the fortress table
+TEAM, KIND, LEVEL, PAWNS, UPGRADE = range(5)
+
+_initial = np.array([row[:5] for row in initial_state], dtype=float)
+_cool = np.array(fortress_cool)
+_limit = np.array(fortress_limit, dtype=float)
+_swap = np.array(swap_number_l)
+_connected = np.any(edge_direction != 0, axis=2)
+_spawn_xy = fortress_xy[:, None, :] + edge_direction * 42
+_damage = np.array([0.65, 0.95])
+
+
+class _Pool:
+    """Growable set of equally long columns, compacted in bulk."""
+
+    def __init__(self, columns: dict, capacity: int = 1024):
+        self.n = 0
+        self.columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in columns.items()}
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__["columns"][name][: self.n]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def extend(self, **values):
+        m = len(values["game"])
+        if self.n + m > len(self.columns["game"]):
+            capacity = max(2 * len(self.columns["game"]), self.n + m)
+            for name, old in self.columns.items():
+                new = np.zeros(capacity, dtype=old.dtype)
+                new[: self.n] = old[: self.n]
+                self.columns[name] = new
+        for name, value in values.items():
+            self.columns[name][self.n : self.n + m] = value
+        self.n += m
+
+    def keep(self, mask: np.ndarray):
+        m = int(mask.sum())
+        if m == self.n:
+            return
+        for column in self.columns.values():
+            column[:m] = column[: self.n][mask]
+        self.n = m
+
+
+class VectorEngine:
+    """``n_games`` matches advanced together by :meth:`step`.
+
+    ``fortress`` is an ``(n_games, 12, 5)`` array with the columns
+    ``TEAM, KIND, LEVEL, PAWNS, UPGRADE``. Moving and spawning pawns of all
+    games live in flat array pools tagged with their game index; the order of
+    a game's pawns matches the order the list-based engine would keep.
+    Finished games are recorded in ``winner``/``blue``/``red``/``length``
+    and restarted automatically.
+    """
+
+    def __init__(self, n_games: int, seed=None):
+        self.n_games = n_games
+        self.rng = np.random.default_rng(seed)
+        self.fortress = np.repeat(_initial[None], n_games, axis=0)
+        self.steps = np.zeros(n_games, dtype=np.int64)
+
+        self.moving = _Pool(
+            {
+                "game": np.int32,
+                "team": np.int8,
+                "kind": np.int8,
+                "to": np.int8,
+                "x": float,
+                "y": float,
+                "vx": float,
+                "vy": float,
+                "left": np.int32,  # moves until arrival
+            }
+        )
+        self.spawning = _Pool(
+            {
+                "game": np.int32,
+                "team": np.int8,
+                "kind": np.int8,
+                "count": float,
+                "from_": np.int8,
+                "to": np.int8,
+            }
+        )
+
+        # Result of the most recently finished match of each game slot
+        self.winner = np.zeros(n_games, dtype=np.int8)  # 0: Both, 1: Blue, 2: Red
+        self.blue = np.zeros(n_games, dtype=np.int8)
+        self.red = np.zeros(n_games, dtype=np.int8)
+        self.length = np.zeros(n_games, dtype=np.int64)
+
+        self.episodes = 0
+        self.total_steps = 0
+
+    def flipped(self) -> np.ndarray:
+        """Fortress table from team 2's perspective, as controller2 sees it."""
+        view = self.fortress[:, _swap].copy()
+        team = view[:, :, TEAM]
+        view[:, :, TEAM] = np.where(team == 0, 0, 3 - team)
+        return view
+
+    def fortress_counts(self) -> tuple[np.ndarray, np.ndarray]:
+        team = self.fortress[:, :, TEAM]
+        return (team == 1).sum(axis=1), (team == 2).sum(axis=1)
+
+    def pawn_move(self):
+        """Move every pawn and resolve arrivals in per-game list order."""
+        pawns = self.moving
+        if pawns.n == 0:
+            return
+        x, y = pawns.x, pawns.y
+        x += pawns.vx
+        y += pawns.vy
+        left = pawns.left
+        left -= 1
+        arrived = left <= 0
+        idx = np.flatnonzero(arrived)
+        if len(idx) == 0:
+            return
+
+        # Arrivals at the same fortress are applied one after another, so
+        # process the k-th arrival of every (game, fortress) group together.
+        game = pawns.game[idx]
+        to = pawns.to[idx].astype(np.intp)
+        key = game.astype(np.int64) * n_fortress + to
+        order = np.argsort(key, kind="stable")
+        key_sorted = key[order]
+        first = np.r_[True, key_sorted[1:] != key_sorted[:-1]]
+        start = np.maximum.accumulate(np.where(first, np.arange(len(order)), 0))
+        rank = np.empty(len(order), dtype=np.intp)
+        rank[order] = np.arange(len(order)) - start
+
+        team = pawns.team[idx]
+        damage = _damage[pawns.kind[idx]]
+        for r in range(int(rank.max()) + 1):
+            sel = rank == r
+            g, t, tm = game[sel], to[sel], team[sel]
+            cell = self.fortress[g, t]
+            own = cell[:, TEAM] == tm
+            cell[:, PAWNS] = np.where(own, cell[:, PAWNS] + 1, cell[:, PAWNS] - damage[sel])
+            captured = ~own & (cell[:, PAWNS] < 0)
+            cell[captured, TEAM] = tm[captured]
+            cell[captured, LEVEL] = 1
+            cell[captured, PAWNS] = 0
+            cell[captured, UPGRADE] = -1
+            self.fortress[g, t] = cell
+
+        pawns.keep(~arrived)
+
+    def order(self, team: int, actions: np.ndarray):
+        """Apply one ``(command, subject, to)`` per game for ``team``."""
+        command, subject, to = actions[:, 0], actions[:, 1], actions[:, 2]
+        games = np.arange(self.n_games)
+        cell = self.fortress[games, subject]
+        owned = cell[:, TEAM] == team
+
+        # deliver
+        deliver = (command == 1) & owned & (cell[:, PAWNS] >= 2) & _connected[subject, to]
+        if deliver.any():
+            g, s, t = games[deliver], subject[deliver], to[deliver]
+            half = self.fortress[g, s, PAWNS] // 2
+            self.spawning.extend(
+                game=g,
+                team=team,
+                kind=self.fortress[g, s, KIND],
+                count=half,
+                from_=s,
+                to=t,
+            )
+            self.fortress[g, s, PAWNS] -= half
+
+        # upgrade
+        level = cell[:, LEVEL].astype(np.intp)
+        cost = _limit[level] // 2
+        upgrade = (
+            (command == 2)
+            & owned
+            & (cell[:, PAWNS] >= cost)
+            & (cell[:, UPGRADE] == -1)
+            & (level >= 1)
+            & (level <= 4)
+        )
+        if upgrade.any():
+            g, s = games[upgrade], subject[upgrade]
+            self.fortress[g, s, UPGRADE] = 200
+            self.fortress[g, s, PAWNS] -= cost[upgrade]
+
+    def pawn_departure(self):
+        """Release one pawn from every spawn point whose cadence hits this step."""
+        spawns = self.spawning
+        if spawns.n == 0:
+            return
+        step = self.steps[spawns.game]
+        kind = spawns.kind
+        due = (spawns.count > 0) & np.where(kind == 0, step % 7 == 0, step % 10 == 0)
+        idx = np.flatnonzero(due)
+        if len(idx):
+            from_ = spawns.from_[idx].astype(np.intp)
+            to = spawns.to[idx].astype(np.intp)
+            direction = edge_direction[from_, to]
+            r = (self.rng.random(len(idx)) - 0.5) * 10
+            base = _spawn_xy[from_, to]
+            velocity = direction * pawn_speed[kind[idx]][:, None]
+            x = base[:, 0] + direction[:, 1] * r
+            y = base[:, 1] - direction[:, 0] * r
+            self.moving.extend(
+                game=spawns.game[idx],
+                team=spawns.team[idx],
+                kind=kind[idx],
+                to=to,
+                x=x,
+                y=y,
+                vx=velocity[:, 0],
+                vy=velocity[:, 1],
+                left=arrival_steps(kind[idx].astype(np.intp), from_, to, x, y),
+            )
+            spawns.count[idx] -= 1
+        spawns.keep(spawns.count > 0)
+
+    def pawn_born(self):
+        """Pawns regenerate over time."""
+        kind = self.fortress[:, :, KIND].astype(np.intp)
+        level = self.fortress[:, :, LEVEL].astype(np.intp)
+        limit = _limit[level]
+        pawns = self.fortress[:, :, PAWNS]
+        born = (self.steps[:, None] % _cool[kind, level] == 0) & (pawns < limit)
+        pawns[born] = np.minimum(pawns[born] + 1, limit[born])
+
+    def pawn_over(self):
+        """Remove pawns exceeding fortress limit every 40 steps."""
+        due = self.steps % 40 == 0
+        if not due.any():
+            return
+        limit = _limit[self.fortress[:, :, LEVEL].astype(np.intp)]
+        pawns = self.fortress[:, :, PAWNS]
+        pawns[due[:, None] & (pawns > limit)] -= 1
+
+    def check_upgrade(self):
+        """Count upgrades down and level up the ones that finished."""
+        upgrade = self.fortress[:, :, UPGRADE]
+        finished = upgrade == 0
+        upgrade[upgrade > 0] -= 1
+        upgrade[finished] = -1
+        self.fortress[:, :, LEVEL][finished] += 1
+
+    def reset(self, games: np.ndarray):
+        """Restart the given game slots from the initial layout."""
+        self.fortress[games] = _initial
+        self.steps[games] = 0
+        mask = np.zeros(self.n_games, dtype=bool)
+        mask[games] = True
+        self.moving.keep(~mask[self.moving.game])
+        self.spawning.keep(~mask[self.spawning.game])
+
+    def step(self, actions, opponent_actions=None) -> np.ndarray:
+        """Advance every game by one step.
+
+        Args:
+            actions: ``(n_games, 3)`` commands for team 1 (blue, bottom).
+            opponent_actions: ``(n_games, 3)`` commands for team 2 given from
+                its own flipped perspective, like ``controller2`` in ``Engine``.
+                ``None`` means team 2 does nothing.
+
+        Returns:
+            Boolean ``(n_games,)`` array of games that ended on this step.
+            Their results are in ``winner``/``blue``/``red``/``length`` and
+            the slots have already been reset.
+        """
+        self.pawn_move()
+
+        self.order(1, np.asarray(actions, dtype=np.intp))
+        if opponent_actions is not None:
+            opponent = np.array(opponent_actions, dtype=np.intp)
+            opponent[:, 1:] = _swap[opponent[:, 1:]]
+            self.order(2, opponent)
+
+        self.pawn_departure()
+        self.pawn_born()
+        self.pawn_over()
+        self.check_upgrade()
+
+        self.steps += 1
+        self.total_steps += self.n_games
+
+        blue, red = self.fortress_counts()
+        done = (blue == 0) | (red == 0) | (self.steps >= STEPLIMIT)
+        if done.any():
+            games = np.flatnonzero(done)
+            self.winner[games] = np.where(blue[games] > red[games], 1, 0)
+            self.winner[games[red[games] > blue[games]]] = 2
+            self.blue[games] = blue[games]
+            self.red[games] = red[games]
+            self.length[games] = self.steps[games]
+            self.episodes += len(games)
+            self.reset(games)
+        return done
+
+
+def benchmark(n_games: int = 256, n_steps: int = 2000, seed=0) -> float:
+    """Return total simulation steps per second across all games with random play."""
+    env = VectorEngine(n_games, seed=seed)
+    rng = np.random.default_rng(seed)
+    start = time.perf_counter()
+    for _ in range(n_steps):
+        actions = np.zeros((n_games, 2, 3), dtype=np.intp)
+        actions[:, :, 0] = rng.choice(3, size=(n_games, 2), p=[0.95, 0.04, 0.01])
+        actions[:, :, 1:] = rng.integers(0, n_fortress, size=(n_games, 2, 2))
+        env.step(actions[:, 0], actions[:, 1])
+    return env.total_steps / (time.perf_counter() - start)
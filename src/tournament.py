@@ -8,30 +8,97 @@ src/tcg/players/ ディレクトリ内の全AIプレイヤーを自動検出し
     uv run python tournament.py
 
 オプション:
-    - トーナメント形式: TOURNAMENT_MODE = "swiss" または "round_robin"
+    - トーナメント形式: TOURNAMENT_MODE = "swiss" / "round_robin" / "adaptive" / "gauntlet"
+      （adaptive: 各対戦カードを勝敗がはっきりするまで陣営を入れ替えながら戦う）
+      （gauntlet: GAUNTLET_CANDIDATE の1人だけが他の全員と戦い、合格/不合格を判定する）
     - ウィンドウ表示: ENABLE_WINDOW を True/False に設定
+    - ウィンドウ表示時の再生速度: WINDOW_STEPS_PER_SECOND（None なら最速）
     - スイス式ラウンド数: SWISS_ROUNDS を変更
+    - 1手の思考時間上限: MOVE_DEADLINE（秒）と DEADLINE_ISOLATION を設定
+    - プレイヤーを別プロセスで実行: PLAYER_PROCESSES を True に設定
+    - リプレイの保存: REPLAY_DIR に保存先ディレクトリを設定
+    - 再現可能な実行: TOURNAMENT_SEED に整数を設定（同じシードなら同じ結果）
+    - 並列実行: WORKERS にプロセス数を設定（ウィンドウ表示なしのときのみ）
+    - 結果キャッシュ: RESULT_CACHE にファイル名を設定（コードが変わっていない対戦は再実行しない。
+      MOVE_DEADLINE 設定時は使わない）
+    - 結果の書き出し: RESULTS_LOG にファイル名を設定（1試合・1ラウンドごとに JSON Lines で追記）
 """
 
-from collections import defaultdict
-from itertools import combinations
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from itertools import combinations, count
+from multiprocessing.util import Finalize
+import os
+from pathlib import Path
 import random
+import time
 
-import pygame
-
+from tcg.budget import TimedController
 from tcg.controller import Controller
-from tcg.game import Game
-from tcg.players import discover_players
+from tcg.engine import Engine
+from tcg.events import EventEngine
+from tcg.players import PlayerSpec, discover_players
+from tcg.remote import RemoteController
+from tcg.replay import Replay
+from tcg.results import ResultStore
+from tcg.standings import ResultLog, Standings
+from tcg.stats import PairTest, wilson_interval
+from tcg.swiss import pair_round
 
 # トーナメント設定
-TOURNAMENT_MODE = "swiss"  # "swiss" または "round_robin"
+TOURNAMENT_MODE = "swiss"  # "swiss" / "round_robin" / "adaptive" / "gauntlet"
 SWISS_ROUNDS = None  # None の場合は自動計算（ceil(log2(player_count)) * 2）
 MATCHES_PER_PAIR = 2  # 各対戦カードで実行する試合数（round_robin用）
+ADAPTIVE_TEST = "sprt"  # adaptive の打ち切り判定: "sprt"（逐次確率比検定）または "wilson"
+ADAPTIVE_MAX_GAMES = 20  # adaptive で1つの対戦カードに使う最大試合数（接戦の上限）
+GAUNTLET_CANDIDATE = None  # gauntlet で評価するプレイヤー（チーム名またはクラス名）
+GAUNTLET_THRESHOLD = 0.5  # gauntlet の合格ライン（相手全員に対する得点率）
+GAUNTLET_MAX_GAMES = 60  # gauntlet の最大試合数。判定がつかなければここで打ち切る
+GAUNTLET_SEED = 0  # gauntlet で TOURNAMENT_SEED が None のときに使う大会のシード
 ENABLE_WINDOW = False  # ウィンドウ表示の有効/無効
+WINDOW_STEPS_PER_SECOND = 1200  # ウィンドウ表示時の1秒あたりのステップ数。None なら最速
+MOVE_DEADLINE = None  # 1手あたりの思考時間上限（秒）。超過した手は何もしない扱い。None なら無制限
+DEADLINE_ISOLATION = "thread"  # "thread" または "process"（別プロセスで実行）
+PLAYER_PROCESSES = False  # True なら各プレイヤーを別プロセスで動かし、盤面は共有メモリで渡す
+REPLAY_DIR = None  # 試合のリプレイ（*.tcgr）を保存するディレクトリ。None なら保存しない
+TOURNAMENT_SEED = None  # 整数なら各試合のシードをここから決める。None なら毎回ランダム
+WORKERS = 1  # 試合を並列実行するプロセス数。None なら CPU コア数。1 なら順番に実行
+RESULT_CACHE = None  # 試合結果の SQLite ファイル。TOURNAMENT_SEED 指定かつ MOVE_DEADLINE なしで使う
+RESULTS_LOG = None  # 試合・ラウンドごとの結果を追記する JSON Lines ファイル。None なら書き出さない
+
+
+def create_player(player: PlayerSpec) -> Controller:
+    """プレイヤーを生成する（PLAYER_PROCESSES が True なら別プロセス上に生成）"""
+    if PLAYER_PROCESSES:
+        return RemoteController(player)
+    return player()
+
+
+def match_seed(
+    player1_name: str, player2_name: str, game: int = 1, tournament_seed: int | None = None
+) -> int | None:
+    """
+    対戦カードから試合のシードを決める（大会のシードが None なら None）
+
+    試合番号ではなく「誰と誰の何試合目か」で決めるので、参加者や組み合わせが変わっても
+    同じ対戦は同じシードになり、結果キャッシュがそのまま使える。
+    大会のシードは tournament_seed、省略時は TOURNAMENT_SEED を使う。
+    """
+    if tournament_seed is None:
+        tournament_seed = TOURNAMENT_SEED
+    if tournament_seed is None:
+        return None
+    key = f"{tournament_seed}/{player1_name}/{player2_name}/{game}"
+    return random.Random(key).getrandbits(63)
 
 
 def run_match(
-    player1: Controller, player2: Controller, match_id: int = 1, window: bool = True
+    player1: Controller,
+    player2: Controller,
+    match_id: int = 1,
+    window: bool = True,
+    deadline: float | None = MOVE_DEADLINE,
+    seed: int | None = None,
+    warm: "WarmPlayers | None" = None,
 ) -> dict:
     """
     1試合を実行して結果を返す
@@ -41,6 +108,9 @@ def run_match(
         player2: プレイヤー2（赤/上側）
         match_id: 試合番号
         window: ウィンドウ表示の有効/無効
+        deadline: 1手あたりの思考時間上限（秒）。None なら無制限
+        seed: 試合のシード。プレイヤー・シード・陣営が同じなら結果も同じ。None ならランダム
+        warm: 指定するとエンジンをここから使い回し、ここが持つプレイヤーは試合後も閉じない
 
     Returns:
         dict: 試合結果
@@ -48,111 +118,339 @@ def run_match(
             - blue_fortresses: 青チームの要塞数
             - red_fortresses: 赤チームの要塞数
             - steps: 総ステップ数
+            - seed: 試合のシード
     """
-    game = Game(player1, player2, window=window)
-    game.run()
+    players = (player1, player2)
+    if deadline is not None:
+        player1 = TimedController(player1, deadline, DEADLINE_ISOLATION)
+        player2 = TimedController(player2, deadline, DEADLINE_ISOLATION)
+
+    try:
+        if window:
+            # pygame はウィンドウ表示時のみ読み込む
+            from tcg.game import Game
+
+            engine_class = Game
+            options = {"window": True, "steps_per_second": WINDOW_STEPS_PER_SECOND}
+        else:
+            # 両者とも毎ステップは呼ばれない設定なら、何も起きないステップを飛ばすエンジンを使う
+            sparse = player1.update_interval > 1 and player2.update_interval > 1
+            engine_class = EventEngine if sparse else Engine
+            options = {}
+        game = None if warm is None else warm.engines.get(engine_class)
+        if game is None:
+            game = engine_class(player1, player2, seed=seed, **options)
+            if warm is not None:
+                warm.engines[engine_class] = game
+        else:
+            game.reset(seed, player1, player2)
+        if REPLAY_DIR is not None:
+            game.recorder = Replay(game.seed, game.team1, game.team2)
+        if window:
+            game.run()
+        else:
+            game.run_headless()
+    finally:
+        if deadline is not None:
+            player1.close()
+            player2.close()
+        for player in players:
+            if warm is None or not warm.owns(player):
+                player.close()
+
+    if game.recorder is not None:
+        game.recorder.finish(game)
+        Path(REPLAY_DIR).mkdir(parents=True, exist_ok=True)
+        game.recorder.save(Path(REPLAY_DIR) / f"match_{match_id:04d}.tcgr")
 
     result = {
         "winner": game.win_team,
         "blue_fortresses": game.Blue_fortress,
         "red_fortresses": game.Red_fortress,
         "steps": game.step,
+        "seed": game.seed,
     }
 
     if not window:
         print(
             f"  Match {match_id}: {game.win_team} Win! "
-            f"(Blue: {game.Blue_fortress}, Red: {game.Red_fortress}, Steps: {game.step})"
+            f"(Blue: {game.Blue_fortress}, Red: {game.Red_fortress}, Steps: {game.step}, "
+            f"Seed: {game.seed})"
         )
+        if deadline is not None:
+            for player in (player1, player2):
+                q = player.latency_percentiles()
+                if q[50] is not None:
+                    print(
+                        f"    {player.team_name()}: p50 {q[50] * 1000:.2f}ms  "
+                        f"p90 {q[90] * 1000:.2f}ms  p99 {q[99] * 1000:.2f}ms  "
+                        f"時間切れ {player.missed}回"
+                    )
 
     return result
 
 
-def calculate_swiss_rounds(player_count: int) -> int:
-    """スイス式トーナメントのラウンド数を計算"""
-    import math
-    return max(3, math.ceil(math.log2(player_count)) * 2)
+def player_ref(player_class) -> str:
+    """プレイヤーを別プロセスに渡せる "module:qualname" 形式の文字列にする"""
+    return PlayerSpec.of(player_class).ref
+
 
+def load_player(ref: str) -> PlayerSpec:
+    """player_ref() の文字列からプレイヤーを作る（import は最初に生成するときまで遅らせる）"""
+    return PlayerSpec.from_ref(ref)
 
-def pair_swiss_round(
-    players_with_scores: list[dict], round_num: int, played_pairs: set
-) -> list[tuple]:
+
+class WarmPlayers:
     """
-    スイス式のペアリング を実行
+    試合をまたいで使い回すプレイヤーとエンジン
 
-    Args:
-        players_with_scores: プレイヤーと現在のスコアのリスト
-        round_num: ラウンド番号
-        played_pairs: 既に対戦した(player_i, player_j)のセット
+    reset() をオーバーライドしたプレイヤーは、1つのインスタンスを何試合でも使い回す
+    （重い準備は最初の1回だけ）。そうでないプレイヤーは前の試合の状態が残らないよう、
+    これまでどおり試合ごとに生成する。エンジンも種類ごとに1つを reset() して使い回す。
+    """
+
+    def __init__(self):
+        self.players = {}  # (ref, 陣営) -> 使い回すプレイヤー
+        self.engines = {}  # エンジンのクラス -> 使い回すエンジン
+
+    def get(self, player: PlayerSpec, side: int = 1) -> Controller:
+        """player のインスタンス（使い回せるものは前の試合と同じもの）"""
+        player = PlayerSpec.of(player)
+        if not player.reusable:
+            return create_player(player)
+        key = (player.ref, side)
+        if key not in self.players:
+            self.players[key] = create_player(player)
+        return self.players[key]
+
+    def pair(self, player1: PlayerSpec, player2: PlayerSpec) -> tuple[Controller, Controller]:
+        """1試合分の2人（同じプレイヤー同士の対戦では別々のインスタンス）"""
+        return self.get(player1), self.get(player2, 2 if player1 == player2 else 1)
+
+    def owns(self, player: Controller) -> bool:
+        return any(player is warm for warm in self.players.values())
+
+    def close(self):
+        for player in self.players.values():
+            player.close()
+        self.players.clear()
+        self.engines.clear()
+
+
+_worker_players = {}  # ワーカープロセス内のプレイヤー（ref -> PlayerSpec）。import は初回の試合で
+_worker_warm = None  # ワーカープロセス内で使い回すプレイヤーとエンジン
+
+
+def _warm() -> WarmPlayers:
+    global _worker_warm
+    if _worker_warm is None:
+        _worker_warm = WarmPlayers()
+        # ワーカーの終了時に使い回したプレイヤーを閉じる
+        Finalize(None, _worker_warm.close, exitpriority=10)
+    return _worker_warm
+
+
+def _play(
+    match_id: int, ref1: str, ref2: str, seed: int | None, deadline: float | None
+) -> tuple[dict, dict]:
+    """
+    ワーカープロセスで1試合を実行する
 
     Returns:
-        list[tuple]: (player_idx_1, player_idx_2)のペアリストのリスト
+        (試合結果, この試合中に増えた各プレイヤーの読み込み・生成時間 {ref: (import, 生成, 回数)})
     """
-    # スコアでソート（降順）
-    sorted_players = sorted(
-        players_with_scores,
-        key=lambda x: (x["score"], x["wins"], x["avg_fortresses"]),
-        reverse=True,
+    specs = {ref: _worker_players.setdefault(ref, load_player(ref)) for ref in (ref1, ref2)}
+    before = {ref: spec.times() for ref, spec in specs.items()}
+    warm = _warm()
+    player1, player2 = warm.pair(specs[ref1], specs[ref2])
+    result = run_match(
+        player1, player2, match_id, window=False, deadline=deadline, seed=seed, warm=warm
     )
+    times = {
+        ref: tuple(after - start for after, start in zip(spec.times(), before[ref]))
+        for ref, spec in specs.items()
+    }
+    return result, times
 
-    # プレイヤーインデックスを保持
-    player_indices = [p["original_idx"] for p in sorted_players]
 
-    pairs = []
-    used = set()
+class MatchRunner:
+    """
+    試合をまとめて実行する
+
+    workers が 2 以上でウィンドウ表示なしなら、試合をプロセスプールに投げて並列に実行する。
+    各ワーカーはプレイヤーの試合が最初に回ってきたときに一度だけ import し、
+    その読み込み・生成時間は players の PlayerSpec に集計する。
+    reset() をオーバーライドしたプレイヤーとエンジンは、各ワーカー（順番に実行するときは
+    このオブジェクト）の中で使い回す（WarmPlayers）。
+    試合のシードは対戦カードから決まるので、実行順が変わっても各試合の結果は同じになる。
+    cache を指定すると、プレイヤーのコード・エンジン・シード・陣営が同じ試合は
+    保存済みの結果を使い、実行しない。ただし MOVE_DEADLINE を設定した試合は結果が
+    マシンの負荷で変わるので、キャッシュは使わない。
+    プールに投げておく試合は workers の数倍までなので、試合を1つずつ作るジェネレーターを
+    渡せば、試合数がいくら多くても全試合を一度にメモリに持たずに済む。
+    """
 
-    for i, player_idx in enumerate(player_indices):
-        if player_idx in used:
-            continue
+    def __init__(
+        self,
+        players: list[PlayerSpec],
+        window: bool,
+        workers: int | None = 1,
+        cache: str | None = None,
+    ):
+        self.window = window
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self.specs = {player_ref(player): PlayerSpec.of(player) for player in players}
+        self.pool = None
+        if workers > 1 and not window:
+            self.pool = ProcessPoolExecutor(workers)
+        self.max_pending = workers * 4  # 同時にプールに投げておく試合数の上限
+        self.deadline = MOVE_DEADLINE
+        if cache is not None and self.deadline is not None:
+            print("MOVE_DEADLINE を設定しているので、結果キャッシュは使いません")
+            cache = None
+        self.cache = None if cache is None else ResultStore(cache)
+        self.cached = 0  # キャッシュから返した試合数
+        self.warm = WarmPlayers()  # 順番に実行するときに使い回すプレイヤーとエンジン
+
+    def run(self, jobs):
+        """
+        試合を実行し、終わった順に (job, result) を返すジェネレーター
+
+        Args:
+            jobs: (match_id, player1_class, player2_class, seed, label) の並び。
+                label は開始時に表示。ジェネレーターでもよく、必要になった分だけ読み進める
+                （並列実行中の試合はワーカー数の数倍までなので、試合数が多くてもメモリは増えない）
+        """
+        futures = {}
+        try:
+            for job in jobs:
+                match_id, player1_class, player2_class, seed, label = job
+                result = None
+                if self.cache is not None:
+                    result = self.cache.get(player1_class, player2_class, seed)
+                if result is not None:
+                    self.cached += 1
+                    print(
+                        f"{label}  （キャッシュ: {result['winner']} Win, Steps: {result['steps']}）"
+                    )
+                    yield job, result
+                    continue
+
+                print(label)
+                if self.pool is None:
+                    player1, player2 = self.warm.pair(player1_class, player2_class)
+                    result = run_match(
+                        player1,
+                        player2,
+                        match_id,
+                        window=self.window,
+                        deadline=self.deadline,
+                        seed=seed,
+                        warm=self.warm,
+                    )
+                    self._store(player1_class, player2_class, seed, result)
+                    yield job, result
+                    continue
+
+                future = self.pool.submit(
+                    _play,
+                    match_id,
+                    player_ref(player1_class),
+                    player_ref(player2_class),
+                    seed,
+                    self.deadline,
+                )
+                futures[future] = job
+                if len(futures) >= self.max_pending:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield self._collect(futures.pop(future), future)
+
+            for future in as_completed(list(futures)):
+                yield self._collect(futures.pop(future), future)
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _collect(self, job: tuple, future) -> tuple[tuple, dict]:
+        _, player1_class, player2_class, seed, _ = job
+        result, times = future.result()
+        for ref, (import_seconds, construct_seconds, constructed) in times.items():
+            if ref in self.specs:
+                self.specs[ref].add_times(import_seconds, construct_seconds, constructed)
+        self._store(player1_class, player2_class, seed, result)
+        return job, result
+
+    def _store(self, player1_class, player2_class, seed, result: dict):
+        if self.cache is not None:
+            self.cache.put(player1_class, player2_class, seed, result)
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+        self.warm.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def in_match_order(games, first: int = 1):
+    """
+    MatchRunner.run() の (job, result) を試合番号の順に並べ直すジェネレーター
 
-        # 同じスコア帯のプレイヤーを探す
-        current_score = sorted_players[i]["score"]
-        for j in range(i + 1, len(player_indices)):
-            opponent_idx = player_indices[j]
-            if opponent_idx in used:
-                continue
-
-            opponent_score = sorted_players[j]["score"]
-
-            # スコア差が大きすぎない、かつまだ対戦していない場合
-            if abs(current_score - opponent_score) <= 3:
-                pair = tuple(sorted([player_idx, opponent_idx]))
-                if pair not in played_pairs:
-                    pairs.append((player_idx, opponent_idx))
-                    used.add(player_idx)
-                    used.add(opponent_idx)
-                    break
-
-        # マッチングできなかった場合、最初の未使用プレイヤーと対戦
-        if player_idx not in used:
-            for j in range(i + 1, len(player_indices)):
-                opponent_idx = player_indices[j]
-                if opponent_idx not in used:
-                    pair = tuple(sorted([player_idx, opponent_idx]))
-                    if pair not in played_pairs:
-                        pairs.append((player_idx, opponent_idx))
-                        used.add(player_idx)
-                        used.add(opponent_idx)
-                        break
-
-    return pairs
+    先に終わった試合は、それより前の試合が全部終わるまで持っておく。
+    試合番号は first からの連番であること。順位表やレーティングに入れる順番が
+    workers や終わった順によらなくなる。
+    """
+    arrived = {}  # 先に終わった試合（match_id -> (job, result)）
+    next_id = first
+    for job, result in games:
+        arrived[job[0]] = (job, result)
+        while next_id in arrived:
+            yield arrived.pop(next_id)
+            next_id += 1
+
+
+def calculate_swiss_rounds(player_count: int) -> int:
+    """スイス式トーナメントのラウンド数を計算"""
+    import math
+    return max(3, math.ceil(math.log2(player_count)) * 2)
 
 
 def run_swiss_tournament(
-    players: list[type[Controller]], rounds: int = None, window: bool = True
+    players: list[PlayerSpec],
+    rounds: int = None,
+    window: bool = True,
+    workers: int | None = WORKERS,
+    cache: str | None = RESULT_CACHE,
+    log: str | None = RESULTS_LOG,
 ):
     """
     スイス式トーナメントを実行
 
+    スコアと成績は試合結果ごとに差分で更新するので、数千人規模でも
+    ラウンドごとの集計し直しは発生しない。同じ相手とは再戦せず、ペアを組めなかった
+    プレイヤーはそのラウンドは対戦しない（得点なし）。
+
     Args:
-        players: プレイヤークラスのリスト
+        players: プレイヤーのリスト（PlayerSpec またはプレイヤークラス）
         rounds: ラウンド数（Noneの場合は自動計算）
         window: ウィンドウ表示の有効/無効
+        workers: 並列実行するプロセス数（同じラウンドの試合を並列に実行）
+        cache: 試合結果キャッシュの SQLite ファイル（None なら使わない）
+        log: 結果を書き出す JSON Lines ファイル（None なら書き出さない）
     """
     if len(players) < 2:
         print("エラー: 最低2人のプレイヤーが必要です")
         return
 
+    players = [PlayerSpec.of(player) for player in players]
     if rounds is None:
         rounds = calculate_swiss_rounds(len(players))
 
@@ -160,9 +458,11 @@ def run_swiss_tournament(
     print("要塞征服ゲーム スイス式トーナメント")
     print("=" * 70)
     print(f"\n参加プレイヤー: {len(players)}人")
+    player_classes = {}
     for i, player_class in enumerate(players, 1):
-        player = player_class()
-        print(f"  {i}. {player.team_name()} ({player_class.__name__})")
+        player_name = player_class.name
+        player_classes[player_name] = player_class
+        print(f"  {i}. {player_name} ({player_class.qualname})")
 
     print(f"\nラウンド数: {rounds}")
     expected_matches = rounds * (len(players) // 2)
@@ -170,134 +470,66 @@ def run_swiss_tournament(
     print(f"ビジュアライゼーション: {'ON' if window else 'OFF'}")
     print("=" * 70)
 
-    # プレイヤー情報の初期化
-    player_stats = {}
-    player_classes = {}
-    for idx, player_class in enumerate(players):
-        player = player_class()
-        player_name = player.team_name()
-        player_stats[player_name] = {
-            "wins": 0,
-            "draws": 0,
-            "losses": 0,
-            "matches": 0,
-            "total_fortresses": 0,
-            "original_idx": idx,
-        }
-        player_classes[player_name] = player_class
-
-    played_pairs = set()
+    standings = Standings(player_classes)
+    names = {player_class: name for name, player_class in player_classes.items()}
+    played_pairs = set()  # frozenset({player1_name, player2_name})
     match_count = 0
 
-    # 各ラウンドを実行
-    for round_num in range(1, rounds + 1):
-        print(f"\n【ラウンド {round_num}】")
-
-        # スコア計算
-        players_with_scores = []
-        for player_name, stats in player_stats.items():
-            score = stats["wins"] * 3 + stats["draws"]
-            avg_fortresses = (
-                stats["total_fortresses"] / stats["matches"]
-                if stats["matches"] > 0
-                else 0
-            )
-            players_with_scores.append(
-                {
-                    "name": player_name,
-                    "score": score,
-                    "wins": stats["wins"],
-                    "avg_fortresses": avg_fortresses,
-                    "original_idx": stats["original_idx"],
-                }
-            )
+    def rank_key(name):
+        totals = standings.totals[name]
+        fortresses = totals["total_fortresses"] / totals["matches"] if totals["matches"] else 0
+        return standings.points[name], totals["wins"], fortresses
 
-        # ペアリング
-        pairs = pair_swiss_round(players_with_scores, round_num, played_pairs)
-
-        if not pairs:
-            print("  対戦ペアが見つかりません")
-            break
-
-        # 各ペアの対戦を実行
-        for player1_name_idx, player2_name_idx in pairs:
-            # インデックスからプレイヤーを取得
-            player1_name = next(
-                name
-                for name, stats in player_stats.items()
-                if stats["original_idx"] == player1_name_idx
-            )
-            player2_name = next(
-                name
-                for name, stats in player_stats.items()
-                if stats["original_idx"] == player2_name_idx
-            )
-
-            print(f"  {player1_name} vs {player2_name}")
-
-            # 対戦実行
-            result = run_match(
-                player_classes[player1_name](),
-                player_classes[player2_name](),
-                match_count + 1,
-                window=window,
-            )
-            match_count += 1
-
-            # 統計更新
-            player_stats[player1_name]["matches"] += 1
-            player_stats[player2_name]["matches"] += 1
-            player_stats[player1_name]["total_fortresses"] += result["blue_fortresses"]
-            player_stats[player2_name]["total_fortresses"] += result["red_fortresses"]
-
-            if result["winner"] == "Blue":
-                player_stats[player1_name]["wins"] += 1
-                player_stats[player2_name]["losses"] += 1
-            elif result["winner"] == "Red":
-                player_stats[player2_name]["wins"] += 1
-                player_stats[player1_name]["losses"] += 1
-            else:
-                player_stats[player1_name]["draws"] += 1
-                player_stats[player2_name]["draws"] += 1
-
-            # 既に対戦したペアを記録
-            played_pairs.add(
-                tuple(sorted([player_stats[player1_name]["original_idx"],
-                             player_stats[player2_name]["original_idx"]]))
-            )
+    # 各ラウンドを実行
+    with MatchRunner(players, window, workers, cache) as runner, ResultLog(log) as results:
+        results.write("start", mode="swiss", players=list(player_classes), rounds=rounds)
+        for round_num in range(1, rounds + 1):
+            print(f"\n【ラウンド {round_num}】")
+
+            # ペアリング（スコア順、同点は勝数・平均要塞数の順）
+            ranked = sorted(player_classes, key=rank_key, reverse=True)
+            pairs, unpaired = pair_round(ranked, standings.points, played_pairs)
+            if not pairs:
+                print("  対戦ペアが見つかりません")
+                break
+
+            # 各ペアの対戦を実行（同じラウンドの試合は並列に実行できる）
+            jobs = []
+            for player1_name, player2_name in pairs:
+                match_count += 1
+                jobs.append(
+                    (
+                        match_count,
+                        player_classes[player1_name],
+                        player_classes[player2_name],
+                        match_seed(player1_name, player2_name),
+                        f"  {player1_name} vs {player2_name}",
+                    )
+                )
+                # 既に対戦したペアを記録
+                played_pairs.add(frozenset((player1_name, player2_name)))
+
+            for (match_id, player1_class, player2_class, _, _), result in runner.run(jobs):
+                player1_name, player2_name = names[player1_class], names[player2_class]
+                standings.record(player1_name, player2_name, result)
+                results.match(match_id, player1_name, player2_name, result, round=round_num)
+
+            results.write("round", round=round_num, unpaired=unpaired, standings=standings.rows())
+
+        rankings = standings.rows()
+        rankings.sort(key=lambda x: (x["score"], x["wins"], x["avg_fortresses"]), reverse=True)
+        results.write("final", matches=match_count, standings=rankings)
 
     # 最終結果表示
     print("\n" + "=" * 70)
     print("トーナメント結果")
     print("=" * 70)
 
-    rankings = []
-    for player_name, stats in player_stats.items():
-        score = stats["wins"] * 3 + stats["draws"]
-        win_rate = stats["wins"] / stats["matches"] * 100 if stats["matches"] > 0 else 0
-        avg_fortresses = (
-            stats["total_fortresses"] / stats["matches"] if stats["matches"] > 0 else 0
-        )
-        rankings.append(
-            {
-                "name": player_name,
-                "score": score,
-                "wins": stats["wins"],
-                "draws": stats["draws"],
-                "losses": stats["losses"],
-                "matches": stats["matches"],
-                "win_rate": win_rate,
-                "avg_fortresses": avg_fortresses,
-            }
-        )
-
-    rankings.sort(key=lambda x: (x["score"], x["wins"], x["avg_fortresses"]), reverse=True)
-
     print(
         f"\n{'順位':<4} {'プレイヤー名':<20} {'スコア':<6} {'勝':<4} {'分':<4} {'敗':<4} "
-        f"{'勝率':<8} {'平均要塞数':<10}"
+        f"{'勝率':<8} {'平均要塞数':<10} {'Elo':>6}"
     )
-    print("-" * 70)
+    print("-" * 76)
     for rank, player in enumerate(rankings, 1):
         print(
             f"{rank:<4} "
@@ -306,8 +538,9 @@ def run_swiss_tournament(
             f"{player['wins']:<4} "
             f"{player['draws']:<4} "
             f"{player['losses']:<4} "
-            f"{player['win_rate']:>6.1f}% "
-            f"{player['avg_fortresses']:>10.2f}"
+            f"{player['win_rate'] * 100:>6.1f}% "
+            f"{player['avg_fortresses']:>10.2f} "
+            f"{player['elo']:>6.0f}"
         )
 
     print("\n" + "=" * 70)
@@ -316,15 +549,23 @@ def run_swiss_tournament(
 
 
 def run_round_robin_tournament(
-    players: list[type[Controller]], matches_per_pair: int = 2, window: bool = True
+    players: list[PlayerSpec],
+    matches_per_pair: int = 2,
+    window: bool = True,
+    workers: int | None = WORKERS,
+    cache: str | None = RESULT_CACHE,
+    log: str | None = RESULTS_LOG,
 ):
     """
     総当たり戦トーナメントを実行
 
     Args:
-        players: プレイヤークラスのリスト
+        players: プレイヤーのリスト（PlayerSpec またはプレイヤークラス）
         matches_per_pair: 各対戦で実行する試合数
         window: ウィンドウ表示の有効/無効
+        workers: 並列実行するプロセス数（全試合を並列に実行）
+        cache: 試合結果キャッシュの SQLite ファイル（None なら使わない）
+        log: 結果を書き出す JSON Lines ファイル（None なら書き出さない）
     """
     if len(players) < 2:
         print("エラー: 最低2人のプレイヤーが必要です")
@@ -334,81 +575,63 @@ def run_round_robin_tournament(
     print("=" * 70)
     print("要塞征服ゲーム 総当たり戦トーナメント")
     print("=" * 70)
+    players = [PlayerSpec.of(player) for player in players]
     print(f"\n参加プレイヤー: {len(players)}人")
     for i, player_class in enumerate(players, 1):
-        player = player_class()
-        print(f"  {i}. {player.team_name()} ({player_class.__name__})")
+        print(f"  {i}. {player_class.name} ({player_class.qualname})")
 
     print(f"\n各対戦: {matches_per_pair}試合")
     print(f"総試合数: {len(list(combinations(range(len(players)), 2))) * matches_per_pair}試合")
     print(f"ビジュアライゼーション: {'ON' if window else 'OFF'}")
     print("=" * 70)
 
-    # 統計情報を記録
-    stats = defaultdict(
-        lambda: {"wins": 0, "losses": 0, "draws": 0, "total_fortresses": 0, "matches": 0}
-    )
+    names = {player_class: player_class.name for player_class in players}
+    # 試合が終わる順番によらず順位表の並びが同じになるよう、登録順に登録しておく
+    standings = Standings(names.values())
+
+    def generate_jobs():
+        """全試合を1つずつ作る（全試合のリストをメモリに持たない）"""
+        match_id = 0
+        for i, j in combinations(range(len(players)), 2):
+            player1_class = players[i]
+            player2_class = players[j]
+            player1_name = names[player1_class]
+            player2_name = names[player2_class]
+
+            # 複数回対戦
+            for round_num in range(1, matches_per_pair + 1):
+                label = f"  Match {round_num}: {player1_name} vs {player2_name}"
+                if round_num == 1:
+                    label = f"\n【{player1_name} vs {player2_name}】\n" + label
+                match_id += 1
+                seed = match_seed(player1_name, player2_name, round_num)
+                yield match_id, player1_class, player2_class, seed, label
 
     # 総当たり戦
-    match_count = 0
-    for i, j in combinations(range(len(players)), 2):
-        player1_class = players[i]
-        player2_class = players[j]
-
-        player1_name = player1_class().team_name()
-        player2_name = player2_class().team_name()
-
-        print(f"\n【{player1_name} vs {player2_name}】")
-
-        # 複数回対戦
-        for round_num in range(1, matches_per_pair + 1):
-            print(f"  Match {round_num}: {player1_name} vs {player2_name}")
-            result = run_match(player1_class(), player2_class(), match_count + 1, window=window)
-            match_count += 1
-
-            # 統計更新
-            stats[player1_name]["matches"] += 1
-            stats[player2_name]["matches"] += 1
-            stats[player1_name]["total_fortresses"] += result["blue_fortresses"]
-            stats[player2_name]["total_fortresses"] += result["red_fortresses"]
-
-            if result["winner"] == "Blue":
-                stats[player1_name]["wins"] += 1
-                stats[player2_name]["losses"] += 1
-            elif result["winner"] == "Red":
-                stats[player2_name]["wins"] += 1
-                stats[player1_name]["losses"] += 1
-            else:
-                stats[player1_name]["draws"] += 1
-                stats[player2_name]["draws"] += 1
+    with MatchRunner(players, window, workers, cache) as runner, ResultLog(log) as results:
+        results.write(
+            "start",
+            mode="round_robin",
+            players=list(names.values()),
+            matches_per_pair=matches_per_pair,
+        )
+        # Elo は入れる順番で変わるので、試合番号の順に入れる
+        games = in_match_order(runner.run(generate_jobs()))
+        for (match_id, player1_class, player2_class, _, _), result in games:
+            player1_name, player2_name = names[player1_class], names[player2_class]
+            standings.record(player1_name, player2_name, result)
+            results.match(match_id, player1_name, player2_name, result)
+
+        # スコア順にソート（勝ち=3点、引き分け=1点、負け=0点）
+        rankings = standings.rows()
+        rankings.sort(key=lambda x: (x["score"], x["wins"], x["avg_fortresses"]), reverse=True)
+        results.write("final", matches=standings.matches, standings=rankings)
 
     # 結果表示
     print("\n" + "=" * 70)
     print("トーナメント結果")
     print("=" * 70)
 
-    # スコア計算（勝ち=3点、引き分け=1点、負け=0点）
-    rankings = []
-    for player_name, data in stats.items():
-        score = data["wins"] * 3 + data["draws"] * 1
-        win_rate = data["wins"] / data["matches"] * 100 if data["matches"] > 0 else 0
-        avg_fortresses = data["total_fortresses"] / data["matches"] if data["matches"] > 0 else 0
-        rankings.append(
-            {
-                "name": player_name,
-                "score": score,
-                "wins": data["wins"],
-                "draws": data["draws"],
-                "losses": data["losses"],
-                "matches": data["matches"],
-                "win_rate": win_rate,
-                "avg_fortresses": avg_fortresses,
-            }
-        )
-
-    # スコア順にソート
-    rankings.sort(key=lambda x: (x["score"], x["wins"], x["avg_fortresses"]), reverse=True)
-
     # ランキング表示
     print(
         f"\n{'順位':<4} {'プレイヤー名':<20} {'スコア':<6} {'勝':<4} {'分':<4} {'敗':<4} "
@@ -423,13 +646,346 @@ def run_round_robin_tournament(
             f"{player['wins']:<4} "
             f"{player['draws']:<4} "
             f"{player['losses']:<4} "
-            f"{player['win_rate']:>6.1f}% "
+            f"{player['win_rate'] * 100:>6.1f}% "
             f"{player['avg_fortresses']:>10.2f}"
         )
 
     print("\n" + "=" * 70)
-    print(f"総試合数: {match_count}試合")
+    print(f"総試合数: {standings.matches}試合")
+    print("=" * 70)
+
+
+def run_adaptive_tournament(
+    players: list[PlayerSpec],
+    method: str = ADAPTIVE_TEST,
+    max_games: int = ADAPTIVE_MAX_GAMES,
+    window: bool = True,
+    workers: int | None = WORKERS,
+    cache: str | None = RESULT_CACHE,
+    log: str | None = RESULTS_LOG,
+):
+    """
+    対戦カードごとに試合数を変える総当たり戦を実行
+
+    各カードは陣営を入れ替えながら2試合ずつ戦い、逐次検定（tcg.stats.PairTest）で
+    どちらが強いか判定できた時点で打ち切る。差がはっきりしないカードは max_games で打ち切る。
+    まだ判定の出ていない全カードの次の2試合をまとめて MatchRunner に渡すので並列実行できる。
+
+    Args:
+        players: プレイヤーのリスト（PlayerSpec またはプレイヤークラス）
+        method: "sprt" または "wilson"
+        max_games: 1カードあたりの最大試合数
+        window: ウィンドウ表示の有効/無効
+        workers: 並列実行するプロセス数
+        cache: 試合結果キャッシュの SQLite ファイル（None なら使わない）
+        log: 結果を書き出す JSON Lines ファイル（None なら書き出さない）
+    """
+    if len(players) < 2:
+        print("エラー: 最低2人のプレイヤーが必要です")
+        print(f"現在のプレイヤー数: {len(players)}人")
+        return
+
+    players = [PlayerSpec.of(player) for player in players]
+    names = [player_class.name for player_class in players]
+    pairs = list(combinations(range(len(players)), 2))
+
+    print("=" * 70)
+    print("要塞征服ゲーム 適応型総当たり戦")
+    print("=" * 70)
+    print(f"\n参加プレイヤー: {len(players)}人")
+    for i, player_class in enumerate(players, 1):
+        print(f"  {i}. {names[i - 1]} ({player_class.qualname})")
+    print(f"\n判定方法: {method}（1カード最大 {max_games}試合）")
+    print(f"ビジュアライゼーション: {'ON' if window else 'OFF'}")
+    print("=" * 70)
+
+    tests = {pair: PairTest(method, max_games=max_games) for pair in pairs}
+    standings = Standings(names)
+
+    match_count = 0
+    wave = 0
+    with MatchRunner(players, window, workers, cache) as runner, ResultLog(log) as results:
+        results.write("start", mode="adaptive", players=names, method=method, max_games=max_games)
+        while True:
+            jobs = []
+            sides = {}  # match_id -> (blue index, red index, pair)
+            for pair in pairs:
+                test = tests[pair]
+                if test.finished:
+                    continue
+                a, b = pair
+                # A と B が交互に青（下側）を持つ
+                game = test.games // 2 + 1
+                for blue, red in ((a, b), (b, a))[: max_games - test.games]:
+                    match_count += 1
+                    label = f"  {names[blue]} vs {names[red]} ({game}巡目)"
+                    seed = match_seed(names[blue], names[red], game)
+                    jobs.append((match_count, players[blue], players[red], seed, label))
+                    sides[match_count] = (blue, red, pair)
+            if not jobs:
+                break
+            wave += 1
+
+            # Elo は入れる順番で変わるので、試合番号の順に入れる
+            for (match_id, _, _, _, _), result in in_match_order(runner.run(jobs), jobs[0][0]):
+                blue, red, pair = sides[match_id]
+                blue_score = standings.record(names[blue], names[red], result)
+                tests[pair].update(blue_score if blue == pair[0] else 1 - blue_score)
+                results.match(match_id, names[blue], names[red], result, round=wave)
+
+            undecided = sum(not test.finished for test in tests.values())
+            results.write("round", round=wave, undecided=undecided, standings=standings.rows())
+
+        # 対戦カードごとの結果
+        pair_points = {name: 0.0 for name in names}
+        verdicts = []
+        for a, b in pairs:
+            test = tests[(a, b)]
+            decision = test.decision
+            if decision == "A":
+                verdict = f"{names[a]} の勝ち越し"
+                pair_points[names[a]] += 1
+            elif decision == "B":
+                verdict = f"{names[b]} の勝ち越し"
+                pair_points[names[b]] += 1
+            else:
+                verdict = "判定つかず（上限到達）"
+                pair_points[names[a]] += 0.5
+                pair_points[names[b]] += 0.5
+            verdicts.append((a, b, test, verdict))
+            results.write(
+                "pair",
+                a=names[a],
+                b=names[b],
+                games=test.games,
+                score_a=test.score,
+                decision=decision,
+            )
+
+        # 順位表: 勝ち越したカード数、次に得点率
+        rankings = standings.rows()
+        for player in rankings:
+            low, high = wilson_interval(player["wins"] + player["draws"] * 0.5, player["matches"])
+            player["pair_points"] = pair_points[player["name"]]
+            player["margin"] = (high - low) / 2
+        rankings.sort(key=lambda x: (x["pair_points"], x["score_rate"]), reverse=True)
+        results.write("final", matches=match_count, standings=rankings)
+
+    print("\n" + "=" * 70)
+    print("対戦カード別結果")
+    print("=" * 70)
+    for a, b, test, verdict in verdicts:
+        low, high = test.interval()
+        print(
+            f"  {names[a]} vs {names[b]}: {test.games}試合 "
+            f"{names[a]} の得点率 {test.score / test.games * 100:.0f}% "
+            f"[95%CI {low * 100:.0f}-{high * 100:.0f}%]  {verdict}"
+        )
+
+    print("\n" + "=" * 70)
+    print("トーナメント結果")
+    print("=" * 70)
+    print(
+        f"\n{'順位':<4} {'プレイヤー名':<20} {'勝越':<5} {'勝':<4} {'分':<4} {'敗':<4} "
+        f"{'試合':<5} {'得点率':<14}"
+    )
+    print("-" * 70)
+    for rank, player in enumerate(rankings, 1):
+        print(
+            f"{rank:<4} "
+            f"{player['name']:<20} "
+            f"{player['pair_points']:<5} "
+            f"{player['wins']:<4} "
+            f"{player['draws']:<4} "
+            f"{player['losses']:<4} "
+            f"{player['matches']:<5} "
+            f"{player['score_rate'] * 100:>5.1f}% ±{player['margin'] * 100:.1f}"
+        )
+
+    print("\n" + "=" * 70)
+    print(f"総試合数: {match_count}試合（固定回数なら {len(pairs) * max_games}試合）")
+    print("=" * 70)
+
+
+def run_gauntlet(
+    players: list[PlayerSpec],
+    candidate: str,
+    threshold: float = GAUNTLET_THRESHOLD,
+    method: str = ADAPTIVE_TEST,
+    max_games: int = GAUNTLET_MAX_GAMES,
+    window: bool = True,
+    workers: int | None = WORKERS,
+    cache: str | None = RESULT_CACHE,
+    log: str | None = RESULTS_LOG,
+) -> str | None:
+    """
+    1人のプレイヤー（候補）を他の全員と戦わせ、得点率が合格ラインを超えるか判定する
+
+    候補は相手ごとに青と赤を1試合ずつ、相手を一巡するごとに次のシードで戦う。
+    シードは TOURNAMENT_SEED（None なら GAUNTLET_SEED）から決めるので、毎回同じ試合になる。
+    max_games が全員と両陣営で1試合ずつ戦うのに足りなければ、その試合数まで引き上げる。
+    全員と両陣営で1試合ずつ戦った後は、候補の通算得点率（勝ち=1、引き分け=0.5）が
+    threshold より上か下か逐次検定（tcg.stats.PairTest）で判定できた時点で打ち切る。
+    試合は並列に実行するが、検定には試合番号の順に結果を入れるので、判定は workers によらない。
+
+    Args:
+        players: プレイヤーのリスト（PlayerSpec またはプレイヤークラス。候補を含む）
+        candidate: 候補のチーム名またはクラス名
+        threshold: 合格ラインの得点率
+        method: "sprt" または "wilson"
+        max_games: 最大試合数
+        window: ウィンドウ表示の有効/無効
+        workers: 並列実行するプロセス数
+        cache: 試合結果キャッシュの SQLite ファイル（None なら使わない）
+        log: 結果を書き出す JSON Lines ファイル（None なら書き出さない）
+
+    Returns:
+        "pass"（合格）/ "fail"（不合格）/ None（判定つかず）
+    """
+    players = [PlayerSpec.of(player) for player in players]
+    names = {player_class: player_class.name for player_class in players}
+    candidate_class = next(
+        (c for c in players if candidate in (names[c], c.qualname)),
+        None,
+    )
+    if candidate_class is None:
+        print(f"エラー: 候補のプレイヤーが見つかりません: {candidate}")
+        print(f"参加プレイヤー: {', '.join(names.values())}")
+        return None
+    opponents = [c for c in players if c is not candidate_class]
+    if not opponents:
+        print("エラー: 対戦相手が必要です")
+        return None
+    candidate_name = names[candidate_class]
+    opponent_names = [names[c] for c in opponents]
+    seed = GAUNTLET_SEED if TOURNAMENT_SEED is None else TOURNAMENT_SEED
+    if max_games < 2 * len(opponents):
+        print(
+            f"最大試合数 {max_games} では全員と両陣営で戦えないので、"
+            f"{2 * len(opponents)}試合に引き上げます"
+        )
+        max_games = 2 * len(opponents)
+
+    print("=" * 70)
+    print("要塞征服ゲーム ガントレット")
+    print("=" * 70)
+    print(f"\n候補: {candidate_name} ({candidate_class.qualname})")
+    print(f"対戦相手: {len(opponents)}人")
+    for i, player_class in enumerate(opponents, 1):
+        print(f"  {i}. {names[player_class]} ({player_class.qualname})")
+    print(f"\n合格ライン: 得点率 {threshold * 100:.0f}%")
+    print(f"判定方法: {method}（最大 {max_games}試合）")
+    print(f"シード: {seed}")
+    print(f"ビジュアライゼーション: {'ON' if window else 'OFF'}")
+    print("=" * 70)
+
+    test = PairTest(
+        method,
+        min_games=2 * len(opponents),
+        max_games=max_games,
+        threshold=threshold,
+    )
+    standings = Standings([candidate_name] + opponent_names)
+
+    def generate_jobs():
+        """候補の試合を順番に作る（打ち切られたらそれ以上は作らない）"""
+        match_id = 0
+        for cycle in count(1):
+            for opponent in opponents:
+                for blue, red in ((candidate_class, opponent), (opponent, candidate_class)):
+                    match_id += 1
+                    if match_id > max_games:
+                        return
+                    label = f"  {names[blue]} vs {names[red]} ({cycle}巡目)"
+                    game_seed = match_seed(names[blue], names[red], cycle, seed)
+                    yield match_id, blue, red, game_seed, label
+
+    with MatchRunner(players, window, workers, cache) as runner, ResultLog(log) as results:
+        results.write(
+            "start",
+            mode="gauntlet",
+            candidate=candidate_name,
+            opponents=opponent_names,
+            threshold=threshold,
+            method=method,
+            max_games=max_games,
+            seed=seed,
+        )
+        games = runner.run(generate_jobs())
+        for (match_id, blue, red, _, _), result in in_match_order(games):
+            blue_name, red_name = names[blue], names[red]
+            blue_score = standings.record(blue_name, red_name, result)
+            test.update(blue_score if blue_name == candidate_name else 1 - blue_score)
+            results.match(match_id, blue_name, red_name, result)
+            if test.finished:
+                break
+        games.close()  # 判定がついた後の試合は取り消す
+
+        decision = test.decision
+        verdict = {"A": "pass", "B": "fail"}.get(decision)
+        low, high = test.interval()
+        results.write(
+            "final",
+            candidate=candidate_name,
+            verdict=verdict,
+            games=test.games,
+            score=test.score,
+            interval=[low, high],
+            standings=standings.rows(),
+        )
+
+    # 相手ごとの成績（相手は候補としか戦わないので、相手の負けが候補の勝ち）
+    print("\n" + "=" * 70)
+    print(f"{candidate_name} の対戦成績")
+    print("=" * 70)
+    print(f"\n{'対戦相手':<20} {'勝':<4} {'分':<4} {'敗':<4} {'試合':<5} {'得点率':<8}")
+    print("-" * 70)
+    for row in standings.rows():
+        if row["name"] == candidate_name or row["matches"] == 0:
+            continue
+        print(
+            f"{row['name']:<20} "
+            f"{row['losses']:<4} "
+            f"{row['draws']:<4} "
+            f"{row['wins']:<4} "
+            f"{row['matches']:<5} "
+            f"{(1 - row['score_rate']) * 100:>6.1f}%"
+        )
+
+    print("\n" + "=" * 70)
+    if test.games:
+        print(
+            f"通算: {test.games}試合 得点率 {test.score / test.games * 100:.1f}% "
+            f"[95%CI {low * 100:.1f}-{high * 100:.1f}%]"
+        )
+    else:
+        print("通算: 0試合")
+    if verdict == "pass":
+        print(f"判定: 合格（得点率 {threshold * 100:.0f}% を上回る）")
+    elif verdict == "fail":
+        print(f"判定: 不合格（得点率 {threshold * 100:.0f}% を下回る）")
+    else:
+        print(f"判定: 判定つかず（{max_games}試合の上限に到達）")
     print("=" * 70)
+    return verdict
+
+
+def print_load_times(players: list[PlayerSpec]):
+    """プレイヤーごとの import 時間と生成時間を表示する（並列実行時は全ワーカーの合計）"""
+    print("\nプレイヤーの読み込み時間")
+    print(f"{'プレイヤー名':<20} {'import':>10} {'生成回数':>8} {'生成（平均）':>12}")
+    print("-" * 70)
+    for player in players:
+        import_seconds, construct_seconds, constructed = player.times()
+        if constructed == 0:
+            print(f"{player.name:<20} {'（未使用）':>10}")
+            continue
+        print(
+            f"{player.name:<20} "
+            f"{import_seconds * 1000:>8.1f}ms "
+            f"{constructed:>8} "
+            f"{construct_seconds / constructed * 1000:>10.2f}ms"
+        )
 
 
 def main():
@@ -438,9 +994,11 @@ def main():
     players = []
 
     # src/tcg/players/ から自動検出
+    start = time.perf_counter()
     discovered_players = discover_players()
     players.extend(discovered_players)
-    print(f"発見したプレイヤー: {len(discovered_players)}人")
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"発見したプレイヤー: {len(discovered_players)}人（{elapsed:.1f}ms）")
 
     if len(players) == 0:
         print("\nエラー: プレイヤーが見つかりませんでした")
@@ -450,15 +1008,55 @@ def main():
 
     # トーナメント実行
     if TOURNAMENT_MODE == "swiss":
-        run_swiss_tournament(players, rounds=SWISS_ROUNDS, window=ENABLE_WINDOW)
+        run_swiss_tournament(
+            players,
+            rounds=SWISS_ROUNDS,
+            window=ENABLE_WINDOW,
+            workers=WORKERS,
+            cache=RESULT_CACHE,
+            log=RESULTS_LOG,
+        )
     elif TOURNAMENT_MODE == "round_robin":
-        run_round_robin_tournament(players, matches_per_pair=MATCHES_PER_PAIR, window=ENABLE_WINDOW)
+        run_round_robin_tournament(
+            players,
+            matches_per_pair=MATCHES_PER_PAIR,
+            window=ENABLE_WINDOW,
+            workers=WORKERS,
+            cache=RESULT_CACHE,
+            log=RESULTS_LOG,
+        )
+    elif TOURNAMENT_MODE == "adaptive":
+        run_adaptive_tournament(
+            players,
+            method=ADAPTIVE_TEST,
+            max_games=ADAPTIVE_MAX_GAMES,
+            window=ENABLE_WINDOW,
+            workers=WORKERS,
+            cache=RESULT_CACHE,
+            log=RESULTS_LOG,
+        )
+    elif TOURNAMENT_MODE == "gauntlet":
+        run_gauntlet(
+            players,
+            candidate=GAUNTLET_CANDIDATE,
+            threshold=GAUNTLET_THRESHOLD,
+            method=ADAPTIVE_TEST,
+            max_games=GAUNTLET_MAX_GAMES,
+            window=ENABLE_WINDOW,
+            workers=WORKERS,
+            cache=RESULT_CACHE,
+            log=RESULTS_LOG,
+        )
     else:
         print(f"エラー: 不明なトーナメント形式: {TOURNAMENT_MODE}")
         return
 
+    print_load_times(players)
+
     # Pygameの終了処理
     if ENABLE_WINDOW:
+        import pygame
+
         pygame.quit()
 
 
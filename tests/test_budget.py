@@ -0,0 +1,120 @@
+"""
+1手あたりの思考時間上限（src/tcg/budget.py）のテスト
+
+実行方法:
+    uv run python -m unittest discover -s tests
+"""
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tcg.budget import NOOP, TimedController  # noqa: E402
+from tcg.config import initial_state  # noqa: E402
+from tcg.controller import Controller  # noqa: E402
+
+DEADLINE = 0.05
+SLOW = 0.3  # 最初の1手だけこの秒数考える
+
+
+def _info():
+    return [1, [list(row) for row in initial_state], [], [], False]
+
+
+class SlowStart(Controller):
+    """最初の update だけ SLOW 秒かかり、reset が update と重なったら数える"""
+
+    def __init__(self):
+        self.calls = 0
+        self.busy = threading.Event()
+        self.overlaps = 0
+        self.sides = []
+
+    def team_name(self) -> str:
+        return "SlowStart"
+
+    def update(self, info):
+        self.busy.set()
+        self.calls += 1
+        time.sleep(SLOW if self.calls == 1 else 0)
+        self.busy.clear()
+        return 1, 0, 1
+
+    def reset(self, side, seed):
+        if self.busy.is_set():
+            self.overlaps += 1
+        self.sides.append(side)
+        super().reset(side, seed)
+
+
+class Broken(Controller):
+    def team_name(self) -> str:
+        return "Broken"
+
+    def update(self, info):
+        raise ValueError("boom")
+
+
+class TimedControllerTest(unittest.TestCase):
+    def run_slow_start(self, isolation):
+        player = TimedController(SlowStart(), DEADLINE, isolation)
+        self.addCleanup(player.close)
+        info = _info()
+        self.assertEqual(player.update(info), NOOP)
+        # 考え中の手が終わるまでは本人に聞かずに何もしない
+        self.assertEqual(player.update(info), NOOP)
+        time.sleep(SLOW)
+        self.assertEqual(player.update(info), (1, 0, 1))
+        return player
+
+    def test_thread_overrun_answers_noop_until_it_finishes(self):
+        player = self.run_slow_start("thread")
+        self.assertEqual(player.missed, 2)
+
+    def test_process_overrun_answers_noop_until_it_finishes(self):
+        player = self.run_slow_start("process")
+        self.assertEqual(player.missed, 2)
+
+    def test_overrun_is_recorded_with_its_real_duration(self):
+        for isolation in ("thread", "process"):
+            with self.subTest(isolation=isolation):
+                player = self.run_slow_start(isolation)
+                self.assertEqual(len(player.latencies), 2)
+                self.assertGreaterEqual(max(player.latencies), SLOW * 0.9)
+                self.assertGreaterEqual(player.latency_percentiles((100,))[100], SLOW * 0.9)
+
+    def test_thread_reset_waits_for_late_update(self):
+        bot = SlowStart()
+        player = TimedController(bot, DEADLINE, "thread")
+        self.addCleanup(player.close)
+        self.assertEqual(player.update(_info()), NOOP)
+        player.reset(2, 7)
+        time.sleep(SLOW)
+        self.assertEqual(player.update(_info()), (1, 0, 1))
+        self.assertEqual(bot.sides, [2])
+        self.assertEqual(bot.overlaps, 0)
+
+    def test_errors_reach_the_engine(self):
+        for isolation in ("thread", "process"):
+            with self.subTest(isolation=isolation):
+                player = TimedController(Broken(), 1.0, isolation)
+                self.addCleanup(player.close)
+                with self.assertRaisesRegex(Exception, "boom"):
+                    player.update(_info())
+
+    def test_unknown_isolation(self):
+        with self.assertRaises(ValueError):
+            TimedController(Broken(), 1.0, "fiber")
+
+    def test_percentiles_before_first_call(self):
+        player = TimedController(Broken(), 1.0)
+        self.addCleanup(player.close)
+        self.assertEqual(player.latency_percentiles(), {50: None, 90: None, 99: None})
+
+
+if __name__ == "__main__":
+    unittest.main()
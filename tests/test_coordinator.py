@@ -0,0 +1,131 @@
+"""
+分散トーナメント（src/coordinator.py）のテスト
+
+コーディネーターとワーカープロセスを localhost で動かし、リース切れの配り直しと
+ジャーナルからの再開を確かめる。
+
+実行方法:
+    uv run python -m unittest discover -s tests
+"""
+
+import json
+import multiprocessing
+import socket
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import coordinator  # noqa: E402
+import tournament  # noqa: E402
+from tcg.players import discover_players  # noqa: E402
+
+WORKERS = 2
+SEED = 11
+TIMEOUT = 300  # 全試合が終わるまで待つ上限（秒）
+
+
+def _players():
+    players = {player.name: player for player in discover_players()}
+    return [players["RandomPlayer"], players["Strategic"], players["Bob"]]
+
+
+def _run(coord: coordinator.Coordinator, stall: bool = False) -> list[dict]:
+    """
+    coord をサーバーとして起動し、WORKERS 個のワーカープロセスで全試合を終わらせる
+
+    stall が True なら、ワーカーより先に1つジョブを借りて返さない接続を作る。
+    そのジョブはリース切れで配り直されるはずなので、借りたジョブを返す。
+    """
+    server = coordinator._Server(("127.0.0.1", 0), coordinator._Handler)
+    server.coordinator = coord
+    port = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    stalled = []
+    staller = None
+    if stall:
+        staller = socket.create_connection(("127.0.0.1", port))
+        stream = staller.makefile("rw", encoding="utf-8")
+        stream.write(json.dumps({"type": "get"}) + "\n")
+        stream.flush()
+        stalled.append(json.loads(stream.readline())["job"])
+
+    workers = [
+        multiprocessing.Process(target=coordinator.run_worker, args=("127.0.0.1", port))
+        for _ in range(WORKERS)
+    ]
+    try:
+        for process in workers:
+            process.start()
+        finished = coord.finished.wait(TIMEOUT)
+        for process in workers:
+            process.join(TIMEOUT)
+    finally:
+        for process in workers:
+            if process.is_alive():
+                process.terminate()
+        if staller is not None:
+            staller.close()
+        server.shutdown()
+        server.server_close()
+        coord.close()
+    if not finished:
+        raise AssertionError("全試合が時間内に終わりませんでした")
+    return stalled
+
+
+class CoordinatorTest(unittest.TestCase):
+    def setUp(self):
+        self.jobs = coordinator.build_jobs(_players(), games_per_pair=2, seed=SEED)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.journal = str(Path(self.tmp.name) / "league.jsonl")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_build_jobs_leaves_tournament_seed_alone(self):
+        self.assertIsNone(tournament.TOURNAMENT_SEED)
+        again = coordinator.build_jobs(_players(), games_per_pair=2, seed=SEED)
+        self.assertEqual([job["id"] for job in again], [job["id"] for job in self.jobs])
+        self.assertEqual(len({job["id"] for job in self.jobs}), len(self.jobs))
+
+    def test_expired_lease_is_released_again(self):
+        coord = coordinator.Coordinator(self.jobs, lease=0.5)
+
+        def drain(worker):
+            return {job["id"] for job in iter(lambda: coord.lease(worker), None)}
+
+        job = coord.lease("a")
+        self.assertNotIn(job["id"], drain("b"))
+        time.sleep(0.6)
+        self.assertEqual(drain("c"), {job["id"] for job in self.jobs})
+
+    def test_workers_finish_after_lease_expiry_and_resume_from_journal(self):
+        coord = coordinator.Coordinator(self.jobs, self.journal, lease=2.0)
+        stalled = _run(coord, stall=True)
+        self.assertEqual(set(coord.results), {job["id"] for job in self.jobs})
+        self.assertIn(stalled[0]["id"], coord.results)
+        expected = dict(coord.results)
+
+        # 2試合分と書きかけの1行だけが残った状態から再開する
+        lines = Path(self.journal).read_text(encoding="utf-8").splitlines(keepends=True)
+        Path(self.journal).write_text("".join(lines[:2]) + lines[2][:10], encoding="utf-8")
+        resumed = coordinator.Coordinator(self.jobs, self.journal)
+        self.assertEqual(len(resumed.results), 2)
+        self.assertEqual(len(resumed.queue), len(self.jobs) - 2)
+        _run(resumed)
+        self.assertEqual(resumed.results, expected)
+
+        # 書きかけの行は再開時に消えるので、次の結果も読める
+        reloaded = coordinator.Coordinator(self.jobs, self.journal)
+        reloaded.close()
+        self.assertEqual(reloaded.results, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
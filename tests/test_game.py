@@ -0,0 +1,115 @@
+"""
+ウィンドウ表示（src/tcg/game.py）の描画キャッシュとペース配分のテスト
+
+SDL のダミードライバーで動かすので、画面がなくても実行できる。
+
+実行方法:
+    uv run python -m unittest discover -s tests
+"""
+
+import os
+import sys
+import time
+import unittest
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import pygame  # noqa: E402
+
+from tcg.config import FPS  # noqa: E402
+from tcg.controller import Human  # noqa: E402
+from tcg.game import Game  # noqa: E402
+
+BLANK = (990, 400)  # 道も要塞も文字もない画面上の点
+RATE = 300  # ペース配分のテストで使う1秒あたりのステップ数
+FRAMES = 15
+
+
+class FrameLimitedGame(Game):
+    """FRAMES 回描いたら終わる Game（ペース配分のテスト用）"""
+
+    frames = 0
+
+    def draw_frame(self):
+        super().draw_frame()
+        self.frames += 1
+        if self.frames >= FRAMES:
+            self.isGameOver = self.Overed = True
+
+
+class BackdropTest(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(Human(), Human(), window=True, seed=1)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_unchanged_board_is_not_redrawn(self):
+        self.assertTrue(self.game.draw_background())
+        self.assertFalse(self.game.draw_background())
+
+    def test_fade_uses_exact_colour_without_redrawing_the_board(self):
+        game = self.game
+        game.draw_background()
+        board = game.board
+        for step in range(1, 20):
+            game.back_color = [150 + step, 255 - step, 150]
+            self.assertTrue(game.draw_background())
+            self.assertIs(game.board, board)
+            self.assertEqual(tuple(game.background.get_at(BLANK))[:3], tuple(game.back_color))
+
+    def test_owner_change_redraws_the_board(self):
+        game = self.game
+        game.draw_background()
+        board = game.board
+        game.state[0][0] = 2
+        self.assertTrue(game.draw_background())
+        self.assertIsNot(game.board, board)
+
+    def test_text_is_rendered_once(self):
+        first = self.game.text(self.game.font, "Lv 1", (0, 0, 0))
+        self.assertIs(self.game.text(self.game.font, "Lv 1", (0, 0, 0)), first)
+
+    def test_frame_draws_after_reset(self):
+        self.game.draw_frame()
+        self.game.reset(seed=2)
+        self.assertIsNone(self.game.background_key)
+        self.game.draw_frame()
+        self.assertTrue(self.game.dirty)
+
+
+class PacingTest(unittest.TestCase):
+    def tearDown(self):
+        pygame.quit()
+
+    def test_simulate_stops_at_step_count(self):
+        game = Game(Human(), Human(), window=True, seed=1)
+        self.assertEqual(game.simulate(5, time.perf_counter() + 60), 5)
+        self.assertEqual(game.step, 5)
+
+    def test_simulate_stops_at_deadline_after_one_step(self):
+        game = Game(Human(), Human(), window=True, seed=1)
+        self.assertEqual(game.simulate(float("inf"), time.perf_counter()), 1)
+
+    def test_run_follows_the_wall_clock(self):
+        game = FrameLimitedGame(Human(), Human(), window=True, steps_per_second=RATE, seed=1)
+        start = time.perf_counter()
+        game.run()
+        elapsed = time.perf_counter() - start
+        self.assertEqual(game.frames, FRAMES)
+        # 経過時間ぶんのステップより先に進まず、遅れても2フレームぶんまで
+        self.assertLessEqual(game.step, RATE * elapsed + 1)
+        self.assertGreaterEqual(game.step, RATE * (elapsed - 2 / FPS))
+
+    def test_unpaced_run_uses_spare_time(self):
+        game = FrameLimitedGame(Human(), Human(), window=True, steps_per_second=None, seed=1)
+        start = time.perf_counter()
+        game.run()
+        elapsed = time.perf_counter() - start
+        self.assertGreater(game.step, RATE * elapsed)
+
+
+if __name__ == "__main__":
+    unittest.main()
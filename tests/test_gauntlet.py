@@ -0,0 +1,139 @@
+"""
+逐次検定（src/tcg/stats.py）とガントレット（src/tournament.py の run_gauntlet）のテスト
+
+実行方法:
+    uv run python -m unittest discover -s tests
+"""
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import tournament  # noqa: E402
+from tcg.players import discover_players  # noqa: E402
+from tcg.stats import EloRatings, PairTest, wilson_interval  # noqa: E402
+
+
+def _players():
+    players = {player.name: player for player in discover_players()}
+    return [players["Strategic"], players["RandomPlayer"], players["Bob"]]
+
+
+class PairTestTest(unittest.TestCase):
+    def test_sprt_accepts_the_stronger_side(self):
+        for score, decision in ((1.0, "A"), (0.0, "B")):
+            with self.subTest(score=score):
+                test = PairTest("sprt", max_games=100)
+                while not test.finished:
+                    test.update(score)
+                self.assertEqual(test.decision, decision)
+                self.assertLess(test.games, 10)
+
+    def test_draws_carry_no_evidence_at_even_threshold(self):
+        test = PairTest("sprt", max_games=30)
+        while not test.finished:
+            test.update(0.5)
+        self.assertIsNone(test.decision)
+        self.assertEqual(test.games, 30)
+        self.assertAlmostEqual(test.llr, 0.0)
+
+    def test_no_decision_before_min_games(self):
+        test = PairTest("sprt", min_games=8, max_games=20)
+        for _ in range(7):
+            test.update(1.0)
+        self.assertIsNone(test.decision)
+        test.update(1.0)
+        self.assertEqual(test.decision, "A")
+
+    def test_wilson_stops_once_threshold_is_outside_the_interval(self):
+        test = PairTest("wilson", max_games=100)
+        while not test.finished:
+            test.update(1.0)
+        self.assertEqual(test.decision, "A")
+        low, _ = test.interval()
+        self.assertGreater(low, 0.5)
+
+    def test_threshold_moves_the_verdict(self):
+        # 得点率 0.6 は 0.3 の合格ラインは超えるが、0.8 には届かない
+        for threshold, decision in ((0.3, "A"), (0.8, "B")):
+            with self.subTest(threshold=threshold):
+                test = PairTest("sprt", max_games=400, threshold=threshold, delta=0.1)
+                while not test.finished:
+                    test.update(1.0 if test.games % 5 < 3 else 0.0)
+                self.assertEqual(test.decision, decision)
+
+    def test_rejects_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            PairTest("bayes")
+        with self.assertRaises(ValueError):
+            PairTest(threshold=0.9, delta=0.15)
+
+    def test_wilson_interval_without_games(self):
+        self.assertEqual(wilson_interval(0, 0), (0.0, 1.0))
+
+
+class EloRatingsTest(unittest.TestCase):
+    def test_update_moves_points_between_players(self):
+        elo = EloRatings(k=16)
+        elo.update("a", "b", 1.0)
+        self.assertAlmostEqual(elo.rating("a"), 1508)
+        self.assertAlmostEqual(elo.rating("b"), 1492)
+        self.assertEqual([name for name, _ in elo.ranking()], ["a", "b"])
+
+
+class GauntletTest(unittest.TestCase):
+    def run_gauntlet(self, **kwargs):
+        with tempfile.TemporaryDirectory() as tmp:
+            log = Path(tmp) / "gauntlet.jsonl"
+            with contextlib.redirect_stdout(io.StringIO()) as out:
+                verdict = tournament.run_gauntlet(
+                    _players(), window=False, workers=1, cache=None, log=str(log), **kwargs
+                )
+            records = [json.loads(line) for line in log.read_text().splitlines()]
+        self.output = out.getvalue()
+        return verdict, records
+
+    def test_strong_candidate_passes_with_fixed_seeds(self):
+        verdict, records = self.run_gauntlet(candidate="Strategic")
+        self.assertEqual(verdict, "pass")
+        final = records[-1]
+        self.assertEqual((final["type"], final["verdict"]), ("final", "pass"))
+        seeds = [record["seed"] for record in records if record["type"] == "match"]
+        self.assertNotIn(None, seeds)
+        self.assertEqual(records[0]["seed"], tournament.GAUNTLET_SEED)
+
+        _, again = self.run_gauntlet(candidate="Strategic")
+        self.assertEqual([r["seed"] for r in again if r["type"] == "match"], seeds)
+
+    def test_every_opponent_is_played_on_both_sides(self):
+        verdict, records = self.run_gauntlet(candidate="Strategic", max_games=1)
+        self.assertIn("引き上げ", self.output)
+        self.assertEqual(records[0]["max_games"], 4)
+        sides = {(r["blue"], r["red"]) for r in records if r["type"] == "match"}
+        self.assertEqual(
+            sides,
+            {
+                ("Strategic", "RandomPlayer"),
+                ("RandomPlayer", "Strategic"),
+                ("Strategic", "Bob"),
+                ("Bob", "Strategic"),
+            },
+        )
+        self.assertIsNone(verdict)
+
+    def test_unknown_candidate(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            verdict = tournament.run_gauntlet(
+                _players(), candidate="Nobody", window=False, cache=None, log=None
+            )
+        self.assertIsNone(verdict)
+
+
+if __name__ == "__main__":
+    unittest.main()
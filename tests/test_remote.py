@@ -0,0 +1,115 @@
+"""
+別プロセスのプレイヤーと共有メモリ（src/tcg/remote.py）のテスト
+
+実行方法:
+    uv run python -m unittest discover -s tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tcg.controller import Controller  # noqa: E402
+from tcg.engine import Engine  # noqa: E402
+from tcg.players import discover_players  # noqa: E402
+from tcg.remote import RemoteController, _block_size, read_info, write_info  # noqa: E402
+
+SEED = 3
+
+
+def _players():
+    return {player.name: player for player in discover_players()}
+
+
+def _plain(info):
+    """info をビューを含まないタプルにする（比較用）"""
+    team, state, moving, spawning, done = info
+    return [
+        team,
+        tuple(tuple(row[:5]) + (tuple(row[5]),) for row in state),
+        tuple((t, k, f, to, tuple(pos)) for t, k, f, to, pos in moving),
+        tuple((t, k, n, f, to, tuple(pos)) for t, k, n, f, to, pos in spawning),
+        bool(done),
+    ]
+
+
+def _engine_info(steps):
+    players = _players()
+    engine = Engine(players["RandomPlayer"](), players["Strategic"](), seed=SEED)
+    for _ in range(steps):
+        engine.advance()
+    return [1, engine.state, engine.moving_pawns, engine.spawning_pawns, engine.done]
+
+
+class Counter(Controller):
+    """動いているポーンの数を返す"""
+
+    def team_name(self) -> str:
+        return "Counter"
+
+    def update(self, info):
+        return 0, len(info[2]), len(info[3])
+
+
+class ReturnsNone(Controller):
+    def team_name(self) -> str:
+        return "ReturnsNone"
+
+    def update(self, info):
+        return None
+
+
+class ReturnsFloat(Controller):
+    def team_name(self) -> str:
+        return "ReturnsFloat"
+
+    def update(self, info):
+        return 1, 0.5, 2
+
+
+class SharedMemoryTest(unittest.TestCase):
+    def test_block_round_trip(self):
+        info = _engine_info(600)
+        self.assertTrue(info[2], "ポーンが動いている局面で確かめる")
+        capacity = max(len(info[2]), len(info[3]))
+        buf = bytearray(_block_size(capacity))
+        write_info(buf, info, capacity)
+        self.assertEqual(_plain(read_info(buf, capacity)), _plain(info))
+
+    def test_block_grows_with_the_pawn_lists(self):
+        info = _engine_info(600)
+        player = RemoteController(Counter, capacity=1)
+        self.addCleanup(player.close)
+        self.assertEqual(player.update(info), (0, len(info[2]), len(info[3])))
+        self.assertGreaterEqual(player._capacity, len(info[2]))
+
+    def test_remote_match_matches_local_match(self):
+        players = _players()
+        local = Engine(players["Strategic"](), players["RandomPlayer"](), seed=SEED)
+        local.run_headless()
+        remote_player = RemoteController(players["Strategic"])
+        self.addCleanup(remote_player.close)
+        remote = Engine(remote_player, players["RandomPlayer"](), seed=SEED)
+        remote.run_headless()
+        self.assertEqual(remote.team1, local.team1)
+        self.assertEqual(
+            (remote.step, remote.win_team, remote.Blue_fortress, remote.Red_fortress),
+            (local.step, local.win_team, local.Blue_fortress, local.Red_fortress),
+        )
+
+    def test_malformed_command_is_an_error_and_the_player_survives(self):
+        info = _engine_info(0)
+        for factory in (ReturnsNone, ReturnsFloat):
+            with self.subTest(player=factory.__name__):
+                player = RemoteController(factory)
+                self.addCleanup(player.close)
+                for _ in range(2):
+                    with self.assertRaisesRegex(RuntimeError, factory.__name__):
+                        player.update(info)
+                self.assertTrue(player._process.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+試合結果キャッシュ（src/tcg/results.py）のキーのテスト
+
+実行方法:
+    uv run python -m unittest discover -s tests
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import tournament  # noqa: E402
+from tcg import results  # noqa: E402
+from tcg.players import PlayerSpec, discover_players  # noqa: E402
+from tcg.results import ResultStore, source_hash  # noqa: E402
+
+RESULT = {"winner": "Blue", "blue_fortresses": 12, "red_fortresses": 0, "steps": 100, "seed": 1}
+
+
+def _players():
+    players = {player.name: player for player in discover_players()}
+    return players["RandomPlayer"], players["Strategic"]
+
+
+class ResultStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ResultStore(str(Path(self.tmp.name) / "cache.sqlite"))
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        blue, red = _players()
+        self.store.put(blue, red, 1, RESULT)
+        self.assertEqual(self.store.get(blue, red, 1), RESULT)
+        self.assertIsNone(self.store.get(blue, red, 2))
+
+    def test_sides_are_part_of_the_key(self):
+        blue, red = _players()
+        self.store.put(blue, red, 1, RESULT)
+        self.assertIsNone(self.store.get(red, blue, 1))
+
+    def test_unseeded_matches_are_not_stored(self):
+        blue, red = _players()
+        self.store.put(blue, red, None, RESULT)
+        self.assertIsNone(self.store.get(blue, red, None))
+
+    def test_classes_sharing_a_file_have_different_keys(self):
+        blue, _ = _players()
+        other = PlayerSpec(blue.module, "OtherPlayer")
+        self.assertEqual(source_hash(blue), source_hash(other))
+        self.assertNotEqual(self.store.player_hash(blue), self.store.player_hash(other))
+
+    def test_engine_change_misses(self):
+        blue, red = _players()
+        self.store.put(blue, red, 1, RESULT)
+        self.store.engine = "another engine"
+        self.assertIsNone(self.store.get(blue, red, 1))
+
+
+class SourceHashTest(unittest.TestCase):
+    """tcg/players と同じ形の一時ディレクトリで、ソースの変更がハッシュに出るか確かめる"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        tcg = Path(tmp.name) / "tcg"
+        self.players = tcg / "players"
+        (self.players / "player_carol").mkdir(parents=True)
+        self.write("helpers.py", "X = 1\n")
+        self.write("unrelated.py", "Y = 1\n")
+        self.write("alice.py", "from .helpers import X\n")
+        self.write("player_carol/__init__.py", "from .player import Carol\n")
+        self.write("player_carol/player.py", "def f():\n    from tcg.players import helpers\n")
+        self.write("dave.py", "Z = 1\n")
+        for name, value in (("_TCG_DIR", tcg), ("_PLAYERS_DIR", self.players)):
+            patcher = mock.patch.object(results, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.specs = [
+            PlayerSpec("tcg.players.alice", "Alice"),
+            PlayerSpec("tcg.players.player_carol", "Carol"),
+            PlayerSpec("tcg.players.dave", "Dave"),
+        ]
+
+    def write(self, name, text):
+        (self.players / name).write_text(text, encoding="utf-8")
+
+    def hashes(self):
+        return [source_hash(spec) for spec in self.specs]
+
+    def test_shared_helper_change_changes_importers_only(self):
+        before = self.hashes()
+        self.write("helpers.py", "X = 2\n")
+        after = self.hashes()
+        self.assertNotEqual(after[0], before[0])
+        self.assertNotEqual(after[1], before[1])
+        self.assertEqual(after[2], before[2])
+
+    def test_unimported_module_change_keeps_hashes(self):
+        before = self.hashes()
+        self.write("unrelated.py", "Y = 2\n")
+        self.assertEqual(self.hashes(), before)
+
+    def test_own_package_change(self):
+        before = self.hashes()
+        self.write("player_carol/player.py", "def f():\n    return 1\n")
+        self.assertNotEqual(self.hashes()[1], before[1])
+
+
+class MatchRunnerCacheTest(unittest.TestCase):
+    def test_deadline_turns_the_cache_off(self):
+        with (
+            tempfile.TemporaryDirectory() as tmp,
+            mock.patch.object(tournament, "MOVE_DEADLINE", 0.1),
+        ):
+            path = str(Path(tmp) / "cache.sqlite")
+            with contextlib.redirect_stdout(io.StringIO()) as out:
+                with tournament.MatchRunner(_players(), False, 1, path) as runner:
+                    self.assertIsNone(runner.cache)
+                    self.assertEqual(runner.deadline, 0.1)
+            self.assertIn("キャッシュ", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+スイス式の組み合わせ（src/tcg/swiss.py）のテスト
+
+実行方法:
+    uv run python -m unittest discover -s tests
+"""
+
+import itertools
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tcg import swiss  # noqa: E402
+from tcg.swiss import pair_round  # noqa: E402
+
+
+def _played(*pairs):
+    return {frozenset(pair) for pair in pairs}
+
+
+def _most_pairs(players, played):
+    """総当たりで求めた、再戦なしで作れるペア数の最大値"""
+    if len(players) < 2:
+        return 0
+    first, rest = players[0], players[1:]
+    best = _most_pairs(rest, played)
+    for i, other in enumerate(rest):
+        if frozenset((first, other)) not in played:
+            best = max(best, 1 + _most_pairs(rest[:i] + rest[i + 1 :], played))
+    return best
+
+
+class PairRoundTest(unittest.TestCase):
+    def assertValidRound(self, ranked, pairs, unpaired, played):
+        seated = [player for pair in pairs for player in pair] + unpaired
+        self.assertEqual(sorted(seated), sorted(ranked))
+        for pair in pairs:
+            self.assertNotIn(frozenset(pair), played)
+
+    def test_first_round_pairs_top_half_with_bottom_half(self):
+        ranked = list(range(8))
+        pairs, unpaired = pair_round(ranked, dict.fromkeys(ranked, 0), set())
+        self.assertEqual(pairs, [(0, 4), (1, 5), (2, 6), (3, 7)])
+        self.assertEqual(unpaired, [])
+
+    def test_odd_field_leaves_one_player_out(self):
+        ranked = list(range(5))
+        pairs, unpaired = pair_round(ranked, dict.fromkeys(ranked, 0), set())
+        self.assertEqual(len(pairs), 2)
+        self.assertEqual(len(unpaired), 1)
+
+    def test_matching_pairs_field_where_swaps_fail(self):
+        # 5 は 1 としか当たれないが、貪欲法は 1 を 4 と組ませてしまい、
+        # 入れ替えでも 2 と 5 の行き先が見つからない
+        ranked = list(range(6))
+        played = _played((0, 5), (2, 4), (2, 5), (3, 5), (4, 5))
+        pairs, carry = swiss._pair_group(ranked, played)
+        self.assertEqual(swiss._repair(pairs, carry, played), [2, 5])
+
+        pairs, unpaired = pair_round(ranked, dict.fromkeys(ranked, 0), played)
+        self.assertValidRound(ranked, pairs, unpaired, played)
+        self.assertEqual(unpaired, [])
+        self.assertIn((1, 5), pairs)
+
+    def test_no_rematches_and_as_many_pairs_as_possible(self):
+        rng = random.Random(5)
+        for _ in range(300):
+            n = rng.randint(4, 10)
+            scores = dict.fromkeys(range(n), 0)
+            played = set()
+            for _ in range(n - 1):
+                ranked = sorted(scores, key=lambda p: -scores[p])
+                pairs, unpaired = pair_round(ranked, scores, played)
+                self.assertValidRound(ranked, pairs, unpaired, played)
+                self.assertEqual(len(pairs), _most_pairs(tuple(ranked), played))
+                if not pairs:
+                    break
+                for a, b in pairs:
+                    played.add(frozenset((a, b)))
+                    scores[rng.choice((a, b))] += 3
+
+    def test_everyone_sits_out_once_all_pairs_have_met(self):
+        ranked = list(range(4))
+        played = {frozenset(pair) for pair in itertools.combinations(ranked, 2)}
+        pairs, unpaired = pair_round(ranked, dict.fromkeys(ranked, 0), played)
+        self.assertEqual(pairs, [])
+        self.assertEqual(sorted(unpaired), ranked)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+トーナメントの並列実行（src/tournament.py の MatchRunner まわり）のテスト
+
+実行方法:
+    uv run python -m unittest discover -s tests
+"""
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import tournament  # noqa: E402
+from tcg.players import discover_players  # noqa: E402
+
+SEED = 5
+
+
+def _players():
+    players = {player.name: player for player in discover_players()}
+    return [players["RandomPlayer"], players["Strategic"], players["Bob"]]
+
+
+def _quiet(function, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(*args, **kwargs)
+
+
+class InMatchOrderTest(unittest.TestCase):
+    def test_reorders_by_match_id(self):
+        games = [((3,), "c"), ((1,), "a"), ((4,), "d"), ((2,), "b")]
+        ordered = list(tournament.in_match_order(games))
+        self.assertEqual([job[0] for job, _ in ordered], [1, 2, 3, 4])
+        self.assertEqual([result for _, result in ordered], ["a", "b", "c", "d"])
+
+    def test_starts_at_first(self):
+        games = [((8,), "b"), ((7,), "a")]
+        self.assertEqual([job[0] for job, _ in tournament.in_match_order(games, 7)], [7, 8])
+
+
+class MatchRunnerTest(unittest.TestCase):
+    def jobs(self):
+        random_player, strategic, bob = _players()
+        pairs = [(strategic, random_player), (random_player, bob), (bob, strategic)]
+        return [(i, blue, red, SEED + i, f"  Match {i}") for i, (blue, red) in enumerate(pairs, 1)]
+
+    def run_jobs(self, workers):
+        def run():
+            with tournament.MatchRunner(_players(), False, workers) as runner:
+                return {job[0]: result for job, result in runner.run(self.jobs())}
+
+        return _quiet(run)
+
+    def test_pool_results_match_sequential_results(self):
+        sequential = self.run_jobs(1)
+        self.assertEqual(set(sequential), {1, 2, 3})
+        self.assertEqual(self.run_jobs(2), sequential)
+
+    def test_round_robin_final_standings_do_not_depend_on_workers(self):
+        finals = []
+        with (
+            tempfile.TemporaryDirectory() as tmp,
+            mock.patch.object(tournament, "TOURNAMENT_SEED", SEED),
+        ):
+            for workers in (1, 2):
+                log = Path(tmp) / f"rr{workers}.jsonl"
+                _quiet(
+                    tournament.run_round_robin_tournament,
+                    _players(),
+                    matches_per_pair=2,
+                    window=False,
+                    workers=workers,
+                    cache=None,
+                    log=str(log),
+                )
+                records = [json.loads(line) for line in log.read_text().splitlines()]
+                finals.append([record for record in records if record["type"] == "final"])
+                match_ids = [record["match_id"] for record in records if record["type"] == "match"]
+                self.assertEqual(match_ids, sorted(match_ids))
+        self.assertEqual(finals[0], finals[1])
+
+
+if __name__ == "__main__":
+    unittest.main()